@@ -1,12 +1,30 @@
-import types
-
 from importlib import import_module
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from .base.model.pool_config import PoolConfig
+from .base.query_cache import CacheStats, QueryCache
+from .base.retry import RetryBudget, RetryPolicy
 from .base.walacor_service import WalacorService
+from .utils.codec import JsonCodec, OrjsonCodec
+
+_SUBMODULES: tuple[str, ...] = (
+    "authentication",
+    "schema",
+    "file_request",
+    "data_requests",
+    "utils",
+)
 
 __all__: list[str] = [
     "WalacorService",
+    "AsyncWalacorService",
+    "PoolConfig",
+    "RetryPolicy",
+    "RetryBudget",
+    "QueryCache",
+    "CacheStats",
+    "JsonCodec",
+    "OrjsonCodec",
     "authentication",
     "schema",
     "file_request",
@@ -15,8 +33,14 @@ __all__: list[str] = [
 ]
 
 
-def __getattr__(name: str) -> types.ModuleType:
-    if name in __all__[1:]:
+def __getattr__(name: str) -> Any:
+    if name == "AsyncWalacorService":
+        # Imported lazily: the async stack needs the optional ``httpx`` extra.
+        from .base.async_walacor_service import AsyncWalacorService
+
+        globals()[name] = AsyncWalacorService
+        return AsyncWalacorService
+    if name in _SUBMODULES:
         mod = import_module(f"{__name__}.{name}")
         globals()[name] = mod
         return mod
@@ -25,3 +49,4 @@ def __getattr__(name: str) -> types.ModuleType:
 
 if TYPE_CHECKING:  # pragma: no cover
     from . import authentication, data_requests, file_request, schema, utils
+    from .base.async_walacor_service import AsyncWalacorService
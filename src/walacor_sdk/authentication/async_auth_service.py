@@ -0,0 +1,10 @@
+from walacor_sdk.base.async_base_service import AsyncBaseService
+from walacor_sdk.base.async_w_client import AsyncW_Client
+
+
+class AsyncAuthService(AsyncBaseService):
+    def __init__(self, client: AsyncW_Client) -> None:
+        super().__init__(client)
+
+    async def login(self) -> None:
+        await self.client.authenticate()
@@ -0,0 +1,80 @@
+from abc import ABC
+from typing import Any, TypeVar
+
+from walacor_sdk.base.async_w_client import AsyncW_Client
+from walacor_sdk.base.model.json_response import JsonResponse, validate_response
+from walacor_sdk.utils.async_exception_handler import async_global_exception_handler
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+from walacor_sdk.utils.enums import RequestType
+
+M = TypeVar("M")
+
+
+class AsyncBaseService(ABC):
+    def __init__(self, client: AsyncW_Client) -> None:
+        self.client = client
+
+    @async_global_exception_handler
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        parse_json: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Internal coroutine to send API requests with optional custom headers."""
+        response = await self.client.request(
+            method, endpoint, headers=headers, **kwargs
+        )
+
+        if parse_json:
+            content = getattr(response, "content", None)
+            if isinstance(content, bytes | bytearray):
+                return JsonResponse(bytes(content), self._codec())
+            return response.json()
+        return response
+
+    def _codec(self) -> JsonCodec:
+        codec = getattr(self.client, "codec", None)
+        return codec if isinstance(codec, JsonCodec) else get_codec()
+
+    def _parse(self, model: type[M], response: Any) -> M:
+        """Validate a ``_request`` result as *model*.
+
+        Raw bodies are validated straight from bytes by the model's cached
+        :class:`~pydantic.TypeAdapter`; decoded ones go through the model.
+        """
+        return validate_response(model, response)
+
+    async def _get(
+        self, endpoint: str, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Any:
+        """Send a GET request with optional custom headers."""
+        return await self._request(RequestType.GET, endpoint, headers=headers, **kwargs)
+
+    async def _post(
+        self,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        parse_json: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a POST request with optional custom headers."""
+        return await self._request(
+            RequestType.POST, endpoint, headers=headers, parse_json=parse_json, **kwargs
+        )
+
+    async def _put(
+        self, endpoint: str, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Any:
+        """Send a PUT request with optional custom headers."""
+        return await self._request(RequestType.PUT, endpoint, headers=headers, **kwargs)
+
+    async def _delete(
+        self, endpoint: str, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Any:
+        """Send a DELETE request with optional custom headers."""
+        return await self._request(
+            RequestType.DELETE, endpoint, headers=headers, **kwargs
+        )
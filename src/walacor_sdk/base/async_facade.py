@@ -0,0 +1,63 @@
+from walacor_sdk.authentication.async_auth_service import AsyncAuthService
+from walacor_sdk.base.async_w_client import AsyncW_Client
+from walacor_sdk.data_requests.async_data_requests_service import (
+    AsyncDataRequestsService,
+)
+from walacor_sdk.file_request.async_file_request_service import (
+    AsyncFileRequestService,
+)
+from walacor_sdk.schema.async_schema_service import AsyncSchemaService
+
+
+class AsyncFacade:
+    def __init__(
+        self,
+        client: AsyncW_Client,
+        auth_service_cls: type[AsyncAuthService] = AsyncAuthService,
+        schema_service_cls: type[AsyncSchemaService] = AsyncSchemaService,
+        file_request_service_cls: type[
+            AsyncFileRequestService
+        ] = AsyncFileRequestService,
+        data_requests_service_cls: type[
+            AsyncDataRequestsService
+        ] = AsyncDataRequestsService,
+    ) -> None:
+        self._client: AsyncW_Client = client
+
+        self._auth: AsyncAuthService | None = None
+        self._schema: AsyncSchemaService | None = None
+        self._file_request: AsyncFileRequestService | None = None
+        self._data_requests: AsyncDataRequestsService | None = None
+
+        self.auth_service_cls: type[AsyncAuthService] = auth_service_cls
+        self.schema_service_cls: type[AsyncSchemaService] = schema_service_cls
+        self.file_request_service_cls: type[AsyncFileRequestService] = (
+            file_request_service_cls
+        )
+        self.data_requests_service_cls: type[AsyncDataRequestsService] = (
+            data_requests_service_cls
+        )
+
+    @property
+    def auth(self) -> AsyncAuthService:
+        if self._auth is None:
+            self._auth = self.auth_service_cls(self._client)
+        return self._auth
+
+    @property
+    def schema(self) -> AsyncSchemaService:
+        if self._schema is None:
+            self._schema = self.schema_service_cls(self._client)
+        return self._schema
+
+    @property
+    def file_request(self) -> AsyncFileRequestService:
+        if self._file_request is None:
+            self._file_request = self.file_request_service_cls(self._client)
+        return self._file_request
+
+    @property
+    def data_requests(self) -> AsyncDataRequestsService:
+        if self._data_requests is None:
+            self._data_requests = self.data_requests_service_cls(self._client)
+        return self._data_requests
@@ -0,0 +1,354 @@
+import asyncio
+import time
+
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from walacor_sdk.base.model.pool_config import PoolConfig
+from walacor_sdk.base.query_cache import QueryCache
+from walacor_sdk.base.retry import RetryPolicy
+from walacor_sdk.utils.async_exception_handler import async_global_exception_handler
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+from walacor_sdk.utils.exceptions import APIConnectionError
+from walacor_sdk.utils.logger import get_logger
+from walacor_sdk.utils.token import refresh_deadline, token_expiry
+
+logger = get_logger(__name__)
+
+
+class AsyncW_Client:
+    """``asyncio`` counterpart of :class:`~walacor_sdk.base.w_client.W_Client`.
+
+    All coroutines share one ``httpx.AsyncClient`` so thousands of in-flight
+    requests reuse the same keep-alive pool on a single event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        pool: PoolConfig | None = None,
+        refresh_margin: float = 60.0,
+        auto_refresh: bool = True,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        self._base_url: str = base_url
+        self._username: str = username
+        self._password: str = password
+        self._token: str | None = None
+
+        # Same token lifecycle as W_Client, coordinated on the event loop.
+        self._auth_lock: asyncio.Lock | None = None
+        self._refresh_at: float | None = None
+        self._refresh_margin: float = refresh_margin
+        self._auto_refresh: bool = auto_refresh
+        self._refresh_task: asyncio.Task[None] | None = None
+
+        self._retry: RetryPolicy = retry or RetryPolicy()
+        # Opt-in read cache shared by the services built on this client.
+        self.query_cache: QueryCache | None = cache
+        self._codec: JsonCodec | None = codec
+        self._pool: PoolConfig = pool or PoolConfig()
+        self._http: httpx.AsyncClient = self._build_http()
+
+    def _build_http(self) -> httpx.AsyncClient:
+        """Create the pooled ``httpx`` client from :class:`PoolConfig`.
+
+        ``httpx`` limits connections per client rather than per host, so the
+        per-host size is multiplied by the number of pools when blocking.
+        """
+        keepalive = self._pool.pool_maxsize if self._pool.keep_alive else 0
+        limits = httpx.Limits(
+            max_connections=(
+                self._pool.pool_maxsize * self._pool.pool_connections
+                if self._pool.pool_block
+                else None
+            ),
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=self._pool.max_idle,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=None)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled ``httpx.AsyncClient`` shared by every call of this client."""
+        return self._http
+
+    @property
+    def codec(self) -> JsonCodec:
+        """JSON codec for request and response bodies (process default if unset)."""
+        return self._codec or get_codec()
+
+    @codec.setter
+    def codec(self, codec: JsonCodec | None) -> None:
+        self._codec = codec
+
+    @property
+    def pool(self) -> PoolConfig:
+        """Connection-pool settings in use (read-only)."""
+        return self._pool
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy applied by :meth:`request`."""
+        return self._retry
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy) -> None:
+        self._retry = policy
+
+    @property
+    def base_url(self) -> str:
+        """Return the current base URL (read-only)."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, new_url: str) -> None:
+        """Update the base URL; sockets to the old host expire after ``max_idle``."""
+        if new_url != self._base_url and self.query_cache is not None:
+            self.query_cache.clear()
+        self._base_url = new_url
+
+    def update_credentials(self, username: str, password: str) -> None:
+        """Swap credentials; the next request logs in again on the same pool."""
+        self._cancel_refresh()
+        self._username = username
+        self._password = password
+        self._token = None
+        self._refresh_at = None
+        if self.query_cache is not None:
+            self.query_cache.clear()
+
+    async def aclose(self) -> None:
+        """Release every pooled socket and stop the background token refresh."""
+        self._cancel_refresh()
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncW_Client":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @async_global_exception_handler
+    async def authenticate(self) -> None:
+        async with self._lock():
+            await self._login()
+
+    async def ensure_token(self) -> str:
+        """Return a usable token, logging in first if it is missing or expiring."""
+        token = self._token
+        if token is None or self._expires_soon():
+            await self._refresh_token(stale=token)
+            token = self._token
+
+        if token is None:
+            raise APIConnectionError("No token available for authenticated request.")
+        return token
+
+    @async_global_exception_handler
+    async def _refresh_token(self, stale: str | None) -> None:
+        """Single-flight refresh: only the first coroutine holding *stale* logs in."""
+        async with self._lock():
+            if self._token is not None and self._token != stale:
+                return
+            await self._login()
+
+    def _lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the loop that first uses it.
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        return self._auth_lock
+
+    async def _login(self) -> None:
+        """POST ``auth/login``; must be awaited with the auth lock held."""
+        response = await self._http.post(
+            f"{self._base_url}/auth/login",
+            json={"userName": self._username, "password": self._password},
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        response.raise_for_status()
+        self._token = response.json().get("api_token")
+        if not self._token:
+            raise APIConnectionError("Authentication succeeded but no token returned.")
+
+        self._refresh_at = refresh_deadline(
+            token_expiry(self._token), self._refresh_margin, time.time()
+        )
+        self._schedule_refresh()
+
+    def _expires_soon(self) -> bool:
+        refresh_at = self._refresh_at
+        return refresh_at is not None and time.time() >= refresh_at
+
+    def _schedule_refresh(self) -> None:
+        self._cancel_refresh()
+        if not self._auto_refresh or self._refresh_at is None:
+            return
+
+        delay = max(self._refresh_at - time.time(), 0.0)
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._background_refresh(delay, self._token)
+        )
+
+    def _cancel_refresh(self) -> None:
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _background_refresh(self, delay: float, stale: str | None) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._refresh_token(stale=stale)
+        except Exception:
+            # The hot path will retry the login inline on next use.
+            logger.warning("Background token refresh failed", exc_info=True)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+        retry: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one request; ``stream=True`` leaves the body unread.
+
+        Streamed responses must be closed by the caller with ``aclose()``.
+        ``retry`` overrides :attr:`retry_policy` for this call only.
+        """
+        token = await self.ensure_token()
+        repeatable = self._retry.is_repeatable(method, endpoint, retry, **kwargs)
+
+        is_file_upload = "files" in kwargs and kwargs["files"] is not None
+        content_type = None if is_file_upload else "application/json"
+
+        request_headers = self.get_default_headers(content_type)
+        request_headers["Authorization"] = token
+
+        if headers:
+            request_headers.update(headers)
+
+        # Encode once up front so retries resend the same bytes.
+        if "json" in kwargs:
+            payload = kwargs.pop("json")
+            if payload is not None:
+                kwargs["content"] = self.codec.dumps(payload)
+
+        response = await self._send(
+            method,
+            endpoint,
+            request_headers,
+            stream=stream,
+            repeatable=repeatable,
+            **kwargs,
+        )
+
+        if response.status_code == 401:
+            await response.aclose()
+            await self._refresh_token(stale=token)
+
+            if self._token is None:
+                raise APIConnectionError(
+                    "No token available for authenticated request."
+                )
+            request_headers["Authorization"] = self._token
+
+            response = await self._send(
+                method,
+                endpoint,
+                request_headers,
+                stream=stream,
+                repeatable=repeatable,
+                **kwargs,
+            )
+
+        if response.status_code == 422:
+            return response
+
+        if response.is_error and stream:
+            await response.aread()
+        response.raise_for_status()
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        stream: bool,
+        repeatable: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send with backoff on transport errors and retryable statuses."""
+        policy = self._retry
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+        attempt = 1
+        while True:
+            request = self._http.build_request(
+                method, f"{self._base_url}/{endpoint}", headers=headers, **kwargs
+            )
+            try:
+                response = await self._http.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                delay = policy.delay_for(attempt, None, None) if repeatable else None
+                if delay is None:
+                    raise
+                logger.warning(
+                    "Retrying %s %s in %.2fs (attempt %s): %s",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt,
+                    exc,
+                )
+            else:
+                if not repeatable or response.status_code not in policy.retry_statuses:
+                    return response
+                delay = policy.delay_for(
+                    attempt, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                logger.warning(
+                    "Retrying %s %s in %.2fs (attempt %s): HTTP %s",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt,
+                    response.status_code,
+                )
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def get_default_headers(
+        self, content_type: str | None = "application/json"
+    ) -> dict[str, str]:
+        headers = {}
+        if content_type is not None:
+            headers["Content-Type"] = content_type
+        if self._token:
+            headers["Authorization"] = self._token
+        return headers
+
+    @property
+    def token(self) -> str | None:
+        """Read-only property for the token, if needed externally."""
+        return self._token
@@ -0,0 +1,130 @@
+from types import TracebackType
+
+from walacor_sdk.authentication.async_auth_service import AsyncAuthService
+from walacor_sdk.base.async_facade import AsyncFacade
+from walacor_sdk.base.async_w_client import AsyncW_Client
+from walacor_sdk.base.model.pool_config import PoolConfig
+from walacor_sdk.base.query_cache import QueryCache
+from walacor_sdk.base.retry import RetryPolicy
+from walacor_sdk.data_requests.async_data_requests_service import (
+    AsyncDataRequestsService,
+)
+from walacor_sdk.file_request.async_file_request_service import (
+    AsyncFileRequestService,
+)
+from walacor_sdk.schema.async_schema_service import AsyncSchemaService
+from walacor_sdk.utils.codec import JsonCodec
+
+
+class AsyncWalacorService:
+    """
+    ``asyncio`` entry point mirroring :class:`WalacorService`.
+
+    Every service method is a coroutine; all of them share one pooled
+    :class:`AsyncW_Client`, so use it as ``async with AsyncWalacorService(...)``
+    or call :meth:`aclose` when done.
+    """
+
+    def __init__(
+        self,
+        server: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        pool: PoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        self._client: AsyncW_Client | None = None
+        self._facade: AsyncFacade | None = None
+        self._pool: PoolConfig | None = pool
+        self._retry: RetryPolicy | None = retry
+        self._cache: QueryCache | None = cache
+        self._codec: JsonCodec | None = codec
+
+        if server and username and password:
+            self.setup(server, username, password)
+
+    def setup(self, server: str, username: str, password: str) -> None:
+        """Initial setup; an existing client is kept and re-pointed."""
+        if self._client:
+            self._client.base_url = server
+            self._client.update_credentials(username, password)
+        else:
+            self._client = AsyncW_Client(
+                server,
+                username,
+                password,
+                pool=self._pool,
+                retry=self._retry,
+                cache=self._cache,
+                codec=self._codec,
+            )
+        self._facade = AsyncFacade(self._client)
+
+    def changeServer(self, new_server: str) -> None:
+        """Change only the server URL, keep the same credentials."""
+        if not self._client:
+            raise ValueError("Client not initialized. Call setup() first.")
+        self._client.base_url = new_server
+        self._facade = AsyncFacade(self._client)
+
+    def changeCred(self, new_username: str, new_password: str) -> None:
+        """Change only the username/password, keep the same server."""
+        if not self._client:
+            raise ValueError("Client not initialized. Call setup() first.")
+        self._client.update_credentials(new_username, new_password)
+        self._facade = AsyncFacade(self._client)
+
+    def changeAll(self, server: str, username: str, password: str) -> None:
+        """Change both server and credentials in one call."""
+        self.setup(server, username, password)
+
+    async def aclose(self) -> None:
+        """Release the pooled connections held by the underlying client."""
+        if self._client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncWalacorService":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @property
+    def cache(self) -> QueryCache | None:
+        """Read cache shared by the services, if one was configured."""
+        return self._cache
+
+    @property
+    def auth(self) -> AsyncAuthService:
+        """Expose AsyncAuthService under AsyncWalacorService.auth"""
+        if not self._facade:
+            raise ValueError("Service not set up. Call setup() first.")
+        return self._facade.auth
+
+    @property
+    def schema(self) -> AsyncSchemaService:
+        """Expose AsyncSchemaService under AsyncWalacorService.schema"""
+        if not self._facade:
+            raise ValueError("Service not set up. Call setup() first.")
+        return self._facade.schema
+
+    @property
+    def file_request(self) -> AsyncFileRequestService:
+        """Expose AsyncFileRequestService under AsyncWalacorService.file_request"""
+        if not self._facade:
+            raise ValueError("Service not set up. Call setup() first.")
+        return self._facade.file_request
+
+    @property
+    def data_requests(self) -> AsyncDataRequestsService:
+        """Expose AsyncDataRequestsService under AsyncWalacorService.data_requests"""
+        if not self._facade:
+            raise ValueError("Service not set up. Call setup() first.")
+        return self._facade.data_requests
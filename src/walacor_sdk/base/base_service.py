@@ -1,10 +1,14 @@
 from abc import ABC
-from typing import Any
+from typing import Any, TypeVar
 
+from walacor_sdk.base.model.json_response import JsonResponse, validate_response
 from walacor_sdk.base.w_client import W_Client
+from walacor_sdk.utils.codec import JsonCodec, get_codec
 from walacor_sdk.utils.enums import RequestType
 from walacor_sdk.utils.global_exception_handler import global_exception_handler
 
+M = TypeVar("M")
+
 
 class BaseService(ABC):
     def __init__(self, client: W_Client) -> None:
@@ -23,9 +27,24 @@ class BaseService(ABC):
         response = self.client.request(method, endpoint, headers=headers, **kwargs)
 
         if parse_json:
+            content = getattr(response, "content", None)
+            if isinstance(content, bytes | bytearray):
+                return JsonResponse(bytes(content), self._codec())
             return response.json()
         return response
 
+    def _codec(self) -> JsonCodec:
+        codec = getattr(self.client, "codec", None)
+        return codec if isinstance(codec, JsonCodec) else get_codec()
+
+    def _parse(self, model: type[M], response: Any) -> M:
+        """Validate a ``_request`` result as *model*.
+
+        Raw bodies are validated straight from bytes by the model's cached
+        :class:`~pydantic.TypeAdapter`; decoded ones go through the model.
+        """
+        return validate_response(model, response)
+
     def _get(
         self, endpoint: str, headers: dict[str, str] | None = None, **kwargs: Any
     ) -> Any:
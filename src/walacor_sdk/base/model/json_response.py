@@ -0,0 +1,102 @@
+import re
+
+from collections.abc import Iterator, Mapping
+from functools import cache
+from typing import Any, TypeVar, cast
+
+from pydantic import TypeAdapter
+
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+
+M = TypeVar("M")
+
+_UNSET: Any = object()
+
+
+# ``success`` as the first key of the top-level object, the envelope's usual shape.
+_LEADING_SUCCESS = re.compile(
+    rb'\A[ \t\n\r]*\{[ \t\n\r]*"success"[ \t\n\r]*:[ \t\n\r]*(true|false)'
+)
+
+
+@cache
+def response_adapter(model: Any) -> TypeAdapter[Any]:
+    """Compiled :class:`~pydantic.TypeAdapter` for *model*, built once per process."""
+    return TypeAdapter(model)
+
+
+class JsonResponse(Mapping[str, Any]):
+    """A JSON response body that is decoded only when needed.
+
+    Services receive this from ``_request`` and hand it to ``_parse``, which
+    validates the raw bytes straight into the response model – one parse,
+    no intermediate ``dict`` tree. Item access still works like the decoded
+    ``dict`` (decoding once on first use). ``get("success")`` reads the flag
+    from the leading bytes when it is the first key, so the body is still
+    parsed only once, by ``_parse``; otherwise it decodes (and caches) the
+    body, which ``_parse`` then reuses.
+    """
+
+    __slots__ = ("content", "codec", "_decoded")
+
+    def __init__(self, content: bytes, codec: JsonCodec | None = None) -> None:
+        self.content = content
+        self.codec = codec or get_codec()
+        self._decoded: Any = _UNSET
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the body has already been turned into Python objects."""
+        return self._decoded is not _UNSET
+
+    def json(self) -> Any:
+        """The decoded body (cached)."""
+        if self._decoded is _UNSET:
+            self._decoded = self.codec.loads(self.content)
+        return self._decoded
+
+    def _mapping(self) -> Mapping[str, Any]:
+        body = self.json()
+        if not isinstance(body, Mapping):
+            raise TypeError(f"JSON body is a {type(body).__name__}, not an object")
+        return body
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "success" and not self.decoded:
+            match = _LEADING_SUCCESS.match(self.content)
+            if match:
+                return match.group(1) == b"true"
+        return self._mapping().get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._mapping()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapping())
+
+    def __len__(self) -> int:
+        return len(self._mapping())
+
+    def __bool__(self) -> bool:
+        if self.decoded:
+            return bool(self._decoded)
+        return self.content.strip() not in (b"", b"{}", b"null")
+
+    def __repr__(self) -> str:
+        return f"JsonResponse({len(self.content)} bytes)"
+
+
+def validate_response(model: type[M], response: Any) -> M:
+    """Validate a response body as *model*.
+
+    Undecoded :class:`JsonResponse` bodies are validated from bytes with the
+    model's cached adapter; anything already decoded goes through the model
+    like before.
+    """
+    if isinstance(response, JsonResponse):
+        if not response.decoded:
+            return cast(
+                M, response_adapter(cast(Any, model)).validate_json(response.content)
+            )
+        response = response.json()
+    return model(**response)
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+
+
+class PoolConfig(BaseModel):
+    """Connection-pool settings for the HTTP session owned by ``W_Client``.
+
+    Attributes:
+        pool_connections: Number of per-host pools kept alive at once.
+        pool_maxsize: Maximum sockets kept open **per host**.
+        pool_block: When *True* callers wait for a free socket instead of
+            opening connections beyond ``pool_maxsize``.
+        keep_alive: Reuse sockets between calls; *False* sends
+            ``Connection: close`` on every request.
+        max_idle: Seconds a pool may sit unused before its sockets are
+            dropped; ``None`` keeps them open indefinitely.
+    """
+
+    pool_connections: int = Field(default=10, ge=1)
+    pool_maxsize: int = Field(default=10, ge=1)
+    pool_block: bool = False
+    keep_alive: bool = True
+    max_idle: float | None = Field(default=60.0, gt=0)
@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry(NamedTuple):
+    body: bytes
+    ETId: int
+    expires: float | None
+
+
+def cache_key(
+    endpoint: str,
+    ETId: int,
+    headers: Mapping[str, str] | None = None,
+    payload: Any = None,
+) -> str:
+    """Canonical key of a read request.
+
+    The endpoint carries paging and flags in its query string; headers (``SV``,
+    ``DV`` …) and the JSON payload are serialized with sorted keys so that
+    equivalent pipelines share one entry.
+    """
+    return json.dumps(
+        [endpoint, ETId, sorted((headers or {}).items()), payload],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+class QueryCache:
+    """Thread-safe LRU cache of raw query response bodies.
+
+    Entries expire ``ttl`` seconds after they are stored (``None`` keeps them
+    until evicted) and the least recently used ones are dropped once
+    ``max_entries`` or ``max_bytes`` is exceeded. Bodies larger than
+    ``max_bytes`` are not cached at all. Bodies are kept as the bytes
+    received, so every hit decodes fresh objects the caller may mutate.
+
+    Entries are tagged with the ETId of the request: a submit through the same
+    client calls :meth:`invalidate` for that ETId. Pipelines that ``$lookup``
+    other tables are only refreshed by the TTL when those tables change.
+
+    Every invalidation also bumps the ETId's :meth:`generation`. A read takes
+    the generation before its request and passes it to :meth:`set`, which
+    drops the body if a submit invalidated the ETId meanwhile – otherwise a
+    read started before the write could cache pre-write data.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float | None = 60.0,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0  # bumped when everything is invalidated
+        self._generations: dict[int, int] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached body for *key*, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.expires is None or entry.expires > time.monotonic()
+            ):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry.body
+            if entry is not None:
+                self._drop(key)
+            self._stats.misses += 1
+            return None
+
+    def generation(self, ETId: int) -> int:
+        """Counter of *ETId*'s invalidations, taken before a read is sent."""
+        with self._lock:
+            return self._current(ETId)
+
+    def set(
+        self,
+        key: str,
+        ETId: int,
+        body: bytes,
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store *body*; ``ttl`` overrides the cache default for this entry.
+
+        With ``generation`` (see :meth:`generation`) the body is only stored
+        if *ETId* has not been invalidated since it was taken.
+        """
+        if len(body) > self.max_bytes:
+            return
+        lifetime = self.ttl if ttl is None else ttl
+        expires = None if lifetime is None else time.monotonic() + lifetime
+
+        with self._lock:
+            if generation is not None and generation != self._current(ETId):
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(body, ETId, expires)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def invalidate(self, ETId: int | None = None) -> int:
+        """Drop every entry for *ETId* (all entries if ``None``); returns the count."""
+        with self._lock:
+            if ETId is None:
+                self._generation += 1
+            else:
+                self._generations[ETId] = self._generations.get(ETId, 0) + 1
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if ETId is None or entry.ETId == ETId
+            ]
+            for key in keys:
+                self._drop(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry; statistics are kept."""
+        self.invalidate()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of hit/miss/eviction counters and current size."""
+        with self._lock:
+            return self._stats.model_copy(
+                update={"entries": len(self._entries), "bytes": self._bytes}
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _current(self, ETId: int) -> int:
+        return self._generation + self._generations.get(ETId, 0)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
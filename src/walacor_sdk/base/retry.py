@@ -0,0 +1,177 @@
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from walacor_sdk.utils.enums import RequestType
+
+SUBMIT_ENDPOINT = "envelopes/submit"
+
+
+class RetryBudget:
+    """Token bucket that caps retries relative to normal traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so retries can never exceed roughly ``ratio`` of the request rate.
+    ``min_per_second`` tokens trickle in regardless so a quiet process can
+    still retry the occasional blip. The bucket is thread-safe and is meant
+    to be shared: :data:`DEFAULT_RETRY_BUDGET` is used process-wide unless a
+    policy is given its own.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens: float = max_tokens
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(
+            self.max_tokens, self._tokens + elapsed * self.min_per_second
+        )
+
+    def deposit(self) -> None:
+        """Record one first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take the allowance for one retry; *False* when the budget is spent."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryPolicy(BaseModel):
+    """When and how ``W_Client.request`` repeats a failed call.
+
+    Attributes:
+        max_attempts: Total tries per call, including the first. ``1``
+            disables retries.
+        backoff_factor: Base delay in seconds; attempt *n* waits up to
+            ``backoff_factor * 2 ** (n - 1)``.
+        backoff_max: Upper bound for a single backoff delay.
+        jitter: Draw the delay uniformly from ``[0, backoff]`` ("full
+            jitter") so clients do not retry in lockstep.
+        retry_statuses: HTTP statuses that are retried.
+        respect_retry_after: Honour ``Retry-After`` on 429/503 responses.
+        retry_after_max: Longest ``Retry-After`` that is waited out; longer
+            values fail the call instead.
+        safe_post_prefixes: POST endpoints that only read and can be
+            repeated (queries). Other POSTs are never retried.
+        retry_submit: Opt in to retrying ``envelopes/submit``. Only enable
+            this when duplicate envelopes are acceptable.
+        budget: Shared :class:`RetryBudget`; ``None`` removes the cap.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_factor: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=30.0, ge=0)
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    retry_after_max: float = Field(default=120.0, ge=0)
+    safe_post_prefixes: tuple[str, ...] = ("query/",)
+    retry_submit: bool = False
+    budget: RetryBudget | None = DEFAULT_RETRY_BUDGET
+
+    def is_repeatable(
+        self, method: str, endpoint: str, override: bool | None = None, **kwargs: Any
+    ) -> bool:
+        """Whether a call may be sent again after a failure.
+
+        ``override`` is the per-call ``retry=`` argument; *None* defers to
+        the policy. Multipart uploads are never repeated because their file
+        handles cannot be rewound reliably.
+        """
+        if self.max_attempts <= 1 or kwargs.get("files") is not None:
+            return False
+        if override is not None:
+            return override
+
+        path = endpoint.lstrip("/")
+        if path.startswith(SUBMIT_ENDPOINT):
+            return self.retry_submit
+
+        verb = str(getattr(method, "value", method)).upper()
+        if verb == RequestType.POST.value:
+            return path.startswith(self.safe_post_prefixes)
+        return verb in {
+            RequestType.GET.value,
+            RequestType.PUT.value,
+            RequestType.DELETE.value,
+        }
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number *attempt* (1-based)."""
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry_after(self, status: int, headers: Any) -> float | None:
+        """Seconds requested by a ``Retry-After`` header, if it applies."""
+        if not self.respect_retry_after or status not in (429, 503):
+            return None
+
+        value: str | None = headers.get("Retry-After") if headers is not None else None
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(when.timestamp() - time.time(), 0.0)
+
+    def delay_for(self, attempt: int, status: int | None, headers: Any) -> float | None:
+        """Delay before the next attempt, or ``None`` when the call must fail.
+
+        Spends from :attr:`budget`; returns ``None`` if the budget is empty,
+        attempts are exhausted or ``Retry-After`` asks for too long a wait.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if status is not None:
+            requested = self.retry_after(status, headers)
+            if requested is not None:
+                if requested > self.retry_after_max:
+                    return None
+                delay = requested
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return delay
@@ -1,9 +1,24 @@
+import threading
+import time
+import weakref
+
+from types import TracebackType
 from typing import Any
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
+from walacor_sdk.base.model.pool_config import PoolConfig
+from walacor_sdk.base.query_cache import QueryCache
+from walacor_sdk.base.retry import RetryPolicy
+from walacor_sdk.utils.codec import JsonCodec, get_codec
 from walacor_sdk.utils.exceptions import APIConnectionError
 from walacor_sdk.utils.global_exception_handler import global_exception_handler
+from walacor_sdk.utils.logger import get_logger
+from walacor_sdk.utils.token import refresh_deadline, token_expiry
+
+logger = get_logger(__name__)
 
 
 class AuthenticationError(Exception):
@@ -11,12 +26,104 @@ class AuthenticationError(Exception):
 
 
 class W_Client:
-    def __init__(self, base_url: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        pool: PoolConfig | None = None,
+        refresh_margin: float = 60.0,
+        auto_refresh: bool = True,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JsonCodec | None = None,
+    ) -> None:
         self._base_url: str = base_url
         self._username: str = username
         self._password: str = password
         self._token: str | None = None
 
+        # Token lifecycle: one login at a time, refreshed ``refresh_margin``
+        # seconds (at most half the token lifetime) before the JWT ``exp``
+        # claim, in the background if enabled; see ``refresh_deadline``.
+        self._auth_lock = threading.Lock()
+        self._refresh_at: float | None = None
+        self._refresh_margin: float = refresh_margin
+        self._auto_refresh: bool = auto_refresh
+        self._refresh_timer: threading.Timer | None = None
+
+        self._retry: RetryPolicy = retry or RetryPolicy()
+        # Opt-in read cache shared by the services built on this client.
+        self.query_cache: QueryCache | None = cache
+        self._codec: JsonCodec | None = codec
+        self._pool: PoolConfig = pool or PoolConfig()
+        self._session: requests.Session = self._build_session()
+        self._last_used: float = time.monotonic()
+
+    def _build_session(self) -> requests.Session:
+        """Create the pooled session shared by every call of this client."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool.pool_connections,
+            pool_maxsize=self._pool.pool_maxsize,
+            pool_block=self._pool.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self._pool.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled session; sockets idle longer than ``max_idle`` are dropped."""
+        now = time.monotonic()
+        max_idle = self._pool.max_idle
+        if max_idle is not None and now - self._last_used > max_idle:
+            # Adapters stay mounted and reopen sockets on demand.
+            self._session.close()
+        self._last_used = now
+        return self._session
+
+    @property
+    def codec(self) -> JsonCodec:
+        """JSON codec for request and response bodies (process default if unset)."""
+        return self._codec or get_codec()
+
+    @codec.setter
+    def codec(self, codec: JsonCodec | None) -> None:
+        self._codec = codec
+
+    @property
+    def pool(self) -> PoolConfig:
+        """Connection-pool settings in use (read-only)."""
+        return self._pool
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy applied by :meth:`request`."""
+        return self._retry
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy) -> None:
+        self._retry = policy
+
+    def close(self) -> None:
+        """Release every pooled socket and stop the background token refresh."""
+        self._cancel_refresh()
+        self._session.close()
+
+    def __enter__(self) -> "W_Client":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     @property
     def base_url(self) -> str:
         """Return the current base URL (read-only)."""
@@ -24,12 +131,55 @@ class W_Client:
 
     @base_url.setter
     def base_url(self, new_url: str) -> None:
-        """Update the base URL."""
+        """Update the base URL, dropping sockets open to the previous host."""
+        if new_url != self._base_url:
+            self._session.close()
+            if self.query_cache is not None:
+                self.query_cache.clear()
         self._base_url = new_url
 
+    def update_credentials(self, username: str, password: str) -> None:
+        """Swap credentials; the next request logs in again on the same pool."""
+        with self._auth_lock:
+            self._cancel_refresh()
+            self._username = username
+            self._password = password
+            self._token = None
+            self._refresh_at = None
+            if self.query_cache is not None:
+                self.query_cache.clear()
+
     @global_exception_handler
     def authenticate(self) -> None:
-        response = requests.post(
+        with self._auth_lock:
+            self._login()
+
+    def ensure_token(self) -> str:
+        """Return a usable token, logging in first if it is missing or expiring."""
+        token = self._token
+        if token is None or self._expires_soon():
+            self._refresh_token(stale=token)
+            token = self._token
+
+        if token is None:
+            raise APIConnectionError("No token available for authenticated request.")
+        return token
+
+    @global_exception_handler
+    def _refresh_token(self, stale: str | None) -> None:
+        """Single-flight refresh: only the first caller holding *stale* logs in.
+
+        Callers that were waiting on the lock find a different token already
+        in place and reuse it instead of issuing their own login.
+        """
+        with self._auth_lock:
+            if self._token is not None and self._token != stale:
+                return
+            self._login()
+
+    def _login(self) -> None:
+        """POST ``auth/login``; must be called with ``_auth_lock`` held."""
+        response = self.session.post(
             f"{self._base_url}/auth/login",
             json={"userName": self._username, "password": self._password},
             headers={"Content-Type": "application/json"},
@@ -40,33 +190,82 @@ class W_Client:
         if not self._token:
             raise APIConnectionError("Authentication succeeded but no token returned.")
 
+        self._refresh_at = refresh_deadline(
+            token_expiry(self._token), self._refresh_margin, time.time()
+        )
+        self._schedule_refresh()
+
+    def _expires_soon(self) -> bool:
+        refresh_at = self._refresh_at
+        return refresh_at is not None and time.time() >= refresh_at
+
+    def _schedule_refresh(self) -> None:
+        self._cancel_refresh()
+        if not self._auto_refresh or self._refresh_at is None:
+            return
+
+        delay = max(self._refresh_at - time.time(), 0.0)
+        # A weak reference lets an abandoned client be collected before it fires.
+        timer = threading.Timer(
+            delay, W_Client._background_refresh, args=(weakref.ref(self), self._token)
+        )
+        timer.daemon = True
+        timer.start()
+        self._refresh_timer = timer
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    @staticmethod
+    def _background_refresh(ref: "weakref.ref[W_Client]", stale: str | None) -> None:
+        client = ref()
+        if client is None:
+            return
+        try:
+            client._refresh_token(stale=stale)
+        except Exception:
+            # The hot path will retry the login synchronously on next use.
+            logger.warning("Background token refresh failed", exc_info=True)
+
     def request(
         self,
         method: str,
         endpoint: str,
         headers: dict[str, str] | None = None,
+        retry: bool | None = None,
         **kwargs: Any,
     ) -> Any:
-        if not self._token:
-            self.authenticate()
+        """Send one authenticated request through the pooled session.
+
+        Transient failures are retried according to :attr:`retry_policy`;
+        ``retry`` forces (*True*) or forbids (*False*) retries for this call,
+        e.g. to opt an ``envelopes/submit`` in.
+        """
+        token = self.ensure_token()
+        repeatable = self._retry.is_repeatable(method, endpoint, retry, **kwargs)
 
         is_file_upload = "files" in kwargs and kwargs["files"] is not None
         content_type = None if is_file_upload else "application/json"
 
         request_headers = self.get_default_headers(content_type)
+        request_headers["Authorization"] = token
 
         if headers:
             request_headers.update(headers)
 
-        response = requests.request(
-            method,
-            f"{self._base_url}/{endpoint}",
-            headers=request_headers,
-            **kwargs,
-        )
+        # Encode once up front so retries resend the same bytes.
+        if "json" in kwargs:
+            payload = kwargs.pop("json")
+            if payload is not None:
+                kwargs["data"] = self.codec.dumps(payload)
+
+        response = self._send(method, endpoint, request_headers, repeatable, **kwargs)
 
         if response.status_code == 401:
-            self.authenticate()
+            response.close()
+            self._refresh_token(stale=token)
 
             if self._token is None:
                 raise APIConnectionError(
@@ -74,11 +273,8 @@ class W_Client:
                 )
             request_headers["Authorization"] = self._token
 
-            response = requests.request(
-                method,
-                f"{self._base_url}/{endpoint}",
-                headers=request_headers,
-                **kwargs,
+            response = self._send(
+                method, endpoint, request_headers, repeatable, **kwargs
             )
 
         if response.status_code == 422:
@@ -87,6 +283,61 @@ class W_Client:
         response.raise_for_status()
         return response
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        repeatable: bool,
+        **kwargs: Any,
+    ) -> Any:
+        """Send with backoff on connection errors and retryable statuses."""
+        policy = self._retry
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+        attempt = 1
+        while True:
+            try:
+                response = self.session.request(
+                    method,
+                    f"{self._base_url}/{endpoint}",
+                    headers=headers,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                delay = policy.delay_for(attempt, None, None) if repeatable else None
+                if delay is None:
+                    raise
+                logger.warning(
+                    "Retrying %s %s in %.2fs (attempt %s): %s",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt,
+                    exc,
+                )
+            else:
+                if not repeatable or response.status_code not in policy.retry_statuses:
+                    return response
+                delay = policy.delay_for(
+                    attempt, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                logger.warning(
+                    "Retrying %s %s in %.2fs (attempt %s): HTTP %s",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt,
+                    response.status_code,
+                )
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
     def get_default_headers(
         self, content_type: str | None = "application/json"
     ) -> dict[str, str]:
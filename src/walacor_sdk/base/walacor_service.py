@@ -1,9 +1,15 @@
+from types import TracebackType
+
 from walacor_sdk.authentication.auth_service import AuthService
 from walacor_sdk.base.facade import Facade
+from walacor_sdk.base.model.pool_config import PoolConfig
+from walacor_sdk.base.query_cache import QueryCache
+from walacor_sdk.base.retry import RetryPolicy
 from walacor_sdk.base.w_client import W_Client
 from walacor_sdk.data_requests.data_requests_service import DataRequestsService
 from walacor_sdk.file_request.file_request_service import FileRequestService
 from walacor_sdk.schema.schema_service import SchemaService
+from walacor_sdk.utils.codec import JsonCodec
 
 
 class WalacorService:
@@ -16,16 +22,34 @@ class WalacorService:
         server: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        pool: PoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        cache: QueryCache | None = None,
+        codec: JsonCodec | None = None,
     ) -> None:
         self._client: W_Client | None = None
         self._facade: Facade | None = None
+        self._pool: PoolConfig | None = pool
+        self._retry: RetryPolicy | None = retry
+        self._cache: QueryCache | None = cache
+        self._codec: JsonCodec | None = codec
 
         if server and username and password:
             self.setup(server, username, password)
 
     def setup(self, server: str, username: str, password: str) -> None:
         """Initial setup or re-setup if credentials / server change."""
-        self._client = W_Client(server, username, password)
+        if self._client:
+            self._client.close()
+        self._client = W_Client(
+            server,
+            username,
+            password,
+            pool=self._pool,
+            retry=self._retry,
+            cache=self._cache,
+            codec=self._codec,
+        )
         self._facade = Facade(self._client)
 
     def changeServer(self, new_server: str) -> None:
@@ -39,14 +63,34 @@ class WalacorService:
         """Change only the username/password, keep the same server."""
         if not self._client:
             raise ValueError("Client not initialized. Call setup() first.")
-        self._client._username = new_username
-        self._client._password = new_password
+        self._client.update_credentials(new_username, new_password)
         self._facade = Facade(self._client)
 
     def changeAll(self, server: str, username: str, password: str) -> None:
         """Change both server and credentials in one call."""
         self.setup(server, username, password)
 
+    def close(self) -> None:
+        """Release the pooled connections held by the underlying client."""
+        if self._client:
+            self._client.close()
+
+    def __enter__(self) -> "WalacorService":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def cache(self) -> QueryCache | None:
+        """Read cache shared by the services, if one was configured."""
+        return self._cache
+
     @property
     def auth(self) -> AuthService:
         """Expose AuthService under WalacorService.auth"""
@@ -3,15 +3,35 @@ import types
 from importlib import import_module
 from typing import TYPE_CHECKING
 
+from .columnar import ColumnarResult
+from .mirror import LocalMirror
 from .models.models import (
+    BulkSubmissionResult,
     ComplexQMLQueryRecords,
     ComplexQueryRecords,
+    FailedBatch,
+    MirrorStatus,
     QueryApiAggregate,
+    ResilientSubmissionResult,
+    RowError,
+    StreamSubmissionResult,
     SubmissionResult,
 )
+from .query_builder import QueryBuilder
+from .watermarks import WatermarkStore
 
 __all__: list[str] = [
     "SubmissionResult",
+    "BulkSubmissionResult",
+    "FailedBatch",
+    "RowError",
+    "StreamSubmissionResult",
+    "ResilientSubmissionResult",
+    "ColumnarResult",
+    "WatermarkStore",
+    "LocalMirror",
+    "MirrorStatus",
+    "QueryBuilder",
     "ComplexQueryRecords",
     "QueryApiAggregate",
     "ComplexQMLQueryRecords",
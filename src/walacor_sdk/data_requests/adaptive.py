@@ -0,0 +1,113 @@
+import threading
+import weakref
+
+from typing import Any
+
+DEFAULT_INITIAL_ROWS = 500
+DEFAULT_MAX_ADAPTIVE_ROWS = 10_000
+
+
+class AdaptiveBatchSizer:
+    """Learns a good ``envelopes/submit`` batch size for one table.
+
+    Hill-climbs on per-row latency: after each full batch the size grows by
+    ``growth`` while the time per row keeps dropping by more than
+    ``tolerance``. If a bigger batch turns out slower the size steps back and
+    that becomes the ceiling. Timeouts, HTTP 413 and latency spikes (per-row
+    time above ``spike`` × the running average) shrink it by ``shrink``; a 413
+    also caps the ceiling, since it is a hard server limit.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_ROWS,
+        min_rows: int = 1,
+        max_rows: int = DEFAULT_MAX_ADAPTIVE_ROWS,
+        growth: float = 2.0,
+        shrink: float = 0.5,
+        tolerance: float = 0.1,
+        spike: float = 3.0,
+    ) -> None:
+        if not 1 <= min_rows <= initial <= max_rows:
+            raise ValueError("expected 1 <= min_rows <= initial <= max_rows")
+        if growth <= 1 or not 0 < shrink < 1:
+            raise ValueError("growth must be > 1 and shrink between 0 and 1")
+
+        self.min_rows = min_rows
+        self.growth = growth
+        self.shrink = shrink
+        self.tolerance = tolerance
+        self.spike = spike
+        self._size = initial
+        self._ceiling = max_rows
+        self._last: float | None = None  # per-row seconds at the previous size
+        self._average: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Rows to put in the next batch."""
+        return self._size
+
+    @property
+    def ceiling(self) -> int:
+        return self._ceiling
+
+    def record(self, rows: int, seconds: float) -> None:
+        """Feed back the latency of a successful submit of *rows* rows."""
+        if rows < 1:
+            return
+        per_row = seconds / rows
+        with self._lock:
+            average = self._average
+            self._average = (
+                per_row if average is None else 0.8 * average + 0.2 * per_row
+            )
+            if average is not None and per_row > average * self.spike:
+                self._reduce()
+                return
+            if rows < self._size:
+                # a short batch (end of input, byte limit) says nothing about size
+                return
+
+            last = self._last
+            if last is None or per_row < last * (1 - self.tolerance):
+                self._last = per_row
+                self._size = min(self._ceiling, int(self._size * self.growth))
+            elif per_row > last * (1 + self.tolerance):
+                self._size = max(self.min_rows, int(self._size / self.growth))
+                self._ceiling = self._size
+                self._last = None
+
+    def timed_out(self) -> None:
+        """A submit timed out: send smaller batches from now on."""
+        with self._lock:
+            self._reduce()
+
+    def too_large(self, rows: int) -> None:
+        """A submit of *rows* rows got HTTP 413: never go that big again."""
+        with self._lock:
+            self._size = max(self.min_rows, min(self._size, int(rows * self.shrink)))
+            self._ceiling = self._size
+            self._last = None
+
+    def _reduce(self) -> None:
+        self._size = max(self.min_rows, int(self._size * self.shrink))
+        self._last = None
+
+
+# Learned sizes live as long as the client they were measured through.
+_sizers: "weakref.WeakKeyDictionary[Any, dict[int, AdaptiveBatchSizer]]" = (
+    weakref.WeakKeyDictionary()
+)
+_sizers_lock = threading.Lock()
+
+
+def batch_sizer(client: Any, ETId: int, **options: Any) -> AdaptiveBatchSizer:
+    """The sizer of *ETId* for *client*, created with *options* on first use."""
+    with _sizers_lock:
+        per_client = _sizers.setdefault(client, {})
+        sizer = per_client.get(ETId)
+        if sizer is None:
+            sizer = per_client[ETId] = AdaptiveBatchSizer(**options)
+        return sizer
@@ -0,0 +1,1101 @@
+import asyncio
+import time
+
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+from pydantic import ValidationError
+
+from walacor_sdk.base.async_base_service import AsyncBaseService
+from walacor_sdk.base.async_w_client import AsyncW_Client
+from walacor_sdk.base.model.json_response import JsonResponse
+from walacor_sdk.base.query_cache import QueryCache, cache_key
+from walacor_sdk.data_requests.adaptive import AdaptiveBatchSizer, batch_sizer
+from walacor_sdk.data_requests.batching import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ROWS,
+    batch_outcome,
+    encode_rows,
+    iter_batches,
+    merge_batches,
+    take_batch,
+)
+from walacor_sdk.data_requests.isolation import (
+    IsolationReport,
+    SubmitOutcome,
+    aisolate,
+    rejection_reason,
+)
+from walacor_sdk.data_requests.keyset import (
+    DEFAULT_KEY,
+    DEFAULT_TIEBREAK,
+    Cursor,
+    Keyset,
+    aiter_keyset,
+)
+from walacor_sdk.data_requests.models.data_request_response import (
+    GetAllRecordsResponse,
+    GetComplexQMLQueryResponse,
+    GetComplexQueryResponse,
+    GetSingleRecordResponse,
+    QueryApiAggregateResponse,
+    QueryApiResponse,
+    SingleDataRequestResponse,
+)
+from walacor_sdk.data_requests.models.models import (
+    BulkSubmissionResult,
+    ComplexQMLQueryRecords,
+    ComplexQueryRecords,
+    QueryApiAggregate,
+    ResilientSubmissionResult,
+    SubmissionResult,
+)
+from walacor_sdk.data_requests.paging import afan_out_pages, aiter_pages, page_count
+from walacor_sdk.data_requests.payload import (
+    EncodedRecord,
+    encode_record,
+    has_uid,
+    record_has_uid,
+    submit_body,
+    update_error,
+)
+from walacor_sdk.data_requests.query_builder import AsyncBoundQuery
+from walacor_sdk.data_requests.uid_loader import DEFAULT_UID_CHUNK
+from walacor_sdk.data_requests.validation import RowValidator, is_frame, to_epoch
+from walacor_sdk.data_requests.watermarks import (
+    WatermarkStore,
+    acommitting,
+    watermark_key,
+)
+from walacor_sdk.schema.async_schema_service import AsyncSchemaService
+from walacor_sdk.utils.exceptions import (
+    APIConnectionError,
+    PageFetchError,
+    PayloadTooLargeError,
+    RequestTimeoutError,
+)
+from walacor_sdk.utils.json_stream import JsonArrayStream
+from walacor_sdk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class AsyncDataRequestsService(AsyncBaseService):
+    """``asyncio`` counterpart of :class:`~walacor_sdk.data_requests.data_requests_service.DataRequestsService`."""
+
+    def __init__(self, client: AsyncW_Client) -> None:
+        super().__init__(client)
+        # See DataRequestsService.raw_mode.
+        self.raw_mode: bool = False
+        self._validators: dict[int, RowValidator] = {}
+        self._schema_fields: dict[int, list[str]] = {}
+        # See DataRequestsService.watermarks.
+        self.watermarks = WatermarkStore()
+
+    # ------------------------------------------------------------------ INSERT
+
+    async def insert_single_record(
+        self, jsonRecord: str, ETId: int
+    ) -> SubmissionResult | None:
+        """Insert a **single** row.
+
+        Args:
+            jsonRecord: Raw *JSON string* representing one record that matches the
+                destination schema.
+            ETId: Envelope‑type ID of the destination table.
+
+        Returns:
+            A :class:`~walacor_sdk.data_requests.models.models.SubmissionResult` if
+            the backend confirms success; otherwise ``None``.
+        """
+        record = {"Data": [jsonRecord]}
+        response = await self._submit(record, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def insert_multiple_records(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        validate: bool = False,
+    ) -> SubmissionResult | None:
+        """Bulk‑insert *many* fully‑decoded records.
+
+        Args:
+            listOfJsonRecords: List of dictionaries already parsed from JSON.
+            ETId: Target envelope‑type ID.
+            validate: Check and coerce the rows against the table schema
+                first (see :meth:`validate_records`).
+
+        Returns:
+            :class:`SubmissionResult` or ``None`` on failure.
+
+        Raises:
+            RecordValidationError: ``validate`` is set and rows are invalid;
+                nothing was sent.
+        """
+        if validate:
+            listOfJsonRecords = await self.validate_records(listOfJsonRecords, ETId)
+
+        records = {"Data": listOfJsonRecords}
+        response = await self._submit(records, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def insert_encoded_records(
+        self, records: Iterable[EncodedRecord | str], ETId: int
+    ) -> SubmissionResult | None:
+        """Bulk‑insert records that are already serialized JSON objects.
+
+        The submit body is assembled by joining the encoded records, so they
+        are neither decoded nor encoded again.
+
+        Args:
+            records: JSON objects as ``bytes`` (``str`` is encoded as UTF‑8).
+            ETId: Target envelope‑type ID.
+
+        Returns:
+            :class:`SubmissionResult` or ``None`` on failure.
+        """
+        codec = self._codec()
+        body = submit_body(encode_record(record, codec) for record in records)
+        response = await self._submit(body, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def insert_records_chunked(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_workers: int = 4,
+        validate: bool = False,
+    ) -> BulkSubmissionResult:
+        """Bulk‑insert a large record list as several concurrent submits.
+
+        See :meth:`DataRequestsService.insert_records_chunked`; ``max_workers``
+        bounds the submits awaited at once.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if validate:
+            listOfJsonRecords = await self.validate_records(listOfJsonRecords, ETId)
+
+        rows = encode_rows(listOfJsonRecords, self._codec())
+        batches = list(iter_batches(rows, max_rows, max_bytes))
+        limit = asyncio.Semaphore(max_workers)
+
+        async def submit(batch: list[bytes]) -> SubmissionResult | str:
+            async with limit:
+                try:
+                    result = await self.insert_encoded_records(batch, ETId)
+                except Exception as e:
+                    return str(e) or type(e).__name__
+            return batch_outcome(batch, result)
+
+        outcomes = await asyncio.gather(*(submit(batch) for _, batch in batches))
+        return merge_batches(ETId, len(listOfJsonRecords), batches, list(outcomes))
+
+    async def insert_records_resilient(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        validate: bool = False,
+    ) -> ResilientSubmissionResult:
+        """See :meth:`DataRequestsService.insert_records_resilient`."""
+        if validate:
+            listOfJsonRecords = await self.validate_records(listOfJsonRecords, ETId)
+
+        async def submit(batch: list[Any]) -> SubmitOutcome:
+            return await self._attempt(batch, ETId)
+
+        report = IsolationReport(ETId, len(listOfJsonRecords))
+        rows = encode_rows(listOfJsonRecords, self._codec())
+        for offset, batch in iter_batches(rows, max_rows, max_bytes):
+            await aisolate(batch, offset, submit, report)
+        return report.result()
+
+    async def insert_records_adaptive(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        validate: bool = False,
+        timeout: float | None = None,  # noqa: ASYNC109 - per-request HTTP timeout
+    ) -> BulkSubmissionResult:
+        """See :meth:`DataRequestsService.insert_records_adaptive`."""
+        if validate:
+            listOfJsonRecords = await self.validate_records(listOfJsonRecords, ETId)
+        return await self._submit_adaptive(listOfJsonRecords, ETId, max_bytes, timeout)
+
+    async def update_records_adaptive(
+        self,
+        records: list[dict[str, Any]],
+        ETId: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: float | None = None,  # noqa: ASYNC109 - per-request HTTP timeout
+    ) -> BulkSubmissionResult | None:
+        """See :meth:`DataRequestsService.update_records_adaptive`."""
+        if not all(record_has_uid(record) for record in records):
+            logger.error("UID is required in all records for update")
+            return None
+        return await self._submit_adaptive(records, ETId, max_bytes, timeout)
+
+    def batch_sizer(self, ETId: int) -> AdaptiveBatchSizer:
+        """See :meth:`DataRequestsService.batch_sizer`."""
+        return batch_sizer(self.client, ETId)
+
+    # ------------------------------------------------------------------ VALIDATE
+
+    async def validator(self, ETId: int, refresh: bool = False) -> RowValidator:
+        """See :meth:`DataRequestsService.validator`."""
+        cached = None if refresh else self._validators.get(ETId)
+        if cached is not None:
+            return cached
+
+        detail = await AsyncSchemaService(self.client).get_schema_details_with_ETId(
+            ETId
+        )
+        if detail is None:
+            raise ValueError(f"Schema details of ETId {ETId} are unavailable")
+        validator = self._validators[ETId] = RowValidator(detail)
+        return validator
+
+    async def validate_records(self, records: Any, ETId: int) -> list[dict[str, Any]]:
+        """See :meth:`DataRequestsService.validate_records`."""
+        validator = await self.validator(ETId)
+        if is_frame(records):
+            return validator.validate_frame(records)
+        return validator.validate(records)
+
+    # ------------------------------------------------------------------ UPDATE
+
+    async def update_single_record_with_UID(
+        self, record: dict[str, Any], ETId: int
+    ) -> SubmissionResult | None:
+        """Replace **one** existing row.
+
+        ``record`` **must** contain its immutable ``UID`` otherwise the backend
+        will reject the update.
+
+        Args:
+            record: Row with a ``UID`` field plus updated columns.
+            ETId: Envelope‑type ID of the table being updated.
+
+        Returns:
+            :class:`SubmissionResult` when successful, ``None`` otherwise.
+        """
+
+        if "UID" not in record:
+            logger.error("UID is required to update a record")
+            return None
+
+        response = await self._submit({"Data": [record]}, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to update record")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def update_multiple_record(
+        self, records: list[str], ETId: int
+    ) -> SubmissionResult | None:
+        """Bulk update – each element is a JSON *string* containing a ``UID``.
+
+        Args:
+            records: List of JSON strings. Each must include a ``UID`` key.
+            ETId: Envelope‑type ID for the target table.
+
+        Returns:
+            :class:`SubmissionResult` if the batch succeeds, else ``None``.
+        """
+        codec = self._codec()
+        for record in records:
+            error = update_error(encode_record(record), codec)
+            if error:
+                logger.error(error)
+                return None
+
+        response = await self._submit({"Data": records}, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to update records")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def update_encoded_records(
+        self, records: Iterable[EncodedRecord | str], ETId: int
+    ) -> SubmissionResult | None:
+        """Bulk update from serialized JSON objects, each containing a ``UID``.
+
+        ``UID`` presence is checked by scanning the bytes, not by parsing, and
+        the body is assembled by joining the records.
+
+        Args:
+            records: JSON objects as ``bytes`` (``str`` is encoded as UTF‑8).
+            ETId: Envelope‑type ID for the target table.
+
+        Returns:
+            :class:`SubmissionResult` if the batch succeeds, else ``None``.
+        """
+        codec = self._codec()
+        encoded = [encode_record(record, codec) for record in records]
+        if not all(has_uid(record) for record in encoded):
+            logger.error("UID is required in all records for update")
+            return None
+
+        response = await self._submit(submit_body(encoded), ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to update records")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    # ------------------------------------------------------------------ READ – simple
+
+    async def get_all(
+        self,
+        ETId: int,
+        pageNumber: int = 0,
+        pageSize: int = 0,
+        fromSummary: bool = False,
+        raw: bool | None = None,
+        cache: bool = True,
+    ) -> list[dict[str, Any]] | None:
+        """Retrieve **all** rows or a paginated slice.
+
+        Args:
+            ETId: Envelope‑type ID.
+            pageNumber: 1‑based page index; ``0`` disables pagination.
+            pageSize: Rows per page (*ignored* if ``pageNumber`` is ``0``).
+            fromSummary: When *True* query the summary table.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+            cache: Use the client's query cache; page scans turn it off so
+                they do not evict hot entries.
+
+        Returns:
+            List of row dicts, or ``None``.
+        """
+        header = {"ETId": str(ETId)}
+        query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}&fromSummary={'true' if fromSummary else 'false'}"
+        response = await self._cached_post(query, ETId, headers=header, use_cache=cache)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch all records")
+            return None
+
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
+        try:
+            parsed_response = self._parse(GetAllRecordsResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("GetAllRecordsResponse Validation Error: %s", e)
+            return None
+
+    async def get_single_record_by_record_id(
+        self,
+        record_id: dict[str, str],
+        ETId: int,
+        fromSummary: bool = False,
+        raw: bool | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch one or more records filtered by *record_id*.
+
+        Args:
+            record_id: Simple equality filter – usually ``{"UID": "…"}``.
+            ETId: Envelope‑type ID of the table to query.
+            fromSummary: Search summary view instead of full table.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+
+        Returns:
+            Matching rows or ``None``.
+        """
+        header = {"ETId": str(ETId)}
+        query = f"query/get?fromSummary={'true' if fromSummary else 'false'}"
+        response = await self._cached_post(query, ETId, headers=header, json=record_id)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch single record")
+            return None
+
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
+        try:
+            parsed_response = self._parse(GetSingleRecordResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("GetSingleRecordResponse Validation Error: %s", e)
+            return None
+
+    async def get_many_by_uid(
+        self,
+        ETId: int,
+        uids: Iterable[str],
+        fromSummary: bool = False,
+        chunk_size: int = DEFAULT_UID_CHUNK,
+    ) -> dict[str, dict[str, Any]] | None:
+        """Fetch many records by UID with one ``$in`` query per chunk.
+
+        See :meth:`DataRequestsService.get_many_by_uid`; the chunks are
+        queried concurrently.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        wanted = list(dict.fromkeys(uids))
+        header = {"ETId": str(ETId)}
+        query = f"query/get?fromSummary={'true' if fromSummary else 'false'}"
+        chunks = [
+            wanted[start:end]
+            for start, end in (
+                (start, start + chunk_size)
+                for start in range(0, len(wanted), chunk_size)
+            )
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._cached_post(
+                    query, ETId, headers=header, json={"UID": {"$in": chunk}}
+                )
+                for chunk in chunks
+            )
+        )
+
+        found: dict[str, dict[str, Any]] = {}
+        for response in responses:
+            if not response or not response.get("success"):
+                logger.error("Failed to fetch records by UID")
+                return None
+            rows = self._raw_rows(response)
+            if rows is None:
+                return None
+            for row in rows:
+                if isinstance(row, dict) and isinstance(row.get("UID"), str):
+                    found[row["UID"]] = row
+
+        return found
+
+    # ------------------------------------------------------------------ READ – streaming
+
+    async def stream_all(
+        self, ETId: int, fromSummary: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every row of *ETId* while the response is still downloading.
+
+        See :meth:`DataRequestsService.stream_all`; use with ``async for``.
+        """
+        header = {"ETId": str(ETId)}
+        query = f"query/get?pageNo=0&pageSize=0&fromSummary={'true' if fromSummary else 'false'}"
+        async for row in self._stream_rows(query, header):
+            yield row
+
+    async def stream_complex_query(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the rows of a ``query/getcomplex`` *pipeline*; use with ``async for``."""
+        header = {"ETId": str(ETId)}
+        async for row in self._stream_rows("query/getcomplex", header, json=pipeline):
+            yield row
+
+    async def _stream_rows(
+        self, endpoint: str, headers: dict[str, str], **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        response = await self._post(
+            endpoint, headers=headers, parse_json=False, stream=True, **kwargs
+        )
+        parser = JsonArrayStream("data")
+        try:
+            failed = False
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                for row in parser.feed(chunk):
+                    yield row
+                if parser.meta.get("success") is False:
+                    failed = True
+                    break
+            if not failed:
+                for row in parser.close():
+                    yield row
+        except httpx.TimeoutException as timeout_err:
+            logger.error("Stream timed out: %s", timeout_err)
+            raise RequestTimeoutError("Walacor API did not respond in time.") from None
+        except httpx.HTTPError as req_err:
+            logger.error("Stream interrupted: %s", req_err)
+            raise APIConnectionError(
+                "Connection to Walacor API lost while streaming."
+            ) from None
+        finally:
+            await response.aclose()
+
+        if not parser.meta.get("success"):
+            logger.error("Failed to stream query results")
+            raise PageFetchError("Streamed query did not succeed")
+
+    # ------------------------------------------------------------------ READ – complex/aggregate
+
+    async def post_complex_query(
+        self, ETId: int, pipeline: list[dict[str, Any]], raw: bool | None = None
+    ) -> ComplexQueryRecords | None:
+        """Run an arbitrary Mongo‑style aggregation *pipeline* (``getcomplex``).
+
+        Args:
+            ETId: Primary collection ETId.
+            pipeline: List of pipeline stage dictionaries.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+
+        Returns:
+            :class:`ComplexQueryRecords` or ``None`` on failure.
+        """
+        header = {"ETId": str(ETId)}
+        response = await self._cached_post(
+            "query/getcomplex", ETId, headers=header, json=pipeline
+        )
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch complex query results")
+            return None
+
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return ComplexQueryRecords.model_construct(Records=rows, Total=total)
+
+        try:
+            parsed_response = self._parse(GetComplexQueryResponse, response)
+            return ComplexQueryRecords(
+                Records=parsed_response.data, Total=parsed_response.Total
+            )
+        except ValidationError as e:
+            logger.error("Complex Query Parsing Error: %s", e)
+            return None
+
+    async def query(self, ETId: int, check_fields: bool = True) -> AsyncBoundQuery:
+        """See :meth:`DataRequestsService.query`; run it with ``await q.fetch()``."""
+        fields = None
+        if check_fields:
+            fields = self._schema_fields.get(ETId)
+            if fields is None:
+                detail = await AsyncSchemaService(
+                    self.client
+                ).get_schema_details_with_ETId(ETId)
+                fields = [field.FieldName for field in detail.Fields] if detail else []
+                self._schema_fields[ETId] = fields
+            if not fields:
+                logger.warning(
+                    "No schema for ETId %s, field names are not checked", ETId
+                )
+        return AsyncBoundQuery(self, ETId, fields)
+
+    async def post_query_api(
+        self,
+        ETId: int,
+        payload: dict[str, Any],
+        schemaVersion: int = 1,
+        pageNumber: int = 1,
+        pageSize: int = 0,
+        raw: bool | None = None,
+        cache: bool = True,
+    ) -> list[str] | None:
+        """Endpoint helper for the simplified *query API*.
+
+        Args:
+            ETId: Envelope‑type ID.
+            payload: Query filter object (see Walacor docs).
+            schemaVersion: `SV` header value – defaults to latest (``1``).
+            pageNumber: 1‑based index of the page to retrieve.
+            pageSize: Number of rows per page (``0`` = no limit).
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+            cache: Use the client's query cache; page scans turn it off so
+                they do not evict hot entries.
+
+        Returns:
+            Raw JSON *strings* returned by the platform or ``None``.
+        """
+        headers = {"ETId": str(ETId), "SV": str(schemaVersion)}
+        query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}"
+        response = await self._cached_post(
+            query, ETId, headers=headers, json=payload, use_cache=cache
+        )
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch query results")
+            return None
+
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
+        try:
+            parsed_response = self._parse(QueryApiResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("QueryApiResponse Validation Error: %s", e)
+            return None
+
+    async def post_query_api_aggregate(
+        self,
+        payload: list[dict[str, Any]],
+        ETId: int = 10,
+        schemaVersion: int = 1,
+        dataVersion: int = 1,
+        raw: bool | None = None,
+    ) -> QueryApiAggregate | None:
+        """Wrapper for *query/getComplex* when using the **aggregate** flavour.
+
+        Args:
+            payload: Aggregate pipeline list.
+            ETId: Primary collection ETId – default ``10``.
+            schemaVersion: `SV` header value.
+            dataVersion: `DV` header value.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+
+        Returns:
+            :class:`QueryApiAggregate` with ``Records`` and ``Total`` or ``None``.
+        """
+        headers = {
+            "ETId": str(ETId),
+            "SV": str(schemaVersion),
+            "DV": str(dataVersion),
+        }
+        response = await self._cached_post(
+            "query/getComplex", ETId, headers=headers, json=payload
+        )
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch aggregate results")
+            return None
+
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return QueryApiAggregate.model_construct(Records=rows, Total=total)
+
+        try:
+            parsed_response = self._parse(QueryApiAggregateResponse, response)
+            return QueryApiAggregate(
+                Records=parsed_response.data, Total=parsed_response.Total
+            )
+        except ValidationError as e:
+            logger.error("QueryApiAggregateResponse Validation Error: %s", e)
+            return None
+
+    async def post_complex_MQL_queries(
+        self,
+        pipeline: list[dict[str, Any]],
+        ETId: int,
+        raw: bool | None = None,
+    ) -> ComplexQMLQueryRecords | None:
+        """Pass‑through helper for advanced *MQL* pipelines.
+
+        Args:
+            pipeline: Mongo Query Language aggregate pipeline.
+            ETId: Primary collection envelope‑type ID.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+
+        Returns:
+            :class:`ComplexQMLQueryRecords` or ``None``.
+        """
+        header = {"ETId": str(ETId)}
+        response = await self._cached_post(
+            "query/getcomplex", ETId, headers=header, json=pipeline
+        )
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch MQL query results")
+            return None
+
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return ComplexQMLQueryRecords.model_construct(Records=rows, Total=total)
+
+        try:
+            parsed_response = self._parse(GetComplexQMLQueryResponse, response)
+            return ComplexQMLQueryRecords(
+                Records=parsed_response.data, Total=parsed_response.Total
+            )
+        except ValidationError as e:
+            logger.error("GetComplexQMLQueryResponse Validation Error: %s", e)
+            return None
+
+    # ------------------------------------------------------------------ READ – iterators
+
+    def iter_all(
+        self, ETId: int, page_size: int = 1000, fromSummary: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Lazily iterate every row of *ETId*; the next page is prefetched.
+
+        Use with ``async for``.
+        """
+
+        async def fetch(page: int) -> list[dict[str, Any]] | None:
+            return await self.get_all(ETId, page, page_size, fromSummary, cache=False)
+
+        return aiter_pages(fetch, page_size)
+
+    def iter_query(
+        self,
+        ETId: int,
+        payload: dict[str, Any],
+        page_size: int = 1000,
+        schemaVersion: int = 1,
+    ) -> AsyncIterator[str]:
+        """Lazily iterate :meth:`post_query_api` results; use with ``async for``."""
+
+        async def fetch(page: int) -> list[str] | None:
+            return await self.post_query_api(
+                ETId, payload, schemaVersion, page, page_size, cache=False
+            )
+
+        return aiter_pages(fetch, page_size)
+
+    def iter_keyset(
+        self,
+        ETId: int,
+        key: str = DEFAULT_KEY,
+        page_size: int = 1000,
+        match: dict[str, Any] | None = None,
+        after: Cursor | None = None,
+        tiebreak: str | None = DEFAULT_TIEBREAK,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Keyset-paginated scan of *ETId*; use with ``async for``.
+
+        See :meth:`DataRequestsService.iter_keyset`.
+        """
+        keyset = Keyset(key, tiebreak, page_size, match)
+
+        async def fetch(pipeline: list[dict[str, Any]]) -> list[Any] | None:
+            return await self._complex_rows(ETId, pipeline)
+
+        return aiter_keyset(fetch, keyset, after)
+
+    def sync_changes(
+        self,
+        ETId: int,
+        since: int | datetime | str | None = None,
+        field: str = DEFAULT_KEY,
+        page_size: int = 1000,
+        match: dict[str, Any] | None = None,
+        commit_every: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Rows of *ETId* changed since the last sync; use with ``async for``.
+
+        See :meth:`DataRequestsService.sync_changes`.
+        """
+        keyset, after, commit = self._sync_plan(ETId, since, field, page_size, match)
+
+        async def fetch(pipeline: list[dict[str, Any]]) -> list[Any] | None:
+            return await self._complex_rows(ETId, pipeline)
+
+        return acommitting(
+            aiter_keyset(fetch, keyset, after),
+            keyset,
+            commit,
+            commit_every or page_size,
+        )
+
+    async def count_records(
+        self, ETId: int, fromSummary: bool = False, cache: bool = True
+    ) -> int | None:
+        """Ask the backend for the number of rows in *ETId* (``totalReq=true``)."""
+        header = {"ETId": str(ETId)}
+        query = f"query/get?pageNo=1&pageSize=1&fromSummary={'true' if fromSummary else 'false'}&totalReq=true"
+        response = await self._cached_post(query, ETId, headers=header, use_cache=cache)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch record count")
+            return None
+
+        try:
+            return self._parse(GetAllRecordsResponse, response).Total
+        except ValidationError as e:
+            logger.error("GetAllRecordsResponse Validation Error: %s", e)
+            return None
+
+    async def export_all(
+        self,
+        ETId: int,
+        page_size: int = 1000,
+        max_workers: int = 4,
+        fromSummary: bool = False,
+        ordered: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Pull a whole table by fetching all of its pages concurrently.
+
+        See :meth:`DataRequestsService.export_all`; use with ``async for``.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        total = await self.count_records(ETId, fromSummary, cache=False)
+        if total is None:
+            logger.warning("No total for ETId %s, exporting page by page", ETId)
+            rows = self.iter_all(ETId, page_size, fromSummary)
+        else:
+
+            async def fetch(page: int) -> list[dict[str, Any]] | None:
+                return await self.get_all(
+                    ETId, page, page_size, fromSummary, cache=False
+                )
+
+            pages = page_count(total, page_size)
+            rows = afan_out_pages(fetch, pages, max_workers, ordered)
+
+        async for row in rows:
+            yield row
+
+    # ------------------------------------------------------------------ helpers
+
+    def _is_raw(self, raw: bool | None) -> bool:
+        return self.raw_mode if raw is None else raw
+
+    @staticmethod
+    def _raw_rows(response: Mapping[str, Any]) -> list[Any] | None:
+        """Envelope check for raw mode: ``data`` must be a list, rows are untouched."""
+        data = response.get("data")
+        if not isinstance(data, list):
+            logger.error("Raw response has no data list")
+            return None
+        return data
+
+    async def _complex_rows(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> list[Any] | None:
+        """Uncached ``getcomplex`` returning the raw rows, for scans."""
+        response = await self._post(
+            "query/getcomplex", headers={"ETId": str(ETId)}, json=pipeline
+        )
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch complex query results")
+            return None
+        return self._raw_rows(response)
+
+    def _sync_plan(
+        self,
+        ETId: int,
+        since: int | datetime | str | None,
+        field: str,
+        page_size: int,
+        match: dict[str, Any] | None,
+    ) -> tuple[Keyset, Cursor | None, Callable[[Cursor], None]]:
+        """Keyset, start cursor and watermark writer of a :meth:`sync_changes`."""
+        key = watermark_key(self.client.base_url, ETId, field)
+        store = self.watermarks
+        after = None
+        if since is None:
+            after = store.get(key)
+        else:
+            start = {field: {"$gt": to_epoch(since)}}
+            match = {"$and": [match, start]} if match else start
+        keyset = Keyset(field, DEFAULT_TIEBREAK, page_size, match)
+        return keyset, after, lambda cursor: store.set(key, cursor)
+
+    @staticmethod
+    def _raw_total(response: Mapping[str, Any]) -> int | None:
+        total = response.get("total")
+        if not isinstance(total, int) or isinstance(total, bool):
+            logger.error("Raw response has no integer total")
+            return None
+        return total
+
+    async def _submit(
+        self,
+        body: dict[str, Any] | bytes,
+        ETId: int,
+        parse_json: bool = True,
+        timeout: float | None = None,  # noqa: ASYNC109 - per-request HTTP timeout
+    ) -> Any:
+        """POST ``envelopes/submit`` and drop cached reads of *ETId*.
+
+        A ``bytes`` body is sent as is; a ``dict`` is encoded by the client.
+        """
+        kwargs: dict[str, Any] = (
+            {"content": body} if isinstance(body, bytes) else {"json": body}
+        )
+        if not parse_json:
+            kwargs["parse_json"] = False
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        try:
+            return await self._post(
+                "envelopes/submit", headers={"ETId": str(ETId)}, **kwargs
+            )
+        finally:
+            # also on failure: the envelope may have been accepted anyway
+            self._invalidate(ETId)
+
+    async def _submit_adaptive(
+        self,
+        records: list[Any],
+        ETId: int,
+        max_bytes: int,
+        timeout: float | None,  # noqa: ASYNC109 - per-request HTTP timeout
+    ) -> BulkSubmissionResult:
+        sizer = batch_sizer(self.client, ETId)
+        rows = encode_rows(records, self._codec())
+        batches: list[tuple[int, list[Any]]] = []
+        outcomes: list[SubmissionResult | str] = []
+        offset = 0
+        while offset < len(rows):
+            batch = take_batch(rows, offset, sizer.size, max_bytes)
+            body = submit_body(batch)
+            started = time.monotonic()
+            outcome: SubmissionResult | str
+            try:
+                result = self._submission(
+                    await self._submit(body, ETId, timeout=timeout)
+                )
+            except PayloadTooLargeError as e:
+                if len(batch) > 1:
+                    sizer.too_large(len(batch))
+                    continue
+                outcome = str(e)
+            except RequestTimeoutError as e:
+                sizer.timed_out()
+                outcome = str(e)
+            except Exception as e:
+                outcome = str(e) or type(e).__name__
+            else:
+                outcome = batch_outcome(batch, result)
+                if isinstance(outcome, SubmissionResult):
+                    sizer.record(len(batch), time.monotonic() - started)
+            batches.append((offset, batch))
+            outcomes.append(outcome)
+            offset += len(batch)
+
+        return merge_batches(ETId, len(records), batches, outcomes)
+
+    def _submission(self, response: Any) -> SubmissionResult | None:
+        """:class:`SubmissionResult` of a submit response, ``None`` on failure."""
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+        try:
+            return self._parse(SingleDataRequestResponse, response).data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    async def _attempt(self, batch: list[bytes], ETId: int) -> SubmitOutcome:
+        """One submit for the bisecting insert; a 422 is reported as rejected."""
+        try:
+            response = await self._submit(submit_body(batch), ETId, parse_json=False)
+        except Exception as e:
+            return SubmitOutcome(error=str(e) or type(e).__name__)
+
+        if response.status_code == 422:
+            return SubmitOutcome(
+                error=rejection_reason(response.content), rejected=True
+            )
+
+        parsed = JsonResponse(response.content, self._codec())
+        if not parsed.get("success"):
+            return SubmitOutcome(error="Submit was not accepted")
+        try:
+            data = self._parse(SingleDataRequestResponse, parsed).data
+        except ValidationError as e:
+            return SubmitOutcome(
+                error=f"SingleDataRequestResponse Validation Error: {e}"
+            )
+
+        outcome = batch_outcome(batch, data)
+        if isinstance(outcome, str):
+            return SubmitOutcome(error=outcome)
+        return SubmitOutcome(result=outcome)
+
+    async def _cached_post(
+        self,
+        endpoint: str,
+        ETId: int,
+        headers: dict[str, str],
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """POST a read, answering from :attr:`AsyncW_Client.query_cache` when set."""
+        cache = getattr(self.client, "query_cache", None)
+        if not use_cache or not isinstance(cache, QueryCache):
+            return await self._post(endpoint, headers=headers, **kwargs)
+
+        key = cache_key(endpoint, ETId, headers, kwargs.get("json"))
+        body = cache.get(key)
+        if body is not None:
+            return JsonResponse(body, self._codec())
+
+        generation = cache.generation(ETId)
+        response = await self._post(
+            endpoint, headers=headers, parse_json=False, **kwargs
+        )
+        parsed = JsonResponse(response.content, self._codec())
+        if parsed.get("success"):
+            cache.set(key, ETId, parsed.content, generation=generation)
+        return parsed
+
+    def _invalidate(self, ETId: int) -> None:
+        cache = getattr(self.client, "query_cache", None)
+        if isinstance(cache, QueryCache):
+            cache.invalidate(ETId)
+
+    # ------------------------------------------------------------------ END REGION
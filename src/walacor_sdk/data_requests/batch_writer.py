@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import threading
+import time
+import weakref
+
+from collections import deque
+from concurrent.futures import Future, wait
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from walacor_sdk.data_requests.payload import EncodedRecord, encode_record
+from walacor_sdk.utils.exceptions import BatchSubmitError
+from walacor_sdk.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+logger = get_logger(__name__)
+
+_Pending = tuple[bytes, int, Future[str]]
+
+
+class BatchWriter:
+    """Coalesce single-record inserts for **one** ETId into bulk submits.
+
+    Records handed to :meth:`submit` are encoded once with the client codec,
+    buffered and sent through :meth:`DataRequestsService.insert_encoded_records`
+    once ``max_items`` records or ``max_bytes`` serialized bytes are pending,
+    or ``max_delay_ms`` after the oldest pending record arrived – whichever
+    comes first. Each caller gets a :class:`~concurrent.futures.Future`
+    resolving to the UID of its own record, taken positionally from
+    ``SubmissionResult.UID``.
+
+    Batches are flushed one at a time by a background thread, so records keep
+    their submission order. Call :meth:`close` (or use the writer as a context
+    manager) to flush what is left; a best-effort flush also runs at exit.
+    """
+
+    def __init__(
+        self,
+        service: DataRequestsService,
+        ETId: int,
+        max_items: int = 500,
+        max_bytes: int = 1_000_000,
+        max_delay_ms: float = 50.0,
+    ) -> None:
+        if max_items < 1 or max_bytes < 1 or max_delay_ms < 0:
+            raise ValueError(
+                "max_items and max_bytes must be positive, max_delay_ms non-negative"
+            )
+
+        self.service = service
+        self.ETId = ETId
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay_ms / 1000
+
+        self._pending: deque[_Pending] = deque()
+        self._pending_bytes = 0
+        self._oldest: float | None = None
+        self._flush_now = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"walacor-batch-{ETId}", daemon=True
+        )
+        self._thread.start()
+        # Own hook per writer so close() can drop it from the atexit table.
+        self._at_exit = functools.partial(BatchWriter._close_at_exit, weakref.ref(self))
+        atexit.register(self._at_exit)
+
+    # ------------------------------------------------------------------ public
+
+    def submit(self, record: dict[str, Any] | EncodedRecord | str) -> Future[str]:
+        """Queue *record* and return its UID future.
+
+        *record* is a dict, or a JSON object already encoded as ``bytes`` or
+        ``str`` – the same meaning as in :meth:`insert_encoded_records`.
+        """
+        future: Future[str] = Future()
+        encoded = encode_record(record, self.service._codec())
+        size = len(encoded)
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchWriter is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((encoded, size, future))
+            self._pending_bytes += size
+            self._cond.notify()
+        return future
+
+    def flush(self) -> None:
+        """Send everything pending now and wait until it has been submitted."""
+        with self._cond:
+            futures = [future for _, _, future in self._pending]
+            self._flush_now = True
+            self._cond.notify()
+        wait(futures)
+
+    def close(self) -> None:
+        """Flush pending records and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        atexit.unregister(self._at_exit)
+        self._thread.join()
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting for the next flush."""
+        with self._cond:
+            return len(self._pending)
+
+    def __enter__(self) -> BatchWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _full(self) -> bool:
+        return (
+            len(self._pending) >= self.max_items
+            or self._pending_bytes >= self.max_bytes
+        )
+
+    def _take(self) -> list[_Pending]:
+        """Detach the next batch of pending records; caller holds the lock."""
+        batch: list[_Pending] = []
+        size = 0
+        while self._pending and len(batch) < self.max_items:
+            record_bytes = self._pending[0][1]
+            if batch and size + record_bytes > self.max_bytes:
+                break
+            batch.append(self._pending.popleft())
+            size += record_bytes
+
+        self._pending_bytes -= size
+        if not self._pending:
+            self._oldest = None
+            self._flush_now = False
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending and (self._flush_now or self._full()):
+                        break
+                    if self._oldest is not None:
+                        remaining = self._oldest + self.max_delay - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+                batch = self._take()
+            self._send(batch)
+
+    def _send(self, batch: list[_Pending]) -> None:
+        live = [(r, f) for r, _, f in batch if f.set_running_or_notify_cancel()]
+        if not live:
+            return
+
+        records = [record for record, _ in live]
+        try:
+            result = self.service.insert_encoded_records(records, self.ETId)
+        except Exception as exc:
+            logger.error("Batch submit for ETId %s failed: %s", self.ETId, exc)
+            for _, future in live:
+                future.set_exception(exc)
+            return
+
+        if result is None or len(result.UID) != len(live):
+            error = BatchSubmitError(
+                f"Batch of {len(live)} record(s) for ETId {self.ETId} was not accepted"
+            )
+            for _, future in live:
+                future.set_exception(error)
+            return
+
+        for (_, future), uid in zip(live, result.UID, strict=True):
+            future.set_result(uid)
+
+    @staticmethod
+    def _close_at_exit(ref: weakref.ref[BatchWriter]) -> None:
+        writer = ref()
+        if writer is not None:
+            writer.close()
@@ -0,0 +1,132 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+from walacor_sdk.data_requests.models.models import (
+    BulkSubmissionResult,
+    FailedBatch,
+    SubmissionResult,
+)
+from walacor_sdk.data_requests.payload import EncodedRecord
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+from walacor_sdk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ROWS = 1000
+DEFAULT_MAX_BYTES = 4_000_000
+
+
+def encode_row(record: Any, codec: JsonCodec | None = None) -> bytes:
+    """*record* as written into an ``envelopes/submit`` body.
+
+    Pre-encoded ``bytes`` are kept as they are; a row dict (or a ``str``,
+    which the backend receives as a string value) is encoded with *codec*,
+    the process-wide one if unset. JSON object text given as ``str`` goes
+    through :func:`~walacor_sdk.data_requests.payload.encode_record`. Bulk paths encode every row once with the
+    client codec and use the bytes both to size batches and as the body.
+    """
+    if isinstance(record, EncodedRecord):
+        return bytes(record)
+    return (codec or get_codec()).dumps(record)
+
+
+def encode_rows(records: Iterable[Any], codec: JsonCodec | None = None) -> list[bytes]:
+    """:func:`encode_row` of every record."""
+    codec = codec or get_codec()
+    return [encode_row(record, codec) for record in records]
+
+
+def record_size(record: Any, codec: JsonCodec | None = None) -> int:
+    """Serialized size of *record* inside an ``envelopes/submit`` body."""
+    return len(encode_row(record, codec))
+
+
+def iter_batches(
+    records: Iterable[Any],
+    max_rows: int = DEFAULT_MAX_ROWS,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    measure: Callable[[Any], int] = record_size,
+) -> Iterator[tuple[int, list[Any]]]:
+    """Split *records* into submit-sized batches.
+
+    A batch closes when it holds ``max_rows`` records or when the next record
+    would push its serialized size (as given by *measure*) past
+    ``max_bytes``. A single record larger than ``max_bytes`` still gets a
+    batch of its own so nothing is dropped. Pass records already encoded
+    with :func:`encode_rows` so they are not serialized just to be measured.
+
+    Yields:
+        ``(offset, batch)`` where *offset* is the index of the batch's first
+        record in the input.
+    """
+    if max_rows < 1 or max_bytes < 1:
+        raise ValueError("max_rows and max_bytes must be positive")
+
+    batch: list[Any] = []
+    offset = 0
+    size = 0
+    for index, record in enumerate(records):
+        record_bytes = measure(record)
+        if batch and (len(batch) >= max_rows or size + record_bytes > max_bytes):
+            yield offset, batch
+            batch, offset, size = [], index, 0
+        batch.append(record)
+        size += record_bytes
+
+    if batch:
+        yield offset, batch
+
+
+def batch_outcome(
+    batch: list[Any], result: SubmissionResult | None
+) -> SubmissionResult | str:
+    """Check one batch's submit result; an error string when it is unusable."""
+    if result is None:
+        return "Submit was not accepted"
+    if len(result.UID) != len(batch):
+        return f"Expected {len(batch)} UIDs, got {len(result.UID)}"
+    return result
+
+
+def merge_batches(
+    ETId: int,
+    total: int,
+    batches: list[tuple[int, list[Any]]],
+    outcomes: list[SubmissionResult | str],
+) -> BulkSubmissionResult:
+    """Combine per-batch outcomes into one result aligned with the input rows."""
+    uids: list[str | None] = [None] * total
+    submissions: list[SubmissionResult] = []
+    failed: list[FailedBatch] = []
+    for (offset, batch), outcome in zip(batches, outcomes, strict=True):
+        if isinstance(outcome, SubmissionResult):
+            end = offset + len(batch)
+            uids[offset:end] = outcome.UID
+            submissions.append(outcome)
+        else:
+            logger.error(
+                "Batch of %d record(s) at offset %d failed: %s",
+                len(batch),
+                offset,
+                outcome,
+            )
+            failed.append(FailedBatch(Offset=offset, Count=len(batch), Error=outcome))
+
+    return BulkSubmissionResult(
+        ETId=ETId, UID=uids, Submissions=submissions, FailedBatches=failed
+    )
+
+
+def take_batch(
+    records: Sequence[Any], start: int, max_rows: int, max_bytes: int
+) -> list[Any]:
+    """The next batch of *records* from *start*, cut like :func:`iter_batches`."""
+    end = start
+    size = 0
+    while end < len(records) and end - start < max_rows:
+        record_bytes = record_size(records[end])
+        if end > start and size + record_bytes > max_bytes:
+            break
+        size += record_bytes
+        end += 1
+    return list(records[start:end])
@@ -0,0 +1,259 @@
+import threading
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from walacor_sdk.base.query_cache import QueryCache, cache_key
+from walacor_sdk.schema.models.models import SchemaDetail
+from walacor_sdk.schema.schema_service import SchemaService
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+from walacor_sdk.utils.enums import FieldType
+from walacor_sdk.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+logger = get_logger(__name__)
+
+# Walacor field type -> (pyarrow type factory name, pandas dtype, numpy dtype)
+_DTYPES: dict[str, tuple[str, str, str]] = {
+    FieldType.INTEGER.value: ("int64", "Int64", "int64"),
+    FieldType.DECIMAL.value: ("float64", "Float64", "float64"),
+    FieldType.BOOLEAN.value: ("bool_", "boolean", "bool"),
+    FieldType.TEXT.value: ("string", "string", "object"),
+    FieldType.CRON.value: ("string", "string", "object"),
+    # epoch values are kept as integers; the unit is not part of the schema
+    FieldType.DATETIME_EPOCH.value: ("int64", "Int64", "int64"),
+}
+
+
+def field_types(detail: SchemaDetail | None) -> dict[str, str]:
+    """Map each field of *detail* to its Walacor data type name."""
+    if detail is None:
+        return {}
+    return {field.FieldName: field.DataType.upper() for field in detail.Fields}
+
+
+def build_columns(
+    rows: Iterable[Any], codec: JsonCodec | None = None
+) -> dict[str, list[Any]]:
+    """Pivot *rows* into one list per column in a single pass.
+
+    Rows missing a column get ``None``; JSON-string rows (as returned by the
+    query API) are decoded first with *codec* (the process-wide one if unset).
+    """
+    loads = (codec or get_codec()).loads
+    columns: dict[str, list[Any]] = {}
+    count = 0
+    for row in rows:
+        if isinstance(row, str | bytes):
+            row = loads(row)
+        if not isinstance(row, dict):
+            row = {"value": row}
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * count
+            column.append(value)
+        count += 1
+        if len(row) != len(columns):
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+    return columns
+
+
+class ColumnarResult:
+    """Query result held as column buffers, convertible without a row copy.
+
+    ``types`` maps column names to Walacor data types (from the schema) and
+    selects the Arrow / pandas / NumPy dtype of each known column; other
+    columns are inferred. The conversions need the optional ``data-science``
+    extra (``pip install walacor-python-sdk[data-science]``).
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, list[Any]],
+        types: dict[str, str] | None = None,
+        total: int | None = None,
+    ) -> None:
+        self.columns = columns
+        self.types = types or {}
+        self.total = total
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def _dtype(self, name: str, index: int) -> str | None:
+        dtypes = _DTYPES.get(self.types.get(name, ""))
+        return dtypes[index] if dtypes else None
+
+    def as_arrow(self) -> Any:
+        """Return a ``pyarrow.Table``."""
+        try:
+            import pyarrow as pa
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "Arrow results require pyarrow. Run:  pip install pyarrow"
+            ) from err
+
+        arrays = []
+        for name, values in self.columns.items():
+            dtype = self._dtype(name, 0)
+            arrays.append(
+                pa.array(values, type=getattr(pa, dtype)() if dtype else None)
+            )
+        return pa.Table.from_arrays(arrays, names=self.column_names)
+
+    def as_pandas(self) -> Any:
+        """Return a ``pandas.DataFrame`` using nullable extension dtypes."""
+        try:
+            import pandas as pd
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "DataFrame results require pandas. Run:  pip install pandas"
+            ) from err
+
+        data = {
+            name: pd.array(values, dtype=self._dtype(name, 1))
+            for name, values in self.columns.items()
+        }
+        return pd.DataFrame(data, columns=self.column_names)
+
+    def as_numpy(self) -> Any:
+        """Return a NumPy record array.
+
+        Integer and boolean columns containing nulls fall back to ``float64``
+        (``nan``) and ``object`` respectively, since NumPy has no null.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "NumPy results require NumPy. Run:  pip install numpy"
+            ) from err
+
+        arrays: list[Any] = []
+        for name, values in self.columns.items():
+            dtype = self._dtype(name, 2) or "object"
+            if dtype != "object" and None in values:
+                if dtype == "bool":
+                    dtype = "object"
+                else:
+                    dtype = "float64"
+                    values = [np.nan if v is None else v for v in values]
+            arrays.append(np.array(values, dtype=dtype))
+        layout = [(name, array.dtype) for name, array in zip(self.columns, arrays)]
+        return np.rec.fromarrays(arrays, dtype=layout)
+
+
+class ColumnarReader:
+    """Read paths of :class:`DataRequestsService` returning :class:`ColumnarResult`.
+
+    The response body is decoded in one pass by the client's codec (orjson
+    when installed) and its rows are pivoted into column buffers. Column
+    dtypes come from the table schema, fetched once per ETId and cached.
+    """
+
+    def __init__(self, service: "DataRequestsService") -> None:
+        self.service = service
+        self._schemas: dict[int, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get_all(
+        self,
+        ETId: int,
+        pageNumber: int = 0,
+        pageSize: int = 0,
+        fromSummary: bool = False,
+    ) -> ColumnarResult | None:
+        """Columnar :meth:`DataRequestsService.get_all`."""
+        query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}&fromSummary={'true' if fromSummary else 'false'}"
+        return self._load(query, ETId, {"ETId": str(ETId)})
+
+    def post_query_api(
+        self,
+        ETId: int,
+        payload: dict[str, Any],
+        schemaVersion: int = 1,
+        pageNumber: int = 1,
+        pageSize: int = 0,
+    ) -> ColumnarResult | None:
+        """Columnar :meth:`DataRequestsService.post_query_api`."""
+        headers = {"ETId": str(ETId), "SV": str(schemaVersion)}
+        query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}"
+        return self._load(query, ETId, headers, payload)
+
+    def post_complex_query(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> ColumnarResult | None:
+        """Columnar :meth:`DataRequestsService.post_complex_query`."""
+        return self._load("query/getcomplex", ETId, {"ETId": str(ETId)}, pipeline)
+
+    def post_complex_MQL_queries(
+        self, pipeline: list[dict[str, Any]], ETId: int
+    ) -> ColumnarResult | None:
+        """Columnar :meth:`DataRequestsService.post_complex_MQL_queries`."""
+        return self.post_complex_query(ETId, pipeline)
+
+    def schema_types(self, ETId: int) -> dict[str, str]:
+        """Field types of *ETId*, fetched on first use.
+
+        A failed schema fetch returns ``{}`` (dtypes are inferred) and is not
+        cached, so the next read asks again.
+        """
+        with self._lock:
+            cached = self._schemas.get(ETId)
+        if cached is not None:
+            return cached
+
+        detail = SchemaService(self.service.client).get_schema_details_with_ETId(ETId)
+        if detail is None:
+            return {}
+        types = field_types(detail)
+        with self._lock:
+            self._schemas[ETId] = types
+        return types
+
+    def _load(
+        self,
+        endpoint: str,
+        ETId: int,
+        headers: dict[str, str],
+        payload: Any = None,
+    ) -> ColumnarResult | None:
+        kwargs: dict[str, Any] = {} if payload is None else {"json": payload}
+        cache = getattr(self.service.client, "query_cache", None)
+        key = cache_key(endpoint, ETId, headers, payload)
+        body = cache.get(key) if isinstance(cache, QueryCache) else None
+        cached = body is not None
+        generation = cache.generation(ETId) if isinstance(cache, QueryCache) else None
+        if body is None:
+            response = self.service._post(
+                endpoint, headers=headers, parse_json=False, **kwargs
+            )
+            body = response.content
+
+        codec = self.service._codec()
+        try:
+            document = codec.loads(body)
+        except ValueError as e:
+            logger.error("Columnar response is not valid JSON: %s", e)
+            return None
+        if not isinstance(document, dict) or not document.get("success"):
+            logger.error("Failed to fetch columnar results")
+            return None
+
+        if isinstance(cache, QueryCache) and not cached:
+            cache.set(key, ETId, body, generation=generation)
+        total = document.get("total")
+        return ColumnarResult(
+            build_columns(document.get("data") or (), codec),
+            self.schema_types(ETId),
+            total if isinstance(total, int) else None,
+        )
@@ -1,11 +1,46 @@
-import json
+import threading
+import time
 
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
+from requests.exceptions import RequestException, Timeout
 
 from walacor_sdk.base.base_service import BaseService
+from walacor_sdk.base.model.json_response import JsonResponse
+from walacor_sdk.base.query_cache import QueryCache, cache_key
 from walacor_sdk.base.w_client import W_Client
+from walacor_sdk.data_requests.adaptive import AdaptiveBatchSizer, batch_sizer
+from walacor_sdk.data_requests.batch_writer import BatchWriter
+from walacor_sdk.data_requests.batching import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ROWS,
+    batch_outcome,
+    encode_row,
+    encode_rows,
+    iter_batches,
+    merge_batches,
+    take_batch,
+)
+from walacor_sdk.data_requests.columnar import ColumnarReader
+from walacor_sdk.data_requests.isolation import (
+    IsolationReport,
+    SubmitOutcome,
+    isolate,
+    rejection_reason,
+)
+from walacor_sdk.data_requests.keyset import (
+    DEFAULT_KEY,
+    DEFAULT_TIEBREAK,
+    Cursor,
+    Keyset,
+    iter_keyset,
+)
+from walacor_sdk.data_requests.mirror import LocalMirror
 from walacor_sdk.data_requests.models.data_request_response import (
     GetAllRecordsResponse,
     GetComplexQMLQueryResponse,
@@ -16,19 +51,86 @@ from walacor_sdk.data_requests.models.data_request_response import (
     SingleDataRequestResponse,
 )
 from walacor_sdk.data_requests.models.models import (
+    BulkSubmissionResult,
     ComplexQMLQueryRecords,
     ComplexQueryRecords,
+    FailedBatch,
     QueryApiAggregate,
+    ResilientSubmissionResult,
+    StreamSubmissionResult,
     SubmissionResult,
 )
+from walacor_sdk.data_requests.paging import fan_out_pages, iter_pages, page_count
+from walacor_sdk.data_requests.payload import (
+    EncodedRecord,
+    encode_record,
+    has_uid,
+    record_has_uid,
+    submit_body,
+    update_error,
+)
+from walacor_sdk.data_requests.query_builder import BoundQuery
+from walacor_sdk.data_requests.sources import read_csv, read_jsonl
+from walacor_sdk.data_requests.uid_loader import DEFAULT_UID_CHUNK, UIDLoader
+from walacor_sdk.data_requests.validation import RowValidator, is_frame, to_epoch
+from walacor_sdk.data_requests.watermarks import (
+    WatermarkStore,
+    committing,
+    watermark_key,
+)
+from walacor_sdk.schema.schema_service import SchemaService
+from walacor_sdk.utils.exceptions import (
+    APIConnectionError,
+    PageFetchError,
+    PayloadTooLargeError,
+    RequestTimeoutError,
+)
+from walacor_sdk.utils.json_stream import JsonArrayStream
 from walacor_sdk.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class DataRequestsService(BaseService):
     def __init__(self, client: W_Client) -> None:
         super().__init__(client)
+        # Raw mode: read methods return the row list as received, only the
+        # envelope (``success``/``data``/``total``) is checked.
+        self.raw_mode: bool = False
+        self._batch_writers: dict[int, BatchWriter] = {}
+        self._batch_lock = threading.Lock()
+        self._columnar: ColumnarReader | None = None
+        self._validators: dict[int, RowValidator] = {}
+        self._validator_lock = threading.Lock()
+        # Where sync_changes keeps how far each table has been synced.
+        self.watermarks = WatermarkStore()
+        self._uid_loaders: dict[int, UIDLoader] = {}
+        self._uid_loader_lock = threading.Lock()
+
+    @property
+    def columnar(self) -> ColumnarReader:
+        """Read methods returning :class:`ColumnarResult` (Arrow/pandas/NumPy)."""
+        if self._columnar is None:
+            self._columnar = ColumnarReader(self)
+        return self._columnar
+
+    def mirror(
+        self, path: str = ":memory:", engine: str = "sqlite", page_size: int = 1000
+    ) -> LocalMirror:
+        """Open a local read replica backed by this service.
+
+        Args:
+            path: Database file; ``":memory:"`` keeps it in memory.
+            engine: ``"sqlite"`` or ``"duckdb"`` (needs the ``duckdb`` package).
+            page_size: Rows fetched per page when refreshing.
+
+        Returns:
+            :class:`~walacor_sdk.data_requests.mirror.LocalMirror`; add
+            tables with :meth:`LocalMirror.add`.
+        """
+        return LocalMirror(self, path, engine, page_size)
 
     # ------------------------------------------------------------------ INSERT
 
@@ -47,47 +149,462 @@ class DataRequestsService(BaseService):
             the backend confirms success; otherwise ``None``.
         """
         record = {"Data": [jsonRecord]}
-        header = {"ETId": str(ETId)}
-        response = self._post("envelopes/submit", json=record, headers=header)
+        response = self._submit(record, ETId)
 
         if not response or not response.get("success"):
             logger.error("Failed to insert record")
             return None
 
         try:
-            parsed_response = SingleDataRequestResponse(**response)
+            parsed_response = self._parse(SingleDataRequestResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("SingleDataRequestResponse Validation Error: %s", e)
             return None
 
     def insert_multiple_records(
-        self, listOfJsonRecords: list[dict[str, Any]], ETId: int
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        validate: bool = False,
     ) -> SubmissionResult | None:
         """Bulk‑insert *many* fully‑decoded records.
 
         Args:
             listOfJsonRecords: List of dictionaries already parsed from JSON.
             ETId: Target envelope‑type ID.
+            validate: Check and coerce the rows against the table schema
+                first (see :meth:`validate_records`).
 
         Returns:
             :class:`SubmissionResult` or ``None`` on failure.
+
+        Raises:
+            RecordValidationError: ``validate`` is set and rows are invalid;
+                nothing was sent.
         """
+        if validate:
+            listOfJsonRecords = self.validate_records(listOfJsonRecords, ETId)
+
         records = {"Data": listOfJsonRecords}
-        header = {"ETId": str(ETId)}
-        response = self._post("envelopes/submit", json=records, headers=header)
+        response = self._submit(records, ETId)
 
         if not response or not response.get("success"):
             logger.error("Failed to insert record")
             return None
 
         try:
-            parsed_response = SingleDataRequestResponse(**response)
+            parsed_response = self._parse(SingleDataRequestResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("SingleDataRequestResponse Validation Error: %s", e)
             return None
 
+    def insert_encoded_records(
+        self, records: Iterable[EncodedRecord | str], ETId: int
+    ) -> SubmissionResult | None:
+        """Bulk‑insert records that are already serialized JSON objects.
+
+        The submit body is assembled by joining the encoded records, so they
+        are neither decoded nor encoded again.
+
+        Args:
+            records: JSON objects as ``bytes`` (``str`` is encoded as UTF‑8).
+            ETId: Target envelope‑type ID.
+
+        Returns:
+            :class:`SubmissionResult` or ``None`` on failure.
+        """
+        codec = self._codec()
+        body = submit_body(encode_record(record, codec) for record in records)
+        response = self._submit(body, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+
+        try:
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    def insert_records_chunked(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_workers: int = 4,
+        validate: bool = False,
+    ) -> BulkSubmissionResult:
+        """Bulk‑insert a large record list as several concurrent submits.
+
+        The input is split into batches of at most ``max_rows`` records and
+        ``max_bytes`` serialized bytes, and up to ``max_workers`` batches are
+        submitted at once. A failed batch does not stop the others.
+
+        Args:
+            listOfJsonRecords: List of dictionaries already parsed from JSON,
+                or of JSON ``bytes`` records submitted without re-encoding.
+            ETId: Target envelope‑type ID.
+            max_rows: Most records per ``envelopes/submit`` call.
+            max_bytes: Most serialized bytes per call.
+            max_workers: Batches in flight at once.
+            validate: Validate every row against the table schema before the
+                first batch is sent.
+
+        Returns:
+            :class:`BulkSubmissionResult` whose ``UID`` list follows the input
+            order; rows of failed batches are ``None``.
+
+        Raises:
+            RecordValidationError: ``validate`` is set and rows are invalid.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if validate:
+            listOfJsonRecords = self.validate_records(listOfJsonRecords, ETId)
+
+        rows = encode_rows(listOfJsonRecords, self._codec())
+        batches = list(iter_batches(rows, max_rows, max_bytes))
+
+        if len(batches) <= 1 or max_workers == 1:
+            outcomes = [self._submit_batch(batch, ETId) for _, batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(batches)),
+                thread_name_prefix=f"walacor-insert-{ETId}",
+            ) as pool:
+                outcomes = list(
+                    pool.map(
+                        self._submit_batch,
+                        [batch for _, batch in batches],
+                        [ETId] * len(batches),
+                    )
+                )
+
+        return merge_batches(ETId, len(listOfJsonRecords), batches, outcomes)
+
+    def insert_records_resilient(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        validate: bool = False,
+    ) -> ResilientSubmissionResult:
+        """Bulk‑insert that commits every valid row of a partially invalid input.
+
+        Each batch is submitted whole. When the server rejects it with 422 the
+        batch is split in halves recursively until the offending rows are
+        isolated; a half is not re-submitted when its sibling went through and
+        the bad row must therefore be in it. With *k* bad rows in a batch of
+        *n* this takes about ``2k·log2(n/k)`` extra requests. Other failures
+        (network, 5xx) are not split and fail the whole batch.
+
+        Args:
+            listOfJsonRecords: Row dictionaries (or pre-encoded ``bytes``).
+            ETId: Target envelope‑type ID.
+            max_rows: Most records per initial ``envelopes/submit`` call.
+            max_bytes: Most serialized bytes per initial call.
+            validate: Validate rows locally first (see :meth:`validate_records`).
+
+        Returns:
+            :class:`ResilientSubmissionResult` with a ``UID`` per input row and
+            a :class:`RowError` per rejected row.
+        """
+        if validate:
+            listOfJsonRecords = self.validate_records(listOfJsonRecords, ETId)
+
+        report = IsolationReport(ETId, len(listOfJsonRecords))
+        rows = encode_rows(listOfJsonRecords, self._codec())
+        for offset, batch in iter_batches(rows, max_rows, max_bytes):
+            isolate(batch, offset, lambda rows: self._attempt(rows, ETId), report)
+        return report.result()
+
+    def insert_records_adaptive(
+        self,
+        listOfJsonRecords: list[dict[str, Any]],
+        ETId: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        validate: bool = False,
+        timeout: float | None = None,
+    ) -> BulkSubmissionResult:
+        """Bulk‑insert with batch sizes tuned to the table and server load.
+
+        Batches are submitted one at a time; their row count comes from the
+        :class:`AdaptiveBatchSizer` of *ETId*, which grows while per-row
+        latency improves and shrinks on timeouts, HTTP 413 and latency
+        spikes. The learned size is kept for the life of the client. A batch
+        refused with 413 is retried smaller; a timed-out batch (no answer
+        within ``timeout``, or a gateway 408/504) is reported as failed, not
+        resent, since the server may have accepted it.
+
+        Args:
+            listOfJsonRecords: Row dictionaries (or pre-encoded ``bytes``).
+            ETId: Target envelope‑type ID.
+            max_bytes: Most serialized bytes per call, whatever the size.
+            validate: Validate rows locally first (see :meth:`validate_records`).
+            timeout: Seconds to wait for each submit; ``None`` waits forever
+                and leaves only gateway timeouts to shrink the batches.
+
+        Returns:
+            :class:`BulkSubmissionResult` aligned with the input rows.
+        """
+        if validate:
+            listOfJsonRecords = self.validate_records(listOfJsonRecords, ETId)
+        return self._submit_adaptive(listOfJsonRecords, ETId, max_bytes, timeout)
+
+    def update_records_adaptive(
+        self,
+        records: list[dict[str, Any]],
+        ETId: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: float | None = None,
+    ) -> BulkSubmissionResult | None:
+        """Bulk update with adaptive batch sizes (see :meth:`insert_records_adaptive`).
+
+        Args:
+            records: Rows (dictionaries or encoded ``bytes``), each with a ``UID``.
+            ETId: Envelope‑type ID for the target table.
+            max_bytes: Most serialized bytes per call.
+            timeout: Seconds to wait for each submit.
+
+        Returns:
+            :class:`BulkSubmissionResult`, or ``None`` if a row lacks its ``UID``.
+        """
+        if not all(record_has_uid(record) for record in records):
+            logger.error("UID is required in all records for update")
+            return None
+        return self._submit_adaptive(records, ETId, max_bytes, timeout)
+
+    def batch_sizer(self, ETId: int) -> AdaptiveBatchSizer:
+        """Adaptive batch sizer of *ETId*, shared by every service on this client."""
+        return batch_sizer(self.client, ETId)
+
+    def insert_stream(
+        self,
+        records: Iterable[dict[str, Any]],
+        ETId: int,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_in_flight: int = 4,
+        on_batch: (
+            Callable[[int, list[dict[str, Any]], SubmissionResult], None] | None
+        ) = None,
+    ) -> StreamSubmissionResult:
+        """Insert records pulled lazily from any iterable.
+
+        Records are read only as fast as batches can be submitted: once
+        ``max_in_flight`` submits are pending the producer waits for one to
+        finish, so memory stays at roughly ``max_in_flight + 1`` batches
+        however long the stream is.
+
+        Args:
+            records: Iterable or generator of record dictionaries.
+            ETId: Target envelope‑type ID.
+            max_rows: Most records per ``envelopes/submit`` call.
+            max_bytes: Most serialized bytes per call.
+            max_in_flight: Submits pending at once.
+            on_batch: Called as ``on_batch(offset, batch, result)`` after each
+                successful submit, e.g. to collect UIDs. Calls may arrive out
+                of order.
+
+        Returns:
+            :class:`StreamSubmissionResult` with counts and failed batches.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive")
+
+        summary = StreamSubmissionResult(ETId=ETId)
+        codec = self._codec()
+
+        def settle(
+            offset: int, batch: list[dict[str, Any]], outcome: SubmissionResult | str
+        ) -> None:
+            if isinstance(outcome, SubmissionResult):
+                summary.Inserted += len(batch)
+                if on_batch is not None:
+                    on_batch(offset, batch, outcome)
+                return
+            logger.error(
+                "Batch of %d record(s) at offset %d failed: %s",
+                len(batch),
+                offset,
+                outcome,
+            )
+            summary.FailedBatches.append(
+                FailedBatch(Offset=offset, Count=len(batch), Error=outcome)
+            )
+
+        in_flight: dict[Future[SubmissionResult | str], tuple[int, list[Any]]] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix=f"walacor-stream-{ETId}"
+        ) as pool:
+            try:
+                for offset, pairs in iter_batches(
+                    ((record, encode_row(record, codec)) for record in records),
+                    max_rows,
+                    max_bytes,
+                    measure=lambda pair: len(pair[1]),
+                ):
+                    while len(in_flight) >= max_in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            settle(*in_flight.pop(future), future.result())
+
+                    batch = [record for record, _ in pairs]
+                    summary.Records += len(batch)
+                    summary.Batches += 1
+                    future = pool.submit(
+                        self._submit_batch, [row for _, row in pairs], ETId
+                    )
+                    in_flight[future] = (offset, batch)
+            finally:
+                for future in list(in_flight):
+                    settle(*in_flight.pop(future), future.result())
+
+        summary.FailedBatches.sort(key=lambda failed: failed.Offset)
+        return summary
+
+    def insert_jsonl(
+        self, path: str | Path, ETId: int, encoding: str = "utf-8", **kwargs: Any
+    ) -> StreamSubmissionResult:
+        """Stream a JSON Lines file into *ETId* via :meth:`insert_stream`.
+
+        Args:
+            path: File with one JSON object per line; blank lines are skipped.
+            ETId: Target envelope‑type ID.
+            encoding: File encoding.
+            **kwargs: Batching options passed to :meth:`insert_stream`.
+        """
+        return self.insert_stream(read_jsonl(path, encoding), ETId, **kwargs)
+
+    def insert_csv(
+        self,
+        path: str | Path,
+        ETId: int,
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        **kwargs: Any,
+    ) -> StreamSubmissionResult:
+        """Stream a CSV file with a header row into *ETId* via :meth:`insert_stream`.
+
+        Column values are submitted as strings.
+
+        Args:
+            path: CSV file whose first row names the fields.
+            ETId: Target envelope‑type ID.
+            encoding: File encoding.
+            delimiter: Field separator.
+            **kwargs: Batching options passed to :meth:`insert_stream`.
+        """
+        rows = read_csv(path, encoding, delimiter=delimiter)
+        return self.insert_stream(rows, ETId, **kwargs)
+
+    def _submit_batch(self, batch: list[bytes], ETId: int) -> SubmissionResult | str:
+        """Submit one batch of encoded rows; an error description instead of raising."""
+        try:
+            return batch_outcome(batch, self.insert_encoded_records(batch, ETId))
+        except Exception as e:
+            return str(e) or type(e).__name__
+
+    def batch_writer(
+        self,
+        ETId: int,
+        max_items: int = 500,
+        max_bytes: int = 1_000_000,
+        max_delay_ms: float = 50.0,
+    ) -> BatchWriter:
+        """Return the shared micro-batching writer for *ETId* (opt-in).
+
+        ``writer.submit(record)`` replaces ``insert_single_record`` on hot
+        paths: records from many callers are coalesced into one
+        ``envelopes/submit`` and each caller's future resolves to its UID.
+        The limits only apply when the writer is first created for *ETId*.
+
+        Args:
+            ETId: Envelope‑type ID of the destination table.
+            max_items: Flush once this many records are pending.
+            max_bytes: Flush once the pending records serialize to this size.
+            max_delay_ms: Flush this long after the oldest pending record.
+
+        Returns:
+            :class:`~walacor_sdk.data_requests.batch_writer.BatchWriter`.
+        """
+        with self._batch_lock:
+            writer = self._batch_writers.get(ETId)
+            if writer is None:
+                writer = BatchWriter(
+                    self,
+                    ETId,
+                    max_items=max_items,
+                    max_bytes=max_bytes,
+                    max_delay_ms=max_delay_ms,
+                )
+                self._batch_writers[ETId] = writer
+            return writer
+
+    def close_batch_writers(self) -> None:
+        """Flush and stop every writer created by :meth:`batch_writer`."""
+        with self._batch_lock:
+            writers = list(self._batch_writers.values())
+            self._batch_writers.clear()
+        for writer in writers:
+            writer.close()
+
+    # ------------------------------------------------------------------ VALIDATE
+
+    def validator(self, ETId: int, refresh: bool = False) -> RowValidator:
+        """Row validator of *ETId*, compiled from its schema on first use.
+
+        Validators are cached per ETId for the life of the service.
+
+        Args:
+            ETId: Envelope‑type ID.
+            refresh: Recompile from the current schema, e.g. after it changed.
+
+        Raises:
+            ValueError: The schema details could not be fetched.
+        """
+        with self._validator_lock:
+            cached = None if refresh else self._validators.get(ETId)
+        if cached is not None:
+            return cached
+
+        detail = SchemaService(self.client).get_schema_details_with_ETId(ETId)
+        if detail is None:
+            raise ValueError(f"Schema details of ETId {ETId} are unavailable")
+        validator = RowValidator(detail)
+        with self._validator_lock:
+            self._validators[ETId] = validator
+        return validator
+
+    def validate_records(self, records: Any, ETId: int) -> list[dict[str, Any]]:
+        """Check and coerce records against the schema of *ETId*, locally.
+
+        Types are coerced as the backend stores them (datetimes become
+        ``DATETIME(EPOCH)`` milliseconds), ``Required`` / ``MaxLength`` are
+        enforced and decimals are rounded to ``Decimals``. A
+        ``pandas.DataFrame`` is validated column-wise.
+
+        Args:
+            records: Row dictionaries or a ``pandas.DataFrame``.
+            ETId: Envelope‑type ID.
+
+        Returns:
+            The coerced rows, ready to submit.
+
+        Raises:
+            RecordValidationError: Listing every invalid field of every row.
+        """
+        validator = self.validator(ETId)
+        if is_frame(records):
+            return validator.validate_frame(records)
+        return validator.validate(records)
+
     # ------------------------------------------------------------------ UPDATE
 
     def update_single_record_with_UID(
@@ -110,17 +627,14 @@ class DataRequestsService(BaseService):
             logger.error("UID is required to update a record")
             return None
 
-        header = {"ETId": str(ETId)}
-        response = self._post(
-            "envelopes/submit", json={"Data": [record]}, headers=header
-        )
+        response = self._submit({"Data": [record]}, ETId)
 
         if not response or not response.get("success"):
             logger.error("Failed to update record")
             return None
 
         try:
-            parsed_response = SingleDataRequestResponse(**response)
+            parsed_response = self._parse(SingleDataRequestResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("SingleDataRequestResponse Validation Error: %s", e)
@@ -138,27 +652,55 @@ class DataRequestsService(BaseService):
         Returns:
             :class:`SubmissionResult` if the batch succeeds, else ``None``.
         """
+        codec = self._codec()
+        for record in records:
+            error = update_error(encode_record(record), codec)
+            if error:
+                logger.error(error)
+                return None
+
+        response = self._submit({"Data": records}, ETId)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to update records")
+            return None
+
         try:
-            for record in records:
-                parsed_record = json.loads(record)
-                if "UID" not in parsed_record:
-                    logger.error("UID is required in all records for update")
-                    return None
-        except json.JSONDecodeError as e:
-            logger.error("Invalid JSON in records: %s", e)
+            parsed_response = self._parse(SingleDataRequestResponse, response)
+            return parsed_response.data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
             return None
 
-        header = {"ETId": str(ETId)}
-        response = self._post(
-            "envelopes/submit", json={"Data": records}, headers=header
-        )
+    def update_encoded_records(
+        self, records: Iterable[EncodedRecord | str], ETId: int
+    ) -> SubmissionResult | None:
+        """Bulk update from serialized JSON objects, each containing a ``UID``.
+
+        ``UID`` presence is checked by scanning the bytes, not by parsing, and
+        the body is assembled by joining the records.
+
+        Args:
+            records: JSON objects as ``bytes`` (``str`` is encoded as UTF‑8).
+            ETId: Envelope‑type ID for the target table.
+
+        Returns:
+            :class:`SubmissionResult` if the batch succeeds, else ``None``.
+        """
+        codec = self._codec()
+        encoded = [encode_record(record, codec) for record in records]
+        if not all(has_uid(record) for record in encoded):
+            logger.error("UID is required in all records for update")
+            return None
+
+        response = self._submit(submit_body(encoded), ETId)
 
         if not response or not response.get("success"):
             logger.error("Failed to update records")
             return None
 
         try:
-            parsed_response = SingleDataRequestResponse(**response)
+            parsed_response = self._parse(SingleDataRequestResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("SingleDataRequestResponse Validation Error: %s", e)
@@ -172,6 +714,8 @@ class DataRequestsService(BaseService):
         pageNumber: int = 0,
         pageSize: int = 0,
         fromSummary: bool = False,
+        raw: bool | None = None,
+        cache: bool = True,
     ) -> list[dict[str, Any]] | None:
         """Retrieve **all** rows or a paginated slice.
 
@@ -180,27 +724,38 @@ class DataRequestsService(BaseService):
             pageNumber: 1‑based page index; ``0`` disables pagination.
             pageSize: Rows per page (*ignored* if ``pageNumber`` is ``0``).
             fromSummary: When *True* query the summary table.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+            cache: Use the client's query cache; page scans turn it off so
+                they do not evict hot entries.
 
         Returns:
             List of row dicts, or ``None``.
         """
         header = {"ETId": str(ETId)}
         query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}&fromSummary={'true' if fromSummary else 'false'}"
-        response = self._post(query, headers=header)
+        response = self._cached_post(query, ETId, headers=header, use_cache=cache)
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch all records")
             return None
 
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
         try:
-            parsed_response = GetAllRecordsResponse(**response)
+            parsed_response = self._parse(GetAllRecordsResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("GetAllRecordsResponse Validation Error: %s", e)
             return None
 
     def get_single_record_by_record_id(
-        self, record_id: dict[str, str], ETId: int, fromSummary: bool = False
+        self,
+        record_id: dict[str, str],
+        ETId: int,
+        fromSummary: bool = False,
+        raw: bool | None = None,
     ) -> list[dict[str, Any]] | None:
         """Fetch one or more records filtered by *record_id*.
 
@@ -208,48 +763,233 @@ class DataRequestsService(BaseService):
             record_id: Simple equality filter – usually ``{"UID": "…"}``.
             ETId: Envelope‑type ID of the table to query.
             fromSummary: Search summary view instead of full table.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
 
         Returns:
             Matching rows or ``None``.
         """
         header = {"ETId": str(ETId)}
         query = f"query/get?fromSummary={'true' if fromSummary else 'false'}"
-        response = self._post(query, headers=header, json=record_id)
+        response = self._cached_post(query, ETId, headers=header, json=record_id)
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch single record")
             return None
 
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
         try:
-            parsed_response = GetSingleRecordResponse(**response)
+            parsed_response = self._parse(GetSingleRecordResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("GetSingleRecordResponse Validation Error: %s", e)
             return None
 
+    def get_many_by_uid(
+        self,
+        ETId: int,
+        uids: Iterable[str],
+        fromSummary: bool = False,
+        chunk_size: int = DEFAULT_UID_CHUNK,
+    ) -> dict[str, dict[str, Any]] | None:
+        """Fetch many records by UID with one ``$in`` query per chunk.
+
+        Duplicate UIDs are sent once. If a UID matches several rows (record
+        history in the full view) the last row returned wins.
+
+        Args:
+            ETId: Envelope‑type ID of the table to query.
+            uids: UIDs to look up.
+            fromSummary: Search summary view instead of full table.
+            chunk_size: Most UIDs in one ``$in`` filter.
+
+        Returns:
+            ``{UID: row}`` for the UIDs that exist, or ``None`` if any chunk
+            failed.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        wanted = list(dict.fromkeys(uids))
+        header = {"ETId": str(ETId)}
+        query = f"query/get?fromSummary={'true' if fromSummary else 'false'}"
+        found: dict[str, dict[str, Any]] = {}
+
+        for start in range(0, len(wanted), chunk_size):
+            end = start + chunk_size
+            chunk = wanted[start:end]
+            response = self._cached_post(
+                query, ETId, headers=header, json={"UID": {"$in": chunk}}
+            )
+            if not response or not response.get("success"):
+                logger.error("Failed to fetch records by UID")
+                return None
+            rows = self._raw_rows(response)
+            if rows is None:
+                return None
+            for row in rows:
+                if isinstance(row, dict) and isinstance(row.get("UID"), str):
+                    found[row["UID"]] = row
+
+        return found
+
+    def uid_loader(
+        self,
+        ETId: int,
+        max_batch: int = DEFAULT_UID_CHUNK,
+        max_delay_ms: float = 5.0,
+        fromSummary: bool = False,
+    ) -> UIDLoader:
+        """Return the shared coalescing UID loader for *ETId* (opt-in).
+
+        ``loader.get(uid)`` replaces ``get_single_record_by_record_id`` on hot
+        paths: lookups from many threads within ``max_delay_ms`` are answered
+        by one :meth:`get_many_by_uid` query. The options only apply when the
+        loader is first created for *ETId*.
+
+        Args:
+            ETId: Envelope‑type ID of the table to query.
+            max_batch: Query once this many distinct UIDs are pending.
+            max_delay_ms: Query this long after the oldest pending lookup.
+            fromSummary: Search summary view instead of full table.
+
+        Returns:
+            :class:`~walacor_sdk.data_requests.uid_loader.UIDLoader`.
+        """
+        with self._uid_loader_lock:
+            loader = self._uid_loaders.get(ETId)
+            if loader is None:
+                loader = UIDLoader(
+                    self,
+                    ETId,
+                    max_batch=max_batch,
+                    max_delay_ms=max_delay_ms,
+                    fromSummary=fromSummary,
+                )
+                self._uid_loaders[ETId] = loader
+            return loader
+
+    def close_uid_loaders(self) -> None:
+        """Answer pending lookups and stop every loader of :meth:`uid_loader`."""
+        with self._uid_loader_lock:
+            loaders = list(self._uid_loaders.values())
+            self._uid_loaders.clear()
+        for loader in loaders:
+            loader.close()
+
+    # ------------------------------------------------------------------ READ – streaming
+
+    def stream_all(
+        self, ETId: int, fromSummary: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every row of *ETId* while the response is still downloading.
+
+        Unlike :meth:`get_all` the body is never loaded whole: it is read in
+        chunks and the ``data`` array decoded one row at a time, so memory
+        does not grow with the result size. Rows are plain dicts.
+
+        Args:
+            ETId: Envelope‑type ID.
+            fromSummary: When *True* read the summary table.
+
+        Returns:
+            Iterator over row dicts; the request is sent on first iteration.
+
+        Raises:
+            PageFetchError: While iterating, if the response does not report
+                ``success``. Rows already decoded may have been yielded when
+                ``data`` precedes ``success`` in the body.
+            APIConnectionError: While iterating, if the download breaks off.
+        """
+        header = {"ETId": str(ETId)}
+        query = f"query/get?pageNo=0&pageSize=0&fromSummary={'true' if fromSummary else 'false'}"
+        return self._stream_rows(query, header)
+
+    def stream_complex_query(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Stream the rows of a ``query/getcomplex`` *pipeline*.
+
+        See :meth:`stream_all`; the ``total`` of the response is not returned.
+
+        Args:
+            ETId: Primary collection ETId.
+            pipeline: List of pipeline stage dictionaries.
+
+        Returns:
+            Iterator over row dicts; the request is sent on first iteration.
+
+        Raises:
+            PageFetchError: See :meth:`stream_all`.
+            APIConnectionError: See :meth:`stream_all`.
+        """
+        header = {"ETId": str(ETId)}
+        return self._stream_rows("query/getcomplex", header, json=pipeline)
+
+    def _stream_rows(
+        self, endpoint: str, headers: dict[str, str], **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        response = self._post(
+            endpoint, headers=headers, parse_json=False, stream=True, **kwargs
+        )
+        parser = JsonArrayStream("data")
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+                if parser.meta.get("success") is False:
+                    break
+            else:
+                yield from parser.close()
+        except Timeout as timeout_err:
+            logger.error("Stream timed out: %s", timeout_err)
+            raise RequestTimeoutError("Walacor API did not respond in time.") from None
+        except RequestException as req_err:
+            logger.error("Stream interrupted: %s", req_err)
+            raise APIConnectionError(
+                "Connection to Walacor API lost while streaming."
+            ) from None
+        finally:
+            response.close()
+
+        if not parser.meta.get("success"):
+            logger.error("Failed to stream query results")
+            raise PageFetchError("Streamed query did not succeed")
+
     # ------------------------------------------------------------------ READ – complex/aggregate
 
     def post_complex_query(
-        self, ETId: int, pipeline: list[dict[str, Any]]
+        self, ETId: int, pipeline: list[dict[str, Any]], raw: bool | None = None
     ) -> ComplexQueryRecords | None:
         """Run an arbitrary Mongo‑style aggregation *pipeline* (``getcomplex``).
 
         Args:
             ETId: Primary collection ETId.
             pipeline: List of pipeline stage dictionaries.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
 
         Returns:
             :class:`ComplexQueryRecords` or ``None`` on failure.
         """
         header = {"ETId": str(ETId)}
-        response = self._post("query/getcomplex", headers=header, json=pipeline)
+        response = self._cached_post(
+            "query/getcomplex", ETId, headers=header, json=pipeline
+        )
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch complex query results")
             return None
 
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return ComplexQueryRecords.model_construct(Records=rows, Total=total)
+
         try:
-            parsed_response = GetComplexQueryResponse(**response)
+            parsed_response = self._parse(GetComplexQueryResponse, response)
             return ComplexQueryRecords(
                 Records=parsed_response.data, Total=parsed_response.Total
             )
@@ -257,6 +997,21 @@ class DataRequestsService(BaseService):
             logger.error("Complex Query Parsing Error: %s", e)
             return None
 
+    def query(self, ETId: int, check_fields: bool = True) -> BoundQuery:
+        """Start a fluent query of *ETId* compiling to :meth:`post_complex_query`.
+
+        Args:
+            ETId: Envelope‑type ID.
+            check_fields: Reject field names missing from the (cached) schema.
+
+        Returns:
+            :class:`~walacor_sdk.data_requests.query_builder.BoundQuery`.
+        """
+        fields = self.columnar.schema_types(ETId) if check_fields else None
+        if check_fields and not fields:
+            logger.warning("No schema for ETId %s, field names are not checked", ETId)
+        return BoundQuery(self, ETId, fields)
+
     def post_query_api(
         self,
         ETId: int,
@@ -264,6 +1019,8 @@ class DataRequestsService(BaseService):
         schemaVersion: int = 1,
         pageNumber: int = 1,
         pageSize: int = 0,
+        raw: bool | None = None,
+        cache: bool = True,
     ) -> list[str] | None:
         """Endpoint helper for the simplified *query API*.
 
@@ -273,20 +1030,29 @@ class DataRequestsService(BaseService):
             schemaVersion: `SV` header value – defaults to latest (``1``).
             pageNumber: 1‑based index of the page to retrieve.
             pageSize: Number of rows per page (``0`` = no limit).
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
+            cache: Use the client's query cache; page scans turn it off so
+                they do not evict hot entries.
 
         Returns:
             Raw JSON *strings* returned by the platform or ``None``.
         """
         headers = {"ETId": str(ETId), "SV": str(schemaVersion)}
         query = f"query/get?pageNo={pageNumber}&pageSize={pageSize}"
-        response = self._post(query, headers=headers, json=payload)
+        response = self._cached_post(
+            query, ETId, headers=headers, json=payload, use_cache=cache
+        )
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch query results")
             return None
 
+        if self._is_raw(raw):
+            return self._raw_rows(response)
+
         try:
-            parsed_response = QueryApiResponse(**response)
+            parsed_response = self._parse(QueryApiResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logger.error("QueryApiResponse Validation Error: %s", e)
@@ -298,6 +1064,7 @@ class DataRequestsService(BaseService):
         ETId: int = 10,
         schemaVersion: int = 1,
         dataVersion: int = 1,
+        raw: bool | None = None,
     ) -> QueryApiAggregate | None:
         """Wrapper for *query/getComplex* when using the **aggregate** flavour.
 
@@ -306,6 +1073,8 @@ class DataRequestsService(BaseService):
             ETId: Primary collection ETId – default ``10``.
             schemaVersion: `SV` header value.
             dataVersion: `DV` header value.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
 
         Returns:
             :class:`QueryApiAggregate` with ``Records`` and ``Total`` or ``None``.
@@ -315,14 +1084,22 @@ class DataRequestsService(BaseService):
             "SV": str(schemaVersion),
             "DV": str(dataVersion),
         }
-        response = self._post("query/getComplex", headers=headers, json=payload)
+        response = self._cached_post(
+            "query/getComplex", ETId, headers=headers, json=payload
+        )
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch aggregate results")
             return None
 
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return QueryApiAggregate.model_construct(Records=rows, Total=total)
+
         try:
-            parsed_response = QueryApiAggregateResponse(**response)
+            parsed_response = self._parse(QueryApiAggregateResponse, response)
             return QueryApiAggregate(
                 Records=parsed_response.data, Total=parsed_response.Total
             )
@@ -334,25 +1111,36 @@ class DataRequestsService(BaseService):
         self,
         pipeline: list[dict[str, Any]],
         ETId: int,
+        raw: bool | None = None,
     ) -> ComplexQMLQueryRecords | None:
         """Pass‑through helper for advanced *MQL* pipelines.
 
         Args:
             pipeline: Mongo Query Language aggregate pipeline.
             ETId: Primary collection envelope‑type ID.
+            raw: Return rows without validating them; defaults to
+                :attr:`raw_mode`.
 
         Returns:
             :class:`ComplexQMLQueryRecords` or ``None``.
         """
         header = {"ETId": str(ETId)}
-        response = self._post("query/getcomplex", headers=header, json=pipeline)
+        response = self._cached_post(
+            "query/getcomplex", ETId, headers=header, json=pipeline
+        )
 
         if not response or not response.get("success"):
             logger.error("Failed to fetch MQL query results")
             return None
 
+        if self._is_raw(raw):
+            rows, total = self._raw_rows(response), self._raw_total(response)
+            if rows is None or total is None:
+                return None
+            return ComplexQMLQueryRecords.model_construct(Records=rows, Total=total)
+
         try:
-            parsed_response = GetComplexQMLQueryResponse(**response)
+            parsed_response = self._parse(GetComplexQMLQueryResponse, response)
             return ComplexQMLQueryRecords(
                 Records=parsed_response.data, Total=parsed_response.Total
             )
@@ -360,4 +1148,393 @@ class DataRequestsService(BaseService):
             logger.error("GetComplexQMLQueryResponse Validation Error: %s", e)
             return None
 
+    # ------------------------------------------------------------------ READ – iterators
+
+    def iter_all(
+        self, ETId: int, page_size: int = 1000, fromSummary: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate every row of *ETId*, one page at a time.
+
+        The next page is fetched in the background while the current one is
+        consumed, so memory stays at about two pages.
+
+        Args:
+            ETId: Envelope‑type ID.
+            page_size: Rows requested per page.
+            fromSummary: When *True* read the summary table.
+
+        Returns:
+            Iterator over row dicts.
+
+        Raises:
+            PageFetchError: While iterating, if a page cannot be fetched.
+        """
+        return iter_pages(
+            lambda page: self.get_all(ETId, page, page_size, fromSummary, cache=False),
+            page_size,
+        )
+
+    def iter_query(
+        self,
+        ETId: int,
+        payload: dict[str, Any],
+        page_size: int = 1000,
+        schemaVersion: int = 1,
+    ) -> Iterator[str]:
+        """Lazily iterate the results of :meth:`post_query_api` page by page.
+
+        Args:
+            ETId: Envelope‑type ID.
+            payload: Query filter object.
+            page_size: Rows requested per page.
+            schemaVersion: `SV` header value.
+
+        Returns:
+            Iterator over the rows returned by the query API.
+
+        Raises:
+            PageFetchError: While iterating, if a page cannot be fetched.
+        """
+        return iter_pages(
+            lambda page: self.post_query_api(
+                ETId, payload, schemaVersion, page, page_size, cache=False
+            ),
+            page_size,
+        )
+
+    def iter_keyset(
+        self,
+        ETId: int,
+        key: str = DEFAULT_KEY,
+        page_size: int = 1000,
+        match: dict[str, Any] | None = None,
+        after: Cursor | None = None,
+        tiebreak: str | None = DEFAULT_TIEBREAK,
+    ) -> Iterator[dict[str, Any]]:
+        """Scan *ETId* in ``key`` order with keyset (cursor) pagination.
+
+        Every page is a ``query/getcomplex`` pipeline filtered on the last
+        row seen, so deep scans keep a constant cost per page and are not
+        disturbed by concurrent inserts the way ``pageNo`` offsets are. Rows
+        updated during the scan show up again later with their new version.
+
+        Args:
+            ETId: Envelope‑type ID.
+            key: Field to order by – ``UpdatedAt``, ``CreatedAt`` or ``_id``.
+            page_size: Rows requested per page.
+            match: Extra ``$match`` filter applied to every page.
+            after: Resume behind this cursor, see :meth:`Keyset.cursor`.
+            tiebreak: Second sort field making the order total; not used
+                with ``_id``.
+
+        Returns:
+            Iterator over row dicts.
+
+        Raises:
+            PageFetchError: While iterating, if a page cannot be fetched.
+        """
+        keyset = Keyset(key, tiebreak, page_size, match)
+        return iter_keyset(
+            lambda pipeline: self._complex_rows(ETId, pipeline), keyset, after
+        )
+
+    def sync_changes(
+        self,
+        ETId: int,
+        since: int | datetime | str | None = None,
+        field: str = DEFAULT_KEY,
+        page_size: int = 1000,
+        match: dict[str, Any] | None = None,
+        commit_every: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream the rows of *ETId* inserted or changed since the last sync.
+
+        Rows come in ``field`` order from a keyset scan (see
+        :meth:`iter_keyset`) starting above the watermark kept in
+        :attr:`watermarks` (in memory unless given a path, see
+        :class:`WatermarkStore`), so a repeated run only pulls the delta. The
+        watermark moves past a row once the next one is requested, every
+        ``commit_every`` rows and when the iteration ends; a run that stops
+        half-way resumes after the last row it finished (at-least-once).
+
+        Args:
+            ETId: Envelope‑type ID.
+            since: Start above this ``field`` value (epoch ms, datetime or
+                ISO string) instead of the stored watermark.
+            field: ``UpdatedAt`` for changes, ``CreatedAt`` for new rows.
+            page_size: Rows requested per page.
+            match: Extra ``$match`` filter, combined with *since* by ``$and``;
+                keep it the same between runs.
+            commit_every: Rows between watermark writes (default a page).
+
+        Returns:
+            Iterator over the changed row dicts.
+
+        Raises:
+            PageFetchError: While iterating, if a page cannot be fetched.
+        """
+        keyset, after, commit = self._sync_plan(ETId, since, field, page_size, match)
+        return committing(
+            iter_keyset(
+                lambda pipeline: self._complex_rows(ETId, pipeline), keyset, after
+            ),
+            keyset,
+            commit,
+            commit_every or page_size,
+        )
+
+    def count_records(
+        self, ETId: int, fromSummary: bool = False, cache: bool = True
+    ) -> int | None:
+        """Ask the backend for the number of rows in *ETId* (``totalReq=true``).
+
+        Args:
+            ETId: Envelope‑type ID.
+            fromSummary: When *True* count the summary table.
+            cache: Use the client's query cache; :meth:`export_all` turns it
+                off so a stale total cannot cut the export short.
+
+        Returns:
+            Row count, or ``None`` if the request fails or carries no total.
+        """
+        header = {"ETId": str(ETId)}
+        query = f"query/get?pageNo=1&pageSize=1&fromSummary={'true' if fromSummary else 'false'}&totalReq=true"
+        response = self._cached_post(query, ETId, headers=header, use_cache=cache)
+
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch record count")
+            return None
+
+        try:
+            return self._parse(GetAllRecordsResponse, response).Total
+        except ValidationError as e:
+            logger.error("GetAllRecordsResponse Validation Error: %s", e)
+            return None
+
+    def export_all(
+        self,
+        ETId: int,
+        page_size: int = 1000,
+        max_workers: int = 4,
+        fromSummary: bool = False,
+        ordered: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Pull a whole table by fetching all of its pages concurrently.
+
+        The row count is requested first, bypassing the query cache (see
+        :meth:`count_records`), then every page of ``query/get`` is fetched
+        over the pooled client by ``max_workers`` threads. Keep
+        ``max_workers`` at or below the pool's ``pool_maxsize``. Without a
+        total it falls back to :meth:`iter_all`.
+
+        Args:
+            ETId: Envelope‑type ID.
+            page_size: Rows per page.
+            max_workers: Pages fetched at once.
+            fromSummary: When *True* read the summary table.
+            ordered: Yield rows in table order; *False* yields each page as
+                soon as it arrives.
+
+        Returns:
+            Iterator over row dicts.
+
+        Raises:
+            PageFetchError: While iterating, if a page cannot be fetched.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        total = self.count_records(ETId, fromSummary, cache=False)
+        if total is None:
+            logger.warning("No total for ETId %s, exporting page by page", ETId)
+            return self.iter_all(ETId, page_size, fromSummary)
+
+        return fan_out_pages(
+            lambda page: self.get_all(ETId, page, page_size, fromSummary, cache=False),
+            page_count(total, page_size),
+            max_workers,
+            ordered,
+        )
+
+    # ------------------------------------------------------------------ helpers
+
+    def _is_raw(self, raw: bool | None) -> bool:
+        return self.raw_mode if raw is None else raw
+
+    @staticmethod
+    def _raw_rows(response: Mapping[str, Any]) -> list[Any] | None:
+        """Envelope check for raw mode: ``data`` must be a list, rows are untouched."""
+        data = response.get("data")
+        if not isinstance(data, list):
+            logger.error("Raw response has no data list")
+            return None
+        return data
+
+    def _complex_rows(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> list[Any] | None:
+        """Uncached ``getcomplex`` returning the raw rows, for scans."""
+        response = self._post(
+            "query/getcomplex", headers={"ETId": str(ETId)}, json=pipeline
+        )
+        if not response or not response.get("success"):
+            logger.error("Failed to fetch complex query results")
+            return None
+        return self._raw_rows(response)
+
+    def _sync_plan(
+        self,
+        ETId: int,
+        since: int | datetime | str | None,
+        field: str,
+        page_size: int,
+        match: dict[str, Any] | None,
+    ) -> tuple[Keyset, Cursor | None, Callable[[Cursor], None]]:
+        """Keyset, start cursor and watermark writer of a :meth:`sync_changes`."""
+        key = watermark_key(self.client.base_url, ETId, field)
+        store = self.watermarks
+        after = None
+        if since is None:
+            after = store.get(key)
+        else:
+            start = {field: {"$gt": to_epoch(since)}}
+            match = {"$and": [match, start]} if match else start
+        keyset = Keyset(field, DEFAULT_TIEBREAK, page_size, match)
+        return keyset, after, lambda cursor: store.set(key, cursor)
+
+    @staticmethod
+    def _raw_total(response: Mapping[str, Any]) -> int | None:
+        total = response.get("total")
+        if not isinstance(total, int) or isinstance(total, bool):
+            logger.error("Raw response has no integer total")
+            return None
+        return total
+
+    def _submit(
+        self,
+        body: dict[str, Any] | bytes,
+        ETId: int,
+        parse_json: bool = True,
+        timeout: float | None = None,
+    ) -> Any:
+        """POST ``envelopes/submit`` and drop cached reads of *ETId*.
+
+        A ``bytes`` body is sent as is; a ``dict`` is encoded by the client.
+        """
+        kwargs: dict[str, Any] = (
+            {"data": body} if isinstance(body, bytes) else {"json": body}
+        )
+        if not parse_json:
+            kwargs["parse_json"] = False
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        try:
+            return self._post("envelopes/submit", headers={"ETId": str(ETId)}, **kwargs)
+        finally:
+            # also on failure: the envelope may have been accepted anyway
+            self._invalidate(ETId)
+
+    def _submit_adaptive(
+        self, records: list[Any], ETId: int, max_bytes: int, timeout: float | None
+    ) -> BulkSubmissionResult:
+        sizer = batch_sizer(self.client, ETId)
+        rows = encode_rows(records, self._codec())
+        batches: list[tuple[int, list[Any]]] = []
+        outcomes: list[SubmissionResult | str] = []
+        offset = 0
+        while offset < len(rows):
+            batch = take_batch(rows, offset, sizer.size, max_bytes)
+            body = submit_body(batch)
+            started = time.monotonic()
+            outcome: SubmissionResult | str
+            try:
+                result = self._submission(self._submit(body, ETId, timeout=timeout))
+            except PayloadTooLargeError as e:
+                if len(batch) > 1:
+                    sizer.too_large(len(batch))
+                    continue
+                outcome = str(e)
+            except RequestTimeoutError as e:
+                sizer.timed_out()
+                outcome = str(e)
+            except Exception as e:
+                outcome = str(e) or type(e).__name__
+            else:
+                outcome = batch_outcome(batch, result)
+                if isinstance(outcome, SubmissionResult):
+                    sizer.record(len(batch), time.monotonic() - started)
+            batches.append((offset, batch))
+            outcomes.append(outcome)
+            offset += len(batch)
+
+        return merge_batches(ETId, len(records), batches, outcomes)
+
+    def _submission(self, response: Any) -> SubmissionResult | None:
+        """:class:`SubmissionResult` of a submit response, ``None`` on failure."""
+        if not response or not response.get("success"):
+            logger.error("Failed to insert record")
+            return None
+        try:
+            return self._parse(SingleDataRequestResponse, response).data
+        except ValidationError as e:
+            logger.error("SingleDataRequestResponse Validation Error: %s", e)
+            return None
+
+    def _attempt(self, batch: list[bytes], ETId: int) -> SubmitOutcome:
+        """One submit for the bisecting insert; a 422 is reported as rejected."""
+        try:
+            response = self._submit(submit_body(batch), ETId, parse_json=False)
+        except Exception as e:
+            return SubmitOutcome(error=str(e) or type(e).__name__)
+
+        if response.status_code == 422:
+            return SubmitOutcome(
+                error=rejection_reason(response.content), rejected=True
+            )
+
+        parsed = JsonResponse(response.content, self._codec())
+        if not parsed.get("success"):
+            return SubmitOutcome(error="Submit was not accepted")
+        try:
+            data = self._parse(SingleDataRequestResponse, parsed).data
+        except ValidationError as e:
+            return SubmitOutcome(
+                error=f"SingleDataRequestResponse Validation Error: {e}"
+            )
+
+        outcome = batch_outcome(batch, data)
+        if isinstance(outcome, str):
+            return SubmitOutcome(error=outcome)
+        return SubmitOutcome(result=outcome)
+
+    def _cached_post(
+        self,
+        endpoint: str,
+        ETId: int,
+        headers: dict[str, str],
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """POST a read, answering from :attr:`W_Client.query_cache` when set."""
+        cache = getattr(self.client, "query_cache", None)
+        if not use_cache or not isinstance(cache, QueryCache):
+            return self._post(endpoint, headers=headers, **kwargs)
+
+        key = cache_key(endpoint, ETId, headers, kwargs.get("json"))
+        body = cache.get(key)
+        if body is not None:
+            return JsonResponse(body, self._codec())
+
+        generation = cache.generation(ETId)
+        response = self._post(endpoint, headers=headers, parse_json=False, **kwargs)
+        parsed = JsonResponse(response.content, self._codec())
+        if parsed.get("success"):
+            cache.set(key, ETId, parsed.content, generation=generation)
+        return parsed
+
+    def _invalidate(self, ETId: int) -> None:
+        cache = getattr(self.client, "query_cache", None)
+        if isinstance(cache, QueryCache):
+            cache.invalidate(ETId)
+
     # ------------------------------------------------------------------ END REGION
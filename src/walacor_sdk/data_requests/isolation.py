@@ -0,0 +1,151 @@
+import json
+
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from walacor_sdk.data_requests.models.models import (
+    ResilientSubmissionResult,
+    RowError,
+    SubmissionResult,
+)
+from walacor_sdk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SubmitOutcome(NamedTuple):
+    """One ``envelopes/submit`` attempt.
+
+    ``rejected`` marks a 422: the server refused the rows themselves, so the
+    batch is worth splitting. Any other failure applies to the whole batch.
+    """
+
+    result: SubmissionResult | None = None
+    error: str | None = None
+    rejected: bool = False
+
+
+Submit = Callable[[list[Any]], SubmitOutcome]
+AsyncSubmit = Callable[[list[Any]], Awaitable[SubmitOutcome]]
+
+
+def rejection_reason(content: bytes | str | None) -> str:
+    """Best-effort message from a 422 body (``errors[0]`` or ``message``)."""
+    try:
+        body = json.loads(content or b"")
+    except (TypeError, ValueError):
+        return "Rejected by server (HTTP 422)"
+    if isinstance(body, dict):
+        errors = body.get("errors")
+        first = errors[0] if isinstance(errors, list) and errors else body
+        if isinstance(first, dict):
+            message = first.get("message") or first.get("reason")
+            if message:
+                return str(message)
+    return "Rejected by server (HTTP 422)"
+
+
+class IsolationReport:
+    """Collects per-row outcomes of a bisecting insert."""
+
+    def __init__(self, ETId: int, total: int) -> None:
+        self.ETId = ETId
+        self.uids: list[str | None] = [None] * total
+        self.submissions: list[SubmissionResult] = []
+        self.failed: list[RowError] = []
+        self.requests = 0
+
+    def accept(self, offset: int, result: SubmissionResult) -> None:
+        end = offset + len(result.UID)
+        self.uids[offset:end] = result.UID
+        self.submissions.append(result)
+
+    def reject(self, offset: int, count: int, error: str) -> None:
+        self.failed.extend(
+            RowError(Row=row, Error=error) for row in range(offset, offset + count)
+        )
+
+    def result(self) -> ResilientSubmissionResult:
+        self.failed.sort(key=lambda failed: failed.Row)
+        return ResilientSubmissionResult(
+            ETId=self.ETId,
+            UID=self.uids,
+            Submissions=self.submissions,
+            FailedRows=self.failed,
+            Requests=self.requests,
+        )
+
+
+# A segment is "suspect" when its parent was rejected but its left sibling was
+# committed as a whole: the bad row must be in it, so it is split without
+# being submitted first. This saves one request per level of the search.
+
+
+def isolate(
+    batch: list[Any],
+    offset: int,
+    submit: Submit,
+    report: IsolationReport,
+    suspect: str | None = None,
+) -> bool:
+    """Commit every valid row of *batch*, bisecting on 422.
+
+    Returns:
+        Whether the whole segment was committed by a single submit.
+    """
+    error = suspect
+    if error is None:
+        outcome = submit(batch)
+        report.requests += 1
+        if outcome.result is not None:
+            report.accept(offset, outcome.result)
+            return True
+        error = outcome.error or "Submit was not accepted"
+        if not outcome.rejected:
+            report.reject(offset, len(batch), error)
+            return False
+
+    if len(batch) == 1:
+        logger.error("Row %d rejected: %s", offset, error)
+        report.reject(offset, 1, error)
+        return False
+
+    mid = len(batch) // 2
+    left_committed = isolate(batch[:mid], offset, submit, report)
+    isolate(
+        batch[mid:], offset + mid, submit, report, error if left_committed else None
+    )
+    return False
+
+
+async def aisolate(
+    batch: list[Any],
+    offset: int,
+    submit: AsyncSubmit,
+    report: IsolationReport,
+    suspect: str | None = None,
+) -> bool:
+    """``asyncio`` counterpart of :func:`isolate`."""
+    error = suspect
+    if error is None:
+        outcome = await submit(batch)
+        report.requests += 1
+        if outcome.result is not None:
+            report.accept(offset, outcome.result)
+            return True
+        error = outcome.error or "Submit was not accepted"
+        if not outcome.rejected:
+            report.reject(offset, len(batch), error)
+            return False
+
+    if len(batch) == 1:
+        logger.error("Row %d rejected: %s", offset, error)
+        report.reject(offset, 1, error)
+        return False
+
+    mid = len(batch) // 2
+    left_committed = await aisolate(batch[:mid], offset, submit, report)
+    await aisolate(
+        batch[mid:], offset + mid, submit, report, error if left_committed else None
+    )
+    return False
@@ -0,0 +1,118 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+from walacor_sdk.utils.exceptions import PageFetchError
+
+Cursor = tuple[Any, ...]
+Pipeline = list[dict[str, Any]]
+
+KeysetFetcher = Callable[[Pipeline], list[Any] | None]
+AsyncKeysetFetcher = Callable[[Pipeline], Awaitable[list[Any] | None]]
+
+DEFAULT_KEY = "UpdatedAt"
+DEFAULT_TIEBREAK = "UID"
+
+
+class Keyset(NamedTuple):
+    """Sort key of a keyset scan and the ``getcomplex`` pipelines it issues.
+
+    Rows are ordered by ``key`` and then ``tiebreak`` (which must make the
+    order total – ``UID`` does for ``UpdatedAt``/``CreatedAt``). Each page is
+    ``$match`` on "after the last row seen", ``$sort`` and ``$limit``, so its
+    cost does not grow with the depth of the scan, and rows inserted or
+    updated meanwhile land after the cursor instead of shifting pages.
+    """
+
+    key: str = DEFAULT_KEY
+    tiebreak: str | None = DEFAULT_TIEBREAK
+    page_size: int = 1000
+    match: Mapping[str, Any] | None = None
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        if self.tiebreak is None or self.tiebreak == self.key or self.key == "_id":
+            return (self.key,)
+        return (self.key, self.tiebreak)
+
+    def pipeline(self, after: Cursor | None = None) -> Pipeline:
+        """Pipeline of the page following *after* (the first page if ``None``)."""
+        filters = [dict(self.match)] if self.match else []
+        if after is not None:
+            filters.append(self._after(after))
+
+        stages: Pipeline = []
+        if filters:
+            stages.append(
+                {"$match": filters[0] if len(filters) == 1 else {"$and": filters}}
+            )
+        stages.append({"$sort": {field: 1 for field in self.fields}})
+        stages.append({"$limit": self.page_size})
+        return stages
+
+    def cursor(self, row: Mapping[str, Any]) -> Cursor:
+        """Position of *row*; pass it as ``after`` to resume behind it."""
+        try:
+            return tuple(row[field] for field in self.fields)
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"Keyset scan needs {', '.join(self.fields)} in every row"
+            ) from None
+
+    def _after(self, after: Cursor) -> dict[str, Any]:
+        fields = self.fields
+        if len(after) != len(fields):
+            raise ValueError(f"Cursor must have {len(fields)} value(s)")
+        if len(fields) == 1:
+            return {fields[0]: {"$gt": after[0]}}
+        key, tiebreak = fields
+        return {
+            "$or": [
+                {key: {"$gt": after[0]}},
+                {key: after[0], tiebreak: {"$gt": after[1]}},
+            ]
+        }
+
+
+def _checked(after: Cursor | None, rows: list[Any] | None) -> list[Any]:
+    if rows is None:
+        raise PageFetchError(f"Keyset page after {after!r} could not be fetched")
+    return rows
+
+
+def iter_keyset(
+    fetch: KeysetFetcher, keyset: Keyset, after: Cursor | None = None
+) -> Iterator[Any]:
+    """Yield rows page by page, each page keyed on the last row of the one before.
+
+    A failed page raises :class:`~walacor_sdk.utils.exceptions.PageFetchError`
+    rather than ending the scan early.
+    """
+    if keyset.page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    while True:
+        rows = _checked(after, fetch(keyset.pipeline(after)))
+        if not rows:
+            return
+        after = keyset.cursor(rows[-1])
+        yield from rows
+        if len(rows) < keyset.page_size:
+            return
+
+
+async def aiter_keyset(
+    fetch: AsyncKeysetFetcher, keyset: Keyset, after: Cursor | None = None
+) -> AsyncIterator[Any]:
+    """``asyncio`` counterpart of :func:`iter_keyset`."""
+    if keyset.page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    while True:
+        rows = _checked(after, await fetch(keyset.pipeline(after)))
+        if not rows:
+            return
+        after = keyset.cursor(rows[-1])
+        for row in rows:
+            yield row
+        if len(rows) < keyset.page_size:
+            return
@@ -0,0 +1,557 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from collections.abc import Iterable, Mapping, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from walacor_sdk.data_requests.keyset import Keyset, iter_keyset
+from walacor_sdk.data_requests.models.models import ComplexQueryRecords, MirrorStatus
+from walacor_sdk.data_requests.mql import evaluate
+from walacor_sdk.schema.models.models import SchemaDetail
+from walacor_sdk.schema.schema_service import SchemaService
+from walacor_sdk.utils.enums import FieldType
+from walacor_sdk.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+logger = get_logger(__name__)
+
+ENGINES = ("sqlite", "duckdb")
+
+# Walacor field type -> column type per engine; unknown types are stored as text.
+_COLUMN_TYPES: dict[str, dict[str, str]] = {
+    "sqlite": {
+        FieldType.INTEGER.value: "INTEGER",
+        FieldType.DECIMAL.value: "REAL",
+        FieldType.BOOLEAN.value: "INTEGER",
+        FieldType.DATETIME_EPOCH.value: "INTEGER",
+    },
+    "duckdb": {
+        FieldType.INTEGER.value: "BIGINT",
+        FieldType.DECIMAL.value: "DOUBLE",
+        FieldType.BOOLEAN.value: "BOOLEAN",
+        FieldType.DATETIME_EPOCH.value: "BIGINT",
+    },
+}
+_TEXT = {"sqlite": "TEXT", "duckdb": "VARCHAR"}
+
+# Envelope fields every mirrored table needs, whether or not the schema lists them.
+_SYSTEM_FIELDS = {
+    "UID": FieldType.TEXT.value,
+    "SV": FieldType.INTEGER.value,
+    "IsDeleted": FieldType.BOOLEAN.value,
+    "CreatedAt": FieldType.DATETIME_EPOCH.value,
+    "UpdatedAt": FieldType.DATETIME_EPOCH.value,
+}
+
+_META = "_walacor_mirror"
+_PLAIN_TEXT = (FieldType.TEXT.value, FieldType.CRON.value)
+_NUMERIC = (
+    FieldType.INTEGER.value,
+    FieldType.DECIMAL.value,
+    FieldType.DATETIME_EPOCH.value,
+)
+
+# $match operators a SQL filter can apply to scalar columns.
+_SQL_COMPARISONS = {"$eq": "=", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def quote(name: str) -> str:
+    """SQL identifier for *name*, valid in SQLite and DuckDB."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_name(detail: SchemaDetail) -> str:
+    """Default mirror table of a schema: its ``TableName`` as an identifier."""
+    name = re.sub(r"\W", "_", detail.TableName).strip("_")
+    return name or f"etid_{detail.ETId}"
+
+
+def column_types(detail: SchemaDetail) -> dict[str, str]:
+    """Walacor data type of every mirrored column of *detail*, UID first."""
+    columns = dict(_SYSTEM_FIELDS)
+    for field in detail.Fields:
+        columns[field.FieldName] = field.DataType.upper()
+    return columns
+
+
+def to_cell(value: Any) -> Any:
+    """Stored form of a row value; arrays and objects become JSON text."""
+    if isinstance(value, list | dict):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def from_cell(data_type: str, value: Any) -> Any:
+    """Row value of a stored cell; ``NULL`` reads back as ``None``.
+
+    A stored row cannot tell an explicit ``null`` from an absent field, so
+    both come back as ``None``: ``{"f": null}`` matches them like on the
+    server and ``$project`` keeps the field.
+    """
+    if value is None:
+        return None
+    if data_type == FieldType.BOOLEAN.value:
+        return bool(value)
+    if isinstance(value, str) and data_type not in _PLAIN_TEXT:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _fits(data_type: str, value: Any) -> bool:
+    """Whether a SQL comparison of *value* with a *data_type* cell agrees with MQL."""
+    if isinstance(value, bool):
+        return data_type == FieldType.BOOLEAN.value
+    if isinstance(value, int | float):
+        return data_type in _NUMERIC
+    return isinstance(value, str) and data_type in _PLAIN_TEXT
+
+
+def _join(
+    clauses: Iterable[tuple[str, list[Any]] | None], op: str
+) -> tuple[str, list[Any]] | None:
+    parts = [clause for clause in clauses if clause is not None]
+    if len(parts) < 2:
+        return parts[0] if parts else None
+    sql = f" {op} ".join(part for part, _ in parts)
+    return f"({sql})", [param for _, params in parts for param in params]
+
+
+def _field_where(
+    column: str, data_type: str, condition: Any
+) -> tuple[str, list[Any]] | None:
+    scalar = data_type in (*_NUMERIC, *_PLAIN_TEXT, FieldType.BOOLEAN.value)
+    if not scalar:
+        return None
+    if not (isinstance(condition, dict) and any(k.startswith("$") for k in condition)):
+        condition = {"$eq": condition}
+    name = quote(column)
+    clauses: list[tuple[str, list[Any]] | None] = []
+    for op, operand in condition.items():
+        if op == "$eq" and operand is None:
+            clauses.append((f"{name} IS NULL", []))
+        elif op in _SQL_COMPARISONS and _fits(data_type, operand):
+            clauses.append((f"{name} {_SQL_COMPARISONS[op]} ?", [operand]))
+        elif (
+            op == "$in"
+            and isinstance(operand, list)
+            and operand
+            and all(value is None or _fits(data_type, value) for value in operand)
+        ):
+            values = [value for value in operand if value is not None]
+            tests: list[tuple[str, list[Any]] | None] = []
+            if values:
+                tests.append((f"{name} IN ({', '.join('?' * len(values))})", values))
+            if len(values) < len(operand):
+                tests.append((f"{name} IS NULL", []))
+            clauses.append(_join(tests, "OR"))
+    return _join(clauses, "AND")
+
+
+def sql_filter(
+    query: Mapping[str, Any], types: Mapping[str, str]
+) -> tuple[str, list[Any]] | None:
+    """SQL ``WHERE`` clause and parameters keeping every row *query* matches.
+
+    Only comparisons of scalar columns with values of their own type are
+    translated; anything else is left out, so the clause may keep more rows
+    than *query* and the ``$match`` still runs on what it returns. ``None``
+    when nothing could be translated.
+    """
+    clauses: list[tuple[str, list[Any]] | None] = []
+    for key, condition in query.items():
+        if key == "$and" and isinstance(condition, list):
+            clauses.append(_join((sql_filter(sub, types) for sub in condition), "AND"))
+        elif key == "$or" and isinstance(condition, list) and condition:
+            branches = [sql_filter(sub, types) for sub in condition]
+            if all(branch is not None for branch in branches):
+                clauses.append(_join(branches, "OR"))
+        elif key in types:
+            clauses.append(_field_where(key, types[key], condition))
+    return _join(clauses, "AND")
+
+
+def _query_fields(query: Mapping[str, Any]) -> set[str] | None:
+    fields: set[str] = set()
+    for key, condition in query.items():
+        if key in ("$and", "$or", "$nor") and isinstance(condition, list):
+            for sub in condition:
+                sub_fields = _query_fields(sub)
+                if sub_fields is None:
+                    return None
+                fields |= sub_fields
+        elif key.startswith("$"):
+            return None
+        else:
+            fields.add(key.split(".", 1)[0])
+    return fields
+
+
+def read_columns(
+    pipeline: Sequence[Mapping[str, Any]], types: Mapping[str, str]
+) -> list[str]:
+    """Columns of a mirrored table that *pipeline* can see.
+
+    With a leading inclusion ``$project`` (after an optional ``$match``) only
+    the projected fields and those the ``$match`` filters on are needed;
+    every column otherwise. ``UID`` is always read so empty projections
+    still count rows.
+    """
+    index = 1 if pipeline and "$match" in pipeline[0] else 0
+    project = pipeline[index].get("$project") if len(pipeline) > index else None
+    if not (
+        isinstance(project, dict)
+        and any(project.values())
+        and all(
+            isinstance(value, bool | int) and (value or name == "_id")
+            for name, value in project.items()
+        )
+    ):
+        return list(types)
+    needed = set(project)
+    if index:
+        fields = _query_fields(pipeline[0]["$match"])
+        if fields is None:
+            return list(types)
+        needed |= fields
+    return [column for column in types if column in needed or column == "UID"]
+
+
+def _connect(path: str, engine: str) -> Any:
+    if engine == "sqlite":
+        return sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    if engine == "duckdb":
+        try:
+            import duckdb
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "The DuckDB mirror requires duckdb. Run:  pip install duckdb"
+            ) from err
+        return duckdb.connect(path)
+    raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+
+
+class LocalMirror:
+    """Read replica of selected tables in an embedded SQLite or DuckDB file.
+
+    :meth:`add` creates one table per ETId with column types taken from its
+    ``SchemaDetail.Fields`` and loads it; :meth:`refresh` then pulls only
+    the rows changed since the last refresh through a keyset scan on
+    ``UpdatedAt``. Rows are upserted by ``UID`` and deleted rows removed.
+    Each page is applied together with the new watermark in one
+    transaction, so an interrupted refresh resumes where it stopped.
+    Calling :meth:`add` again after a schema change rebuilds the table.
+
+    Queries are plain SQL against the local database (:meth:`query`);
+    :meth:`status` reports how fresh each table is.
+    """
+
+    def __init__(
+        self,
+        service: DataRequestsService,
+        path: str = ":memory:",
+        engine: str = "sqlite",
+        page_size: int = 1000,
+    ) -> None:
+        self.service = service
+        self.engine = engine
+        self.page_size = page_size
+        self._conn = _connect(path, engine)
+        self._lock = threading.RLock()
+        self._execute(
+            f"CREATE TABLE IF NOT EXISTS {_META} ("
+            "ETId BIGINT PRIMARY KEY, TableName VARCHAR, SV BIGINT, "
+            "Columns VARCHAR, Watermark VARCHAR, RefreshedAt DOUBLE)"
+        )
+
+    # ------------------------------------------------------------------ tables
+
+    def add(
+        self, ETId: int, table: str | None = None, refresh: bool = True
+    ) -> MirrorStatus:
+        """Start mirroring *ETId* and, unless told otherwise, load it.
+
+        Args:
+            ETId: Envelope‑type ID of the table to mirror.
+            table: Local table name; defaults to the schema's ``TableName``.
+            refresh: Load the rows right away.
+
+        Returns:
+            :class:`MirrorStatus` of the table.
+
+        Raises:
+            ValueError: The schema details could not be fetched.
+        """
+        detail = SchemaService(self.service.client).get_schema_details_with_ETId(ETId)
+        if detail is None:
+            raise ValueError(f"Schema details of ETId {ETId} are unavailable")
+
+        name = table or table_name(detail)
+        columns = column_types(detail)
+        with self._lock:
+            meta = self._meta(ETId)
+            if (
+                meta is None
+                or meta[0] != name
+                or meta[1] != detail.SV
+                or json.loads(meta[2]) != columns
+            ):
+                self._create(ETId, name, detail.SV, columns, meta[0] if meta else None)
+        if refresh:
+            self.refresh(ETId)
+        return self.status(ETId)
+
+    def remove(self, ETId: int) -> None:
+        """Stop mirroring *ETId* and drop its local table."""
+        with self._lock:
+            meta = self._meta(ETId)
+            if meta is None:
+                return
+            self._execute(f"DROP TABLE IF EXISTS {quote(meta[0])}")
+            self._execute(f"DELETE FROM {_META} WHERE ETId = ?", (ETId,))
+
+    @property
+    def tables(self) -> list[int]:
+        """ETIds being mirrored."""
+        with self._lock:
+            return [row[0] for row in self._fetch(f"SELECT ETId FROM {_META}")]
+
+    def table(self, ETId: int) -> str:
+        """Local table name of *ETId*, for use in :meth:`query`."""
+        return str(self._require(ETId)[0])
+
+    # ------------------------------------------------------------------ refresh
+
+    def refresh(self, ETId: int) -> int:
+        """Apply the rows of *ETId* changed since the last refresh.
+
+        Returns:
+            Number of rows inserted, updated or deleted.
+
+        Raises:
+            PageFetchError: A page could not be fetched; the pages applied
+                before it are kept.
+        """
+        name, _, columns_json, watermark, _ = self._require(ETId)
+        columns = list(json.loads(columns_json))
+        after = tuple(json.loads(watermark)) if watermark else None
+        keyset = Keyset(page_size=self.page_size)
+
+        applied = 0
+        page: list[dict[str, Any]] = []
+        rows = iter_keyset(
+            lambda pipeline: self.service._complex_rows(ETId, pipeline), keyset, after
+        )
+        for row in rows:
+            page.append(row)
+            if len(page) >= self.page_size:
+                applied += self._apply(ETId, name, columns, keyset, page)
+                page = []
+        applied += self._apply(ETId, name, columns, keyset, page)
+        logger.info("Mirror of ETId %s refreshed: %d row(s)", ETId, applied)
+        return applied
+
+    def refresh_all(self) -> dict[int, int]:
+        """:meth:`refresh` every mirrored table."""
+        return {ETId: self.refresh(ETId) for ETId in self.tables}
+
+    def status(self, ETId: int) -> MirrorStatus:
+        """Row count, watermark and last refresh time of *ETId*."""
+        with self._lock:
+            name, sv, _, watermark, refreshed = self._require(ETId)
+            rows = self._fetch(f"SELECT COUNT(*) FROM {quote(name)}")[0][0]
+        return MirrorStatus(
+            ETId=ETId,
+            Table=name,
+            SV=sv,
+            Rows=rows,
+            Watermark=json.loads(watermark) if watermark else None,
+            RefreshedAt=refreshed,
+        )
+
+    def is_fresh(self, ETId: int, max_age: float) -> bool:
+        """Whether *ETId* was refreshed within the last *max_age* seconds."""
+        age = self.status(ETId).age
+        return age is not None and age <= max_age
+
+    # ------------------------------------------------------------------ query
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        """Run *sql* against the local database and return the rows as dicts."""
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            names = [column[0] for column in cursor.description or ()]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def aggregate(
+        self, ETId: int, pipeline: list[dict[str, Any]]
+    ) -> ComplexQueryRecords:
+        """Run a ``getcomplex`` *pipeline* over the local copy of *ETId*.
+
+        A leading ``$match`` is pushed down as a SQL filter (see
+        :func:`sql_filter`) and a leading ``$project`` limits the columns
+        read (see :func:`read_columns`), so only the rows and fields the
+        pipeline can use are loaded. They are evaluated by
+        :func:`~walacor_sdk.data_requests.mql.evaluate`, so the result can
+        be compared with :meth:`DataRequestsService.post_complex_query`.
+
+        Raises:
+            UnsupportedQueryError: The pipeline is outside the local subset.
+        """
+        name, _, columns_json, _, _ = self._require(ETId)
+        types: dict[str, str] = json.loads(columns_json)
+        names = read_columns(pipeline, types)
+        sql = f"SELECT {', '.join(map(quote, names))} FROM {quote(name)}"
+        params: list[Any] = []
+        match = pipeline[0].get("$match") if pipeline else None
+        where = sql_filter(match, types) if isinstance(match, dict) else None
+        if where is not None:
+            sql += f" WHERE {where[0]}"
+            params = where[1]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        columns = {
+            column: [from_cell(types.get(column, ""), value) for value in values]
+            for column, values in zip(names, zip(*rows) if rows else [()] * len(names))
+        }
+        records = evaluate(pipeline, columns)
+        return ComplexQueryRecords(Records=records, Total=len(records))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> LocalMirror:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        self._conn.execute(sql, params)
+
+    def _fetch(self, sql: str, params: Sequence[Any] = ()) -> list[Any]:
+        return list(self._conn.execute(sql, params).fetchall())
+
+    def _meta(self, ETId: int) -> tuple[Any, ...] | None:
+        rows = self._fetch(
+            f"SELECT TableName, SV, Columns, Watermark, RefreshedAt "
+            f"FROM {_META} WHERE ETId = ?",
+            (ETId,),
+        )
+        return tuple(rows[0]) if rows else None
+
+    def _require(self, ETId: int) -> tuple[Any, ...]:
+        with self._lock:
+            meta = self._meta(ETId)
+        if meta is None:
+            raise KeyError(f"ETId {ETId} is not mirrored; call add() first")
+        return meta
+
+    def _create(
+        self,
+        ETId: int,
+        name: str,
+        sv: int,
+        columns: dict[str, str],
+        previous: str | None,
+    ) -> None:
+        types = _COLUMN_TYPES[self.engine]
+        text = _TEXT[self.engine]
+        definitions = ", ".join(
+            f"{quote(column)} {types.get(data_type, text)}"
+            + (" PRIMARY KEY" if column == "UID" else "")
+            for column, data_type in columns.items()
+        )
+        logger.info("Creating mirror table %s for ETId %s (SV %s)", name, ETId, sv)
+        drops = [
+            (f"DROP TABLE IF EXISTS {quote(old)}", [()])
+            for old in dict.fromkeys(filter(None, (previous, name)))
+        ]
+        self._transaction(
+            [
+                *drops,
+                (f"CREATE TABLE {quote(name)} ({definitions})", [()]),
+                (f"DELETE FROM {_META} WHERE ETId = ?", [(ETId,)]),
+                (
+                    f"INSERT INTO {_META} VALUES (?, ?, ?, ?, NULL, NULL)",
+                    [(ETId, name, sv, json.dumps(columns))],
+                ),
+            ]
+        )
+
+    def _apply(
+        self,
+        ETId: int,
+        name: str,
+        columns: list[str],
+        keyset: Keyset,
+        page: list[dict[str, Any]],
+    ) -> int:
+        """Upsert one page and move the watermark in the same transaction."""
+        now = time.time()
+        if not page:
+            self._transaction(
+                [(f"UPDATE {_META} SET RefreshedAt = ? WHERE ETId = ?", [(now, ETId)])]
+            )
+            return 0
+
+        latest = {row.get("UID"): row for row in page}  # last version wins
+        deleted = [(uid,) for uid, row in latest.items() if row.get("IsDeleted")]
+        upserts = [
+            tuple(to_cell(row.get(column)) for column in columns)
+            for row in latest.values()
+            if not row.get("IsDeleted")
+        ]
+        watermark = json.dumps(list(keyset.cursor(page[-1])))
+        self._transaction(
+            [
+                (f"DELETE FROM {quote(name)} WHERE UID = ?", deleted),
+                (
+                    f"INSERT OR REPLACE INTO {quote(name)} "
+                    f"({', '.join(map(quote, columns))}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    upserts,
+                ),
+                (
+                    f"UPDATE {_META} SET Watermark = ?, RefreshedAt = ? WHERE ETId = ?",
+                    [(watermark, now, ETId)],
+                ),
+            ]
+        )
+        return len(page)
+
+    def _transaction(
+        self, statements: Iterable[tuple[str, Sequence[Sequence[Any]]]]
+    ) -> None:
+        """Run each statement once per parameter tuple, all or nothing."""
+        with self._lock:
+            self._execute("BEGIN")
+            try:
+                for sql, params in statements:
+                    if len(params) == 1:
+                        self._execute(sql, params[0])
+                    elif params:
+                        self._conn.executemany(sql, params)
+            except BaseException:
+                self._execute("ROLLBACK")
+                raise
+            self._execute("COMMIT")
@@ -13,7 +13,7 @@ class SingleDataRequestResponse(BaseResponse[SubmissionResult]):
 
 
 class GetAllRecordsResponse(BaseResponse[list[dict[str, Any]]]):
-    pass
+    Total: int | None = Field(default=None, alias="total")
 
 
 class GetSingleRecordResponse(BaseResponse[list[dict[str, Any]]]):
@@ -1,3 +1,5 @@
+import time
+
 from typing import Any
 
 from pydantic import BaseModel
@@ -10,6 +12,70 @@ class SubmissionResult(BaseModel):
     UID: list[str]
 
 
+class FailedBatch(BaseModel):
+    Offset: int
+    Count: int
+    Error: str
+
+
+class RowError(BaseModel):
+    """Why one input row was rejected; ``Row`` is its index in the input."""
+
+    Row: int
+    Field: str | None = None
+    Error: str
+
+
+class BulkSubmissionResult(BaseModel):
+    """Merged outcome of a chunked bulk insert.
+
+    ``UID`` is aligned with the input rows; rows of a failed batch are
+    ``None`` and the batch is listed in ``FailedBatches``.
+    """
+
+    ETId: int
+    UID: list[str | None]
+    Submissions: list[SubmissionResult]
+    FailedBatches: list[FailedBatch] = []
+
+    @property
+    def success(self) -> bool:
+        return not self.FailedBatches
+
+
+class ResilientSubmissionResult(BaseModel):
+    """Per-row outcome of a bisecting bulk insert.
+
+    ``UID`` is aligned with the input rows (``None`` where the row was not
+    inserted) and every such row is listed in ``FailedRows``. ``Requests``
+    counts the submits that were made.
+    """
+
+    ETId: int
+    UID: list[str | None]
+    Submissions: list[SubmissionResult]
+    FailedRows: list[RowError] = []
+    Requests: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.FailedRows
+
+
+class StreamSubmissionResult(BaseModel):
+    """Summary of a streaming insert; UIDs are handed to ``on_batch``."""
+
+    ETId: int
+    Records: int = 0
+    Inserted: int = 0
+    Batches: int = 0
+    FailedBatches: list[FailedBatch] = []
+
+    @property
+    def success(self) -> bool:
+        return not self.FailedBatches
+
+
 class ComplexQueryRecords(BaseModel):
     Records: list[dict[str, Any]]
     Total: int
@@ -23,3 +89,21 @@ class QueryApiAggregate(BaseModel):
 class ComplexQMLQueryRecords(BaseModel):
     Records: list[dict[str, Any]]
     Total: int
+
+
+class MirrorStatus(BaseModel):
+    """Freshness of one table in a :class:`LocalMirror`."""
+
+    ETId: int
+    Table: str
+    SV: int
+    Rows: int
+    Watermark: list[Any] | None = None
+    RefreshedAt: float | None = None
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last successful refresh, ``None`` if never."""
+        if self.RefreshedAt is None:
+            return None
+        return max(0.0, time.time() - self.RefreshedAt)
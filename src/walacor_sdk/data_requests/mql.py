@@ -0,0 +1,578 @@
+"""Local evaluation of Mongo-style aggregation pipelines.
+
+Pipelines as sent to ``query/getcomplex`` run against rows already on the
+client – a :class:`~walacor_sdk.data_requests.columnar.ColumnarResult`, a
+:class:`~walacor_sdk.data_requests.mirror.LocalMirror` table or a plain list
+of dicts. Data is held column by column and every stage works a whole
+column at a time: filters build a row mask, sorts and groups work on row
+indices, and only the surviving positions are gathered into new columns.
+
+Supported stages are ``$match``, ``$project``, ``$group``, ``$sort``,
+``$limit``, ``$skip``, ``$count`` and ``$unwind``. Anything else raises
+:class:`~walacor_sdk.utils.exceptions.UnsupportedQueryError`, so callers can
+fall back to the server.
+"""
+
+import json
+import operator
+import re
+
+from collections.abc import Callable, Iterable, Mapping
+from itertools import compress
+from typing import Any
+
+from walacor_sdk.utils.exceptions import UnsupportedQueryError
+
+Column = list[Any]
+Mask = list[bool]
+
+
+class _Missing:
+    """Marks a field a row does not have (unlike an explicit ``null``)."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+# ------------------------------------------------------------------ frame
+
+
+class Frame:
+    """Columns of equal length; a missing value is :data:`MISSING`."""
+
+    def __init__(self, columns: dict[str, Column], length: int) -> None:
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def of(cls, data: Any) -> "Frame":
+        """Frame of row dicts, a ``{name: column}`` mapping or a ColumnarResult."""
+        columns = getattr(data, "columns", data)
+        if isinstance(columns, Mapping):
+            frame = {name: list(values) for name, values in columns.items()}
+            return cls(frame, len(next(iter(frame.values()), [])))
+        return cls.from_rows(data)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "Frame":
+        columns: dict[str, Column] = {}
+        count = 0
+        for row in rows:
+            for name, value in row.items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [MISSING] * count
+                column.append(value)
+            count += 1
+            if len(row) != len(columns):
+                for column in columns.values():
+                    if len(column) < count:
+                        column.append(MISSING)
+        return cls(columns, count)
+
+    def column(self, path: str) -> Column:
+        """Values of *path*; dotted paths descend into embedded objects."""
+        column = self.columns.get(path)
+        if column is not None:
+            return column
+        head, _, rest = path.partition(".")
+        column = self.columns.get(head)
+        if column is None or not rest:
+            return [MISSING] * self.length
+        for key in rest.split("."):
+            column = [
+                v.get(key, MISSING) if isinstance(v, dict) else MISSING for v in column
+            ]
+        return column
+
+    def take(self, indices: list[int]) -> "Frame":
+        columns = {
+            name: [col[i] for i in indices] for name, col in self.columns.items()
+        }
+        return Frame(columns, len(indices))
+
+    def mask(self, keep: Mask) -> "Frame":
+        columns = {
+            name: list(compress(col, keep)) for name, col in self.columns.items()
+        }
+        return Frame(columns, sum(keep))
+
+    def rows(self) -> list[dict[str, Any]]:
+        names = list(self.columns)
+        return (
+            [
+                {
+                    name: value
+                    for name, value in zip(names, values)
+                    if value is not MISSING
+                }
+                for values in zip(*self.columns.values())
+            ]
+            if names
+            else [{} for _ in range(self.length)]
+        )
+
+
+# ------------------------------------------------------------------ comparison
+
+
+def _bracket(value: Any) -> int:
+    """BSON comparison order: null, numbers, strings, objects, arrays, booleans."""
+    if value is None or value is MISSING:
+        return 0
+    if isinstance(value, bool):
+        return 5
+    if isinstance(value, int | float):
+        return 1
+    if isinstance(value, str):
+        return 2
+    if isinstance(value, dict):
+        return 3
+    if isinstance(value, list):
+        return 4
+    return 6
+
+
+def sort_key(value: Any) -> tuple[int, Any]:
+    """Total order over mixed values, following the BSON brackets."""
+    bracket = _bracket(value)
+    if bracket == 0:
+        return (0, 0)
+    if bracket in (3, 4, 6):
+        return (bracket, json.dumps(value, sort_keys=True, default=str))
+    return (bracket, value)
+
+
+def _equal(value: Any, target: Any) -> bool:
+    if target is None:
+        return value is None or value is MISSING
+    return _bracket(value) == _bracket(target) and value == target
+
+
+_ORDERING: dict[str, Callable[[Any, Any], bool]] = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+
+# ------------------------------------------------------------------ $match
+
+
+Predicate = Callable[[Any], bool]
+
+
+def _element_predicate(op: str, operand: Any) -> Predicate:
+    """Test of one scalar value (arrays are expanded by the caller)."""
+    if op == "$eq":
+        return lambda v: _equal(v, operand)
+    if op in _ORDERING:
+        if operand is None:
+            # Mongo: $gte/$lte null match null and missing, $gt/$lt null nothing.
+            return lambda v: op in ("$gte", "$lte") and _bracket(v) == 0
+        compare = _ORDERING[op]
+        bracket = _bracket(operand)
+        return lambda v: _bracket(v) == bracket != 0 and compare(v, operand)
+    if op == "$in":
+        if not isinstance(operand, list):
+            raise UnsupportedQueryError("$in needs an array")
+        return lambda v: any(_equal(v, target) for target in operand)
+    if op == "$regex":
+        pattern = operand if isinstance(operand, re.Pattern) else re.compile(operand)
+        return lambda v: isinstance(v, str) and pattern.search(v) is not None
+    raise UnsupportedQueryError(f"Query operator {op} is not supported locally")
+
+
+def _any_element(pred: Predicate) -> Predicate:
+    """Mongo array semantics: an array matches if it or any element does."""
+    return lambda v: pred(v) or (isinstance(v, list) and any(pred(e) for e in v))
+
+
+def _negate(pred: Predicate) -> Predicate:
+    return lambda v: not pred(v)
+
+
+def _exists(want: bool) -> Predicate:
+    return lambda v: (v is not MISSING) == want
+
+
+def _size(length: Any) -> Predicate:
+    return lambda v: isinstance(v, list) and len(v) == length
+
+
+def _field_predicate(condition: Any) -> Predicate:
+    if not (isinstance(condition, dict) and any(k.startswith("$") for k in condition)):
+        return _any_element(_element_predicate("$eq", condition))
+
+    options = condition.get("$options", "")
+    preds: list[Predicate] = []
+    for op, operand in condition.items():
+        if op == "$options":
+            continue
+        if op == "$regex":
+            flags = sum(getattr(re, f.upper()) for f in options if f in "imsx")
+            operand = re.compile(operand, flags)
+        if op == "$ne":
+            preds.append(_negate(_any_element(_element_predicate("$eq", operand))))
+        elif op == "$nin":
+            preds.append(_negate(_any_element(_element_predicate("$in", operand))))
+        elif op == "$not":
+            preds.append(_negate(_field_predicate(operand)))
+        elif op == "$exists":
+            preds.append(_exists(bool(operand)))
+        elif op == "$size":
+            preds.append(_size(operand))
+        else:
+            preds.append(_any_element(_element_predicate(op, operand)))
+    return lambda v: all(pred(v) for pred in preds)
+
+
+def match_mask(frame: Frame, query: Mapping[str, Any]) -> Mask:
+    """Row mask of *query*, evaluated one field column at a time."""
+    mask = [True] * frame.length
+    for key, condition in query.items():
+        if key in ("$and", "$or", "$nor"):
+            masks = [match_mask(frame, sub) for sub in condition]
+            if key == "$and":
+                part = [all(values) for values in zip(*masks)] if masks else mask
+            else:
+                part = (
+                    [any(values) for values in zip(*masks)]
+                    if masks
+                    else [False] * frame.length
+                )
+                if key == "$nor":
+                    part = [not value for value in part]
+        elif key.startswith("$"):
+            raise UnsupportedQueryError(
+                f"Query operator {key} is not supported locally"
+            )
+        else:
+            pred = _field_predicate(condition)
+            part = [pred(value) for value in frame.column(key)]
+        mask = [a and b for a, b in zip(mask, part)]
+    return mask
+
+
+# ------------------------------------------------------------------ expressions
+
+
+def _arithmetic(fn: Callable[[Any, Any], Any]) -> Callable[[list[Column]], Column]:
+    def apply(args: list[Column]) -> Column:
+        out: Column = []
+        for values in zip(*args):
+            if any(
+                not isinstance(v, int | float) or isinstance(v, bool) for v in values
+            ):
+                out.append(None)
+                continue
+            result = values[0]
+            for value in values[1:]:
+                result = fn(result, value)
+            out.append(result)
+        return out
+
+    return apply
+
+
+def _divide(a: Any, b: Any) -> Any:
+    if b == 0:
+        raise UnsupportedQueryError("$divide by zero")
+    return a / b
+
+
+def _concat(args: list[Column]) -> Column:
+    return [
+        "".join(values) if all(isinstance(v, str) for v in values) else None
+        for values in zip(*args)
+    ]
+
+
+def _if_null(args: list[Column]) -> Column:
+    out = []
+    for values in zip(*args):
+        chosen = values[-1]
+        for value in values[:-1]:
+            if value is not None and value is not MISSING:
+                chosen = value
+                break
+        out.append(chosen)
+    return out
+
+
+def _unary(fn: Callable[[Any], Any]) -> Callable[[list[Column]], Column]:
+    return lambda args: [fn(v) for v in args[0]]
+
+
+_OPERATORS: dict[str, Callable[[list[Column]], Column]] = {
+    "$add": _arithmetic(operator.add),
+    "$subtract": _arithmetic(operator.sub),
+    "$multiply": _arithmetic(operator.mul),
+    "$divide": _arithmetic(_divide),
+    "$mod": _arithmetic(operator.mod),
+    "$concat": _concat,
+    "$ifNull": _if_null,
+    "$toUpper": _unary(lambda v: v.upper() if isinstance(v, str) else ""),
+    "$toLower": _unary(lambda v: v.lower() if isinstance(v, str) else ""),
+    "$size": _unary(lambda v: len(v) if isinstance(v, list) else None),
+}
+
+
+def expression(frame: Frame, expr: Any) -> Column:
+    """Evaluate an aggregation expression to a whole column."""
+    if isinstance(expr, str) and expr.startswith("$"):
+        if expr.startswith("$$"):
+            raise UnsupportedQueryError(f"Variable {expr} is not supported locally")
+        return frame.column(expr[1:])
+    if isinstance(expr, dict):
+        if len(expr) == 1:
+            ((op, arg),) = expr.items()
+            if op == "$literal":
+                return [arg] * frame.length
+            if op.startswith("$"):
+                handler = _OPERATORS.get(op)
+                if handler is None:
+                    raise UnsupportedQueryError(
+                        f"Expression operator {op} is not supported locally"
+                    )
+                args = arg if isinstance(arg, list) else [arg]
+                return handler([expression(frame, a) for a in args])
+        names = list(expr)
+        columns = [expression(frame, expr[name]) for name in names]
+        return (
+            [
+                {n: v for n, v in zip(names, values) if v is not MISSING}
+                for values in zip(*columns)
+            ]
+            if names
+            else [{} for _ in range(frame.length)]
+        )
+    if isinstance(expr, list):
+        columns = [expression(frame, item) for item in expr]
+        return (
+            [list(values) for values in zip(*columns)]
+            if expr
+            else [[] for _ in range(frame.length)]
+        )
+    return [expr] * frame.length
+
+
+# ------------------------------------------------------------------ stages
+
+
+def _match(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, dict):
+        raise UnsupportedQueryError("$match needs an object")
+    return frame.mask(match_mask(frame, spec))
+
+
+def _project(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, dict) or not spec:
+        raise UnsupportedQueryError("$project needs a non-empty object")
+    flags = {k: v for k, v in spec.items() if isinstance(v, bool | int)}
+    if any("." in name for name in spec):
+        raise UnsupportedQueryError("Dotted $project paths are not supported locally")
+
+    excluding = [k for k, v in flags.items() if not v and k != "_id"]
+    if excluding or (list(spec) == ["_id"] and not spec["_id"]):
+        if len(flags) != len(spec) or any(flags[k] for k in flags if k != "_id"):
+            raise UnsupportedQueryError("$project cannot mix exclusion and inclusion")
+        drop = set(excluding) | ({"_id"} if spec.get("_id") in (0, False) else set())
+        return Frame(
+            {k: c for k, c in frame.columns.items() if k not in drop}, frame.length
+        )
+
+    columns: dict[str, Column] = {}
+    if spec.get("_id", 1) and "_id" in frame.columns:
+        columns["_id"] = frame.columns["_id"]
+    for name, value in spec.items():
+        if name in flags:
+            if value and name != "_id":
+                columns[name] = frame.column(name)
+        else:
+            columns[name] = expression(frame, value)
+    return Frame(columns, frame.length)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ("{", tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ("[", tuple(_freeze(v) for v in value))
+    if value is MISSING:
+        return None
+    if isinstance(value, bool):
+        return ("b", value)
+    return value
+
+
+def _present(values: Iterable[Any]) -> list[Any]:
+    return [v for v in values if v is not MISSING]
+
+
+def _numbers(values: Iterable[Any]) -> list[Any]:
+    return [v for v in values if isinstance(v, int | float) and not isinstance(v, bool)]
+
+
+def _extreme(pick: Callable[..., Any]) -> Callable[[list[Any]], Any]:
+    def reduce(values: list[Any]) -> Any:
+        present = [v for v in values if v is not MISSING and v is not None]
+        return pick(present, key=sort_key) if present else None
+
+    return reduce
+
+
+def _add_to_set(values: list[Any]) -> list[Any]:
+    seen: dict[Any, Any] = {}
+    for value in _present(values):
+        seen.setdefault(_freeze(value), value)
+    return list(seen.values())
+
+
+_ACCUMULATORS: dict[str, Callable[[list[Any]], Any]] = {
+    "$sum": lambda values: sum(_numbers(values)),
+    "$avg": lambda values: (sum(n) / len(n)) if (n := _numbers(values)) else None,
+    "$min": _extreme(min),
+    "$max": _extreme(max),
+    "$first": lambda values: values[0] if values and values[0] is not MISSING else None,
+    "$last": lambda values: (
+        values[-1] if values and values[-1] is not MISSING else None
+    ),
+    "$push": _present,
+    "$addToSet": _add_to_set,
+}
+
+
+def _group(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, dict) or "_id" not in spec:
+        raise UnsupportedQueryError("$group needs an _id")
+
+    keys = expression(frame, spec["_id"])
+    groups: dict[Any, list[int]] = {}
+    for index, key in enumerate(keys):
+        groups.setdefault(_freeze(key), []).append(index)
+    members = list(groups.values())
+
+    columns: dict[str, Column] = {
+        "_id": [None if keys[rows[0]] is MISSING else keys[rows[0]] for rows in members]
+    }
+    for name, accumulator in spec.items():
+        if name == "_id":
+            continue
+        if not isinstance(accumulator, dict) or len(accumulator) != 1:
+            raise UnsupportedQueryError(f"Accumulator of {name} must have one operator")
+        ((op, arg),) = accumulator.items()
+        if op == "$count":
+            columns[name] = [len(rows) for rows in members]
+            continue
+        reduce = _ACCUMULATORS.get(op)
+        if reduce is None:
+            raise UnsupportedQueryError(f"Accumulator {op} is not supported locally")
+        values = expression(frame, arg)
+        columns[name] = [reduce([values[i] for i in rows]) for rows in members]
+    return Frame(columns, len(members))
+
+
+def _sort(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, dict) or not spec:
+        raise UnsupportedQueryError("$sort needs a non-empty object")
+    order = list(range(frame.length))
+    for field, direction in reversed(list(spec.items())):
+        if direction not in (1, -1):
+            raise UnsupportedQueryError("$sort directions must be 1 or -1")
+        column = frame.column(field)
+        order.sort(key=lambda i: sort_key(column[i]), reverse=direction == -1)
+    return frame.take(order)
+
+
+def _limit(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, int) or spec < 1:
+        raise UnsupportedQueryError("$limit needs a positive integer")
+    return frame.take(list(range(min(spec, frame.length))))
+
+
+def _skip(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, int) or spec < 0:
+        raise UnsupportedQueryError("$skip needs a non-negative integer")
+    return frame.take(list(range(spec, frame.length)))
+
+
+def _count(frame: Frame, spec: Any) -> Frame:
+    if not isinstance(spec, str) or not spec or spec.startswith("$"):
+        raise UnsupportedQueryError("$count needs a field name")
+    if not frame.length:
+        return Frame({}, 0)
+    return Frame({spec: [frame.length]}, 1)
+
+
+def _unwind(frame: Frame, spec: Any) -> Frame:
+    options = spec if isinstance(spec, dict) else {"path": spec}
+    path = options.get("path")
+    if not isinstance(path, str) or not path.startswith("$") or "." in path:
+        raise UnsupportedQueryError("$unwind needs a top-level '$field' path")
+    field = path[1:]
+    keep_empty = bool(options.get("preserveNullAndEmptyArrays"))
+    index_field = options.get("includeArrayIndex")
+
+    indices: list[int] = []
+    values: Column = []
+    positions: Column = []
+    for row, value in enumerate(frame.column(field)):
+        if isinstance(value, list) and value:
+            indices.extend([row] * len(value))
+            values.extend(value)
+            positions.extend(range(len(value)))
+        elif keep_empty and (value is None or value is MISSING or value == []):
+            indices.append(row)
+            values.append(MISSING if value == [] else value)
+            positions.append(None)
+        elif not isinstance(value, list) and value is not None and value is not MISSING:
+            indices.append(row)
+            values.append(value)
+            positions.append(None)
+
+    out = frame.take(indices)
+    out.columns[field] = values
+    if index_field:
+        out.columns[index_field] = positions
+    return out
+
+
+_STAGES: dict[str, Callable[[Frame, Any], Frame]] = {
+    "$match": _match,
+    "$project": _project,
+    "$group": _group,
+    "$sort": _sort,
+    "$limit": _limit,
+    "$skip": _skip,
+    "$count": _count,
+    "$unwind": _unwind,
+}
+
+
+def evaluate(pipeline: list[dict[str, Any]], data: Any) -> list[dict[str, Any]]:
+    """Run *pipeline* over *data* locally and return the result rows.
+
+    Args:
+        pipeline: Stage list as accepted by
+            :meth:`DataRequestsService.post_complex_query`.
+        data: Row dicts, a ``{name: column}`` mapping or a
+            :class:`~walacor_sdk.data_requests.columnar.ColumnarResult`.
+
+    Raises:
+        UnsupportedQueryError: A stage or operator outside the local subset.
+    """
+    frame = Frame.of(data)
+    for stage in pipeline:
+        if not isinstance(stage, dict) or len(stage) != 1:
+            raise UnsupportedQueryError("Each pipeline stage must have one key")
+        ((name, spec),) = stage.items()
+        handler = _STAGES.get(name)
+        if handler is None:
+            raise UnsupportedQueryError(f"Stage {name} is not supported locally")
+        frame = handler(frame, spec)
+    return frame.rows()
@@ -0,0 +1,171 @@
+import asyncio
+
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from walacor_sdk.utils.exceptions import PageFetchError
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int], list[T] | None]
+AsyncPageFetcher = Callable[[int], Awaitable[list[T] | None]]
+
+
+def _checked(page: int, rows: list[T] | None) -> list[T]:
+    if rows is None:
+        raise PageFetchError(f"Page {page} could not be fetched")
+    return rows
+
+
+def iter_pages(fetch: PageFetcher[T], page_size: int) -> Iterator[T]:
+    """Yield rows of consecutive 1-based pages, prefetching the next page.
+
+    ``fetch(page)`` is called for page *n + 1* on a background thread as soon
+    as page *n* arrives, so at most two pages are held at once. Iteration ends
+    on a short or empty page. A failed page (``fetch`` returns ``None``)
+    raises :class:`~walacor_sdk.utils.exceptions.PageFetchError` instead of
+    ending early; errors raised by ``fetch`` propagate to the consumer.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="walacor-page")
+    page = 1
+    pending = pool.submit(fetch, page)
+    try:
+        while True:
+            rows = _checked(page, pending.result())
+            if not rows:
+                return
+            last = len(rows) < page_size
+            if not last:
+                page += 1
+                pending = pool.submit(fetch, page)
+            yield from rows
+            if last:
+                return
+    finally:
+        # an abandoned iterator must not wait for the prefetch to finish
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch: AsyncPageFetcher[T], page_size: int) -> AsyncIterator[T]:
+    """``asyncio`` counterpart of :func:`iter_pages`; the prefetch is a task."""
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    async def load(page: int) -> list[T] | None:
+        return await fetch(page)
+
+    page = 1
+    pending = asyncio.ensure_future(load(page))
+    try:
+        while True:
+            rows = _checked(page, await pending)
+            if not rows:
+                return
+            last = len(rows) < page_size
+            if not last:
+                page += 1
+                pending = asyncio.ensure_future(load(page))
+            for row in rows:
+                yield row
+            if last:
+                return
+    finally:
+        if not pending.done():
+            pending.cancel()
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of pages of *page_size* rows needed for *total* rows."""
+    return -(-total // page_size) if total > 0 else 0
+
+
+def fan_out_pages(
+    fetch: PageFetcher[T], pages: int, max_workers: int, ordered: bool = True
+) -> Iterator[T]:
+    """Fetch pages ``1..pages`` concurrently and yield their rows.
+
+    At most ``2 * max_workers`` pages are requested ahead of the consumer,
+    which bounds memory. With ``ordered`` the rows come out in page order;
+    otherwise each page is yielded as soon as it arrives. A failed page
+    raises :class:`~walacor_sdk.utils.exceptions.PageFetchError`.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+
+    window = 2 * max_workers
+    pool = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="walacor-export"
+    )
+    in_flight: deque[tuple[int, Future[list[T] | None]]] = deque()
+    next_page = 1
+
+    def top_up() -> None:
+        nonlocal next_page
+        while next_page <= pages and len(in_flight) < window:
+            in_flight.append((next_page, pool.submit(fetch, next_page)))
+            next_page += 1
+
+    try:
+        top_up()
+        while in_flight:
+            if ordered:
+                page, future = in_flight.popleft()
+            else:
+                done, _ = wait(
+                    [future for _, future in in_flight], return_when=FIRST_COMPLETED
+                )
+                page, future = next(item for item in in_flight if item[1] in done)
+                in_flight.remove((page, future))
+            rows = _checked(page, future.result())
+            top_up()
+            yield from rows
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def afan_out_pages(
+    fetch: AsyncPageFetcher[T], pages: int, max_workers: int, ordered: bool = True
+) -> AsyncIterator[T]:
+    """``asyncio`` counterpart of :func:`fan_out_pages` built on tasks."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+
+    window = 2 * max_workers
+    limit = asyncio.Semaphore(max_workers)
+    in_flight: deque[tuple[int, asyncio.Task[list[T] | None]]] = deque()
+    next_page = 1
+
+    async def load(page: int) -> list[T] | None:
+        async with limit:
+            return await fetch(page)
+
+    def top_up() -> None:
+        nonlocal next_page
+        while next_page <= pages and len(in_flight) < window:
+            in_flight.append((next_page, asyncio.ensure_future(load(next_page))))
+            next_page += 1
+
+    try:
+        top_up()
+        while in_flight:
+            if ordered:
+                page, task = in_flight.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    [task for _, task in in_flight],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                page, task = next(item for item in in_flight if item[1] in done)
+                in_flight.remove((page, task))
+            rows = _checked(page, await task)
+            top_up()
+            for row in rows:
+                yield row
+    finally:
+        for _, task in in_flight:
+            task.cancel()
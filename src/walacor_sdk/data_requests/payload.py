@@ -0,0 +1,86 @@
+import re
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from walacor_sdk.utils.codec import JsonCodec, get_codec
+
+EncodedRecord = bytes | bytearray | memoryview
+
+_WHITESPACE = b" \t\n\r"
+# A ``"UID"`` key token; an escaped quote means it sits inside a string value.
+_UID_KEY = re.compile(rb'(?<!\\)"UID"[ \t\n\r]*:')
+
+# Update rows up to this size are decoded to validate them; larger ones are
+# only byte-scanned, so malformed JSON in them is left for the backend to reject.
+VALIDATE_MAX_BYTES = 64 * 1024
+
+_DATA_OPEN = b'{"Data":['
+_DATA_CLOSE = b"]}"
+
+
+def encode_record(
+    record: EncodedRecord | str | dict[str, Any], codec: JsonCodec | None = None
+) -> bytes:
+    """Return *record* as JSON bytes; already-encoded input is not re-encoded.
+
+    ``bytes`` and ``str`` are taken as the text of an encoded JSON object
+    (``str`` is UTF‑8 encoded), never as a string value. Dicts are encoded
+    with *codec*, the process-wide one if unset.
+    """
+    if isinstance(record, bytes):
+        return record
+    if isinstance(record, bytearray | memoryview):
+        return bytes(record)
+    if isinstance(record, str):
+        return record.encode("utf-8")
+    return (codec or get_codec()).dumps(record)
+
+
+def is_object(record: EncodedRecord) -> bool:
+    """Cheap shape check: *record* starts with ``{`` and ends with ``}``."""
+    data = bytes(record).strip(_WHITESPACE)
+    return data[:1] == b"{" and data[-1:] == b"}"
+
+
+def has_uid(record: EncodedRecord) -> bool:
+    """Whether the encoded object has a ``UID`` key, found by a byte scan.
+
+    The record is not parsed, so a ``UID`` key of a nested object also
+    matches; the backend still rejects such rows.
+    """
+    return _UID_KEY.search(record) is not None
+
+
+def record_has_uid(record: EncodedRecord | Mapping[str, Any]) -> bool:
+    """``UID`` check for a decoded row or, by byte scan, an encoded one."""
+    if isinstance(record, EncodedRecord):
+        return has_uid(record)
+    return "UID" in record
+
+
+def update_error(record: EncodedRecord, codec: JsonCodec | None = None) -> str | None:
+    """Why *record* cannot be sent as an update row, ``None`` when it can.
+
+    Records up to :data:`VALIDATE_MAX_BYTES` are decoded with *codec*, so
+    invalid JSON is caught before the request; larger ones get the
+    :func:`is_object` and :func:`has_uid` scans only.
+    """
+    if len(record) <= VALIDATE_MAX_BYTES:
+        try:
+            row = (codec or get_codec()).loads(record)
+        except ValueError as e:
+            return f"Invalid JSON in records: {e}"
+        if not isinstance(row, dict):
+            return "Invalid JSON in records: expected a JSON object"
+        return None if "UID" in row else "UID is required in all records for update"
+    if not is_object(record):
+        return "Invalid JSON in records: expected a JSON object"
+    if not has_uid(record):
+        return "UID is required in all records for update"
+    return None
+
+
+def submit_body(records: Iterable[EncodedRecord]) -> bytes:
+    """Assemble the ``envelopes/submit`` body by joining encoded records."""
+    return b"".join((_DATA_OPEN, b",".join(records), _DATA_CLOSE))
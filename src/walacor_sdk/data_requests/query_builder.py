@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import copy
+import difflib
+
+from collections.abc import Collection, Mapping
+from typing import TYPE_CHECKING, Any, Self
+
+from walacor_sdk.data_requests.columnar import ColumnarResult
+from walacor_sdk.data_requests.models.models import ComplexQueryRecords
+from walacor_sdk.data_requests.mql import evaluate
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.async_data_requests_service import (
+        AsyncDataRequestsService,
+    )
+    from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+# Fields every envelope carries, whether or not the schema lists them.
+ENVELOPE_FIELDS = frozenset(
+    {
+        "_id",
+        "UID",
+        "SV",
+        "EId",
+        "ES",
+        "ORGId",
+        "SL",
+        "IsDeleted",
+        "CreatedAt",
+        "UpdatedAt",
+        "LastModifiedBy",
+    }
+)
+
+_COMPARISONS = {
+    "==": "$eq",
+    "!=": "$ne",
+    ">": "$gt",
+    ">=": "$gte",
+    "<": "$lt",
+    "<=": "$lte",
+    "in": "$in",
+    "not in": "$nin",
+    "regex": "$regex",
+    "exists": "$exists",
+}
+
+
+class QueryBuilder:
+    """Fluent, immutable builder of ``getcomplex`` pipelines for one table.
+
+    Field names are checked against the table schema as the query is built,
+    so a typo fails here instead of silently matching nothing. The compiled
+    pipeline always puts the filters first, then sort, skip and limit, and
+    ends with a ``$project`` of the selected fields, so the server only
+    returns the rows and columns that were asked for.
+
+    Example::
+
+        q = (
+            wal.data_requests.query(654321)
+            .where("Status", "==", "active")
+            .where("Amount", ">", 100)
+            .select("UID", "Amount")
+            .order_by("-Amount")
+            .limit(50)
+        )
+        q.pipeline()  # -> [{"$match": …}, {"$sort": …}, {"$limit": 50}, {"$project": …}]
+    """
+
+    def __init__(self, ETId: int, fields: Collection[str] | None = None) -> None:
+        self.ETId = ETId
+        self.fields = frozenset(fields) | ENVELOPE_FIELDS if fields else None
+        self._filters: tuple[dict[str, Any], ...] = ()
+        self._selected: tuple[str, ...] = ()
+        self._order: tuple[tuple[str, int], ...] = ()
+        self._skip = 0
+        self._limit: int | None = None
+
+    # ------------------------------------------------------------------ building
+
+    def where(self, field: str, op: str, value: Any) -> Self:
+        """Add ``field <op> value``; *op* is one of ``== != > >= < <= in``,
+        ``not in``, ``regex`` or ``exists``. Conditions are combined with AND.
+        """
+        operator = _COMPARISONS.get(op)
+        if operator is None:
+            raise ValueError(
+                f"Unknown operator {op!r}; use one of {list(_COMPARISONS)}"
+            )
+        if operator in ("$in", "$nin") and not isinstance(value, list | tuple | set):
+            raise ValueError(f"{op!r} needs a list of values")
+        self._check(field)
+        if isinstance(value, tuple | set):
+            value = list(value)
+        condition = value if operator == "$eq" else {operator: value}
+        return self._copy(_filters=(*self._filters, {field: condition}))
+
+    def match(self, query: Mapping[str, Any]) -> Self:
+        """Add a raw ``$match`` filter; its top-level field names are checked."""
+        self._check_query(query)
+        return self._copy(_filters=(*self._filters, dict(query)))
+
+    def select(self, *fields: str) -> Self:
+        """Return only *fields* (``_id`` is left out unless selected).
+
+        Only top-level fields can be selected, so the same query runs on the
+        server and through :meth:`evaluate` or a local mirror.
+        """
+        for field in fields:
+            if "." in field:
+                raise ValueError(
+                    f"Cannot select {field!r}; select the top-level field "
+                    f"{field.split('.', 1)[0]!r} instead"
+                )
+            self._check(field)
+        return self._copy(_selected=tuple(dict.fromkeys((*self._selected, *fields))))
+
+    def order_by(self, *fields: str) -> Self:
+        """Sort by *fields*; prefix a name with ``-`` for descending."""
+        order = []
+        for field in fields:
+            name = field.lstrip("-")
+            self._check(name)
+            order.append((name, -1 if field.startswith("-") else 1))
+        return self._copy(_order=(*self._order, *order))
+
+    def skip(self, count: int) -> Self:
+        if count < 0:
+            raise ValueError("skip must be non-negative")
+        return self._copy(_skip=count)
+
+    def limit(self, count: int) -> Self:
+        if count < 1:
+            raise ValueError("limit must be positive")
+        return self._copy(_limit=count)
+
+    # ------------------------------------------------------------------ compiling
+
+    def filter(self) -> dict[str, Any]:
+        """The combined ``$match`` filter (``{}`` when unfiltered)."""
+        merged: dict[str, Any] = {}
+        rest: list[dict[str, Any]] = []
+        for query in self._filters:
+            if any(key in merged for key in query):
+                rest.append(query)
+            else:
+                merged.update(query)
+        if not rest:
+            return merged
+        return {"$and": [merged, *rest]}
+
+    def pipeline(self) -> list[dict[str, Any]]:
+        """Compile to a stage list for ``post_complex_query``/``getcomplex``."""
+        stages: list[dict[str, Any]] = []
+        query = self.filter()
+        if query:
+            stages.append({"$match": query})
+        if self._order:
+            stages.append({"$sort": dict(self._order)})
+        if self._skip:
+            stages.append({"$skip": self._skip})
+        if self._limit is not None:
+            stages.append({"$limit": self._limit})
+        if self._selected:
+            projection: dict[str, Any] = {field: 1 for field in self._selected}
+            if "_id" not in projection:
+                projection["_id"] = 0
+            stages.append({"$project": projection})
+        return stages
+
+    def count_pipeline(self) -> list[dict[str, Any]]:
+        """Pipeline counting the matching rows as ``{"count": n}``."""
+        query = self.filter()
+        return (
+            [{"$match": query}, {"$count": "count"}] if query else [{"$count": "count"}]
+        )
+
+    def evaluate(self, data: Any) -> list[dict[str, Any]]:
+        """Run the query over local rows, see :func:`mql.evaluate`."""
+        return evaluate(self.pipeline(), data)
+
+    # ------------------------------------------------------------------ internals
+
+    def _copy(self, **changes: Any) -> Self:
+        clone = copy.copy(self)
+        clone.__dict__.update(changes)
+        return clone
+
+    def _check(self, field: str) -> None:
+        if self.fields is None:
+            return
+        head = field.split(".", 1)[0]
+        if head not in self.fields:
+            close = difflib.get_close_matches(head, self.fields, n=1)
+            hint = f"; did you mean {close[0]!r}?" if close else ""
+            raise ValueError(f"ETId {self.ETId} has no field {head!r}{hint}")
+
+    def _check_query(self, query: Mapping[str, Any]) -> None:
+        for key, value in query.items():
+            if key in ("$and", "$or", "$nor"):
+                for sub in value:
+                    self._check_query(sub)
+            elif not key.startswith("$"):
+                self._check(key)
+
+
+def _count(rows: list[Any] | None) -> int | None:
+    if rows is None:
+        return None
+    return int(rows[0]["count"]) if rows else 0
+
+
+class BoundQuery(QueryBuilder):
+    """:class:`QueryBuilder` that runs through a :class:`DataRequestsService`."""
+
+    def __init__(
+        self,
+        service: DataRequestsService,
+        ETId: int,
+        fields: Collection[str] | None = None,
+    ) -> None:
+        super().__init__(ETId, fields)
+        self.service = service
+
+    def fetch(self, raw: bool | None = None) -> ComplexQueryRecords | None:
+        """Run the pipeline with :meth:`DataRequestsService.post_complex_query`."""
+        return self.service.post_complex_query(self.ETId, self.pipeline(), raw)
+
+    def columnar(self) -> ColumnarResult | None:
+        """Run the pipeline and return the result column by column."""
+        return self.service.columnar.post_complex_query(self.ETId, self.pipeline())
+
+    def count(self) -> int | None:
+        """Number of rows matching the filters (skip, limit and select ignored)."""
+        rows = self.service._complex_rows(self.ETId, self.count_pipeline())
+        return _count(rows)
+
+
+class AsyncBoundQuery(QueryBuilder):
+    """:class:`QueryBuilder` that runs through an ``AsyncDataRequestsService``."""
+
+    def __init__(
+        self,
+        service: AsyncDataRequestsService,
+        ETId: int,
+        fields: Collection[str] | None = None,
+    ) -> None:
+        super().__init__(ETId, fields)
+        self.service = service
+
+    async def fetch(self, raw: bool | None = None) -> ComplexQueryRecords | None:
+        """See :meth:`BoundQuery.fetch`."""
+        return await self.service.post_complex_query(self.ETId, self.pipeline(), raw)
+
+    async def count(self) -> int | None:
+        """See :meth:`BoundQuery.count`."""
+        rows = await self.service._complex_rows(self.ETId, self.count_pipeline())
+        return _count(rows)
@@ -0,0 +1,33 @@
+import csv
+import json
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+def read_jsonl(path: str | Path, encoding: str = "utf-8") -> Iterator[dict[str, Any]]:
+    """Lazily yield one record per non-blank line of a JSON Lines file."""
+    with open(path, encoding=encoding) as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON – {e.msg}") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_no}: expected a JSON object")
+            yield record
+
+
+def read_csv(
+    path: str | Path, encoding: str = "utf-8", **fmtparams: Any
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield one record per CSV row, keyed by the header line.
+
+    Values are kept as strings; *fmtparams* go to :class:`csv.DictReader`
+    (``delimiter``, ``quotechar`` …).
+    """
+    with open(path, encoding=encoding, newline="") as fh:
+        yield from csv.DictReader(fh, **fmtparams)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from concurrent.futures import Future
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from walacor_sdk.utils.exceptions import RecordLookupError
+from walacor_sdk.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+logger = get_logger(__name__)
+
+Row = dict[str, Any]
+
+# UIDs per ``$in`` filter; keeps the query body well under request limits.
+DEFAULT_UID_CHUNK = 500
+
+
+class UIDLoader:
+    """Coalesce single-UID lookups for **one** ETId into batched queries.
+
+    Threads call :meth:`load` (or the blocking :meth:`get`); UIDs requested
+    within ``max_delay_ms`` of the first pending one – or until ``max_batch``
+    distinct UIDs are pending – are fetched with one
+    :meth:`DataRequestsService.get_many_by_uid` call, and every caller's
+    future resolves to its own row (``None`` if the UID does not exist).
+    Concurrent lookups of the same UID share one slot in the batch.
+    """
+
+    def __init__(
+        self,
+        service: DataRequestsService,
+        ETId: int,
+        max_batch: int = DEFAULT_UID_CHUNK,
+        max_delay_ms: float = 5.0,
+        fromSummary: bool = False,
+    ) -> None:
+        if max_batch < 1 or max_delay_ms < 0:
+            raise ValueError("max_batch must be positive and max_delay_ms non-negative")
+
+        self.service = service
+        self.ETId = ETId
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.fromSummary = fromSummary
+
+        self._pending: dict[str, list[Future[Row | None]]] = {}
+        self._oldest: float | None = None
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"walacor-uid-loader-{ETId}", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------ public
+
+    def load(self, uid: str) -> Future[Row | None]:
+        """Queue a lookup of *uid* and return the future of its row."""
+        future: Future[Row | None] = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("UIDLoader is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.setdefault(uid, []).append(future)
+            self._cond.notify()
+        return future
+
+    def get(self, uid: str, timeout: float | None = None) -> Row | None:
+        """Blocking :meth:`load`."""
+        return self.load(uid).result(timeout)
+
+    def close(self) -> None:
+        """Resolve pending lookups and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct UIDs waiting for the next query."""
+        with self._cond:
+            return len(self._pending)
+
+    def __enter__(self) -> UIDLoader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _take(self) -> dict[str, list[Future[Row | None]]]:
+        """Detach up to ``max_batch`` pending UIDs; caller holds the lock."""
+        batch: dict[str, list[Future[Row | None]]] = {}
+        for uid in list(self._pending)[: self.max_batch]:
+            batch[uid] = self._pending.pop(uid)
+        self._oldest = time.monotonic() if self._pending else None
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if len(self._pending) >= self.max_batch:
+                        break
+                    if self._oldest is not None:
+                        remaining = self._oldest + self.max_delay - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+                batch = self._take()
+            self._fetch(batch)
+
+    def _fetch(self, batch: dict[str, list[Future[Row | None]]]) -> None:
+        live = {
+            uid: [f for f in futures if f.set_running_or_notify_cancel()]
+            for uid, futures in batch.items()
+        }
+        live = {uid: futures for uid, futures in live.items() if futures}
+        if not live:
+            return
+
+        try:
+            rows = self.service.get_many_by_uid(
+                self.ETId, list(live), fromSummary=self.fromSummary
+            )
+        except Exception as exc:
+            logger.error("UID lookup for ETId %s failed: %s", self.ETId, exc)
+            rows = None
+            error: Exception = exc
+        else:
+            error = RecordLookupError(
+                f"Lookup of {len(live)} UID(s) in ETId {self.ETId} failed"
+            )
+
+        for uid, futures in live.items():
+            for future in futures:
+                if rows is None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(rows.get(uid))
@@ -0,0 +1,330 @@
+import math
+import operator
+
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, date, datetime, time, timedelta
+from numbers import Real
+from typing import Any, NamedTuple
+
+from walacor_sdk.data_requests.models.models import RowError
+from walacor_sdk.schema.models.models import SchemaDetail, SchemaField
+from walacor_sdk.utils.enums import FieldType
+from walacor_sdk.utils.exceptions import RecordValidationError
+
+Converter = Callable[[Any], Any]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+_TRUE = {"true", "1", "yes"}
+_FALSE = {"false", "0", "no"}
+
+
+# ------------------------------------------------------------------ converters
+
+
+def to_integer(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("expected an integer, got a boolean")
+    try:
+        return operator.index(value)
+    except TypeError:
+        pass
+    if isinstance(value, Real):
+        number = float(value)
+        if number.is_integer():
+            return int(number)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"expected an integer, got {value!r}")
+
+
+def to_decimal(decimals: int | None) -> Converter:
+    def convert(value: Any) -> float:
+        if isinstance(value, bool):
+            raise ValueError("expected a number, got a boolean")
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"expected a number, got {value!r}") from None
+        if not math.isfinite(number):
+            raise ValueError(f"expected a finite number, got {value!r}")
+        return number if decimals is None else round(number, decimals)
+
+    return convert
+
+
+def to_text(max_length: int | None) -> Converter:
+    def convert(value: Any) -> str:
+        if isinstance(value, str):
+            text = value
+        elif isinstance(value, Real) and not isinstance(value, bool):
+            text = str(value)
+        else:
+            raise ValueError(f"expected a string, got {type(value).__name__}")
+        if max_length is not None and len(text) > max_length:
+            raise ValueError(f"longer than {max_length} characters")
+        return text
+
+    return convert
+
+
+def to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | float) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE or lowered in _FALSE:
+            return lowered in _TRUE
+    if type(value).__name__ == "bool_":  # numpy.bool_
+        return bool(value)
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def to_epoch(value: Any) -> int:
+    """``DATETIME(EPOCH)`` value: milliseconds since the Unix epoch.
+
+    Naive datetimes and ISO strings without an offset are taken as UTC.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(f"expected an ISO datetime, got {value!r}") from None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return (value - _EPOCH) // _MILLISECOND
+    return to_integer(value)
+
+
+def to_array(value: Any) -> list[Any]:
+    if isinstance(value, list | tuple):
+        return list(value)
+    raise ValueError(f"expected an array, got {type(value).__name__}")
+
+
+def converter_for(field: SchemaField) -> Converter | None:
+    """Compile the coercion of one schema field; ``None`` passes values through."""
+    data_type = field.DataType.upper()
+    if data_type == FieldType.INTEGER.value:
+        return to_integer
+    if data_type == FieldType.DECIMAL.value:
+        return to_decimal(field.Decimals)
+    if data_type in (FieldType.TEXT.value, FieldType.CRON.value):
+        return to_text(field.MaxLength)
+    if data_type == FieldType.BOOLEAN.value:
+        return to_boolean
+    if data_type == FieldType.DATETIME_EPOCH.value:
+        return to_epoch
+    if data_type == FieldType.ARRAY.value:
+        return to_array
+    return None
+
+
+# ------------------------------------------------------------------ validator
+
+
+class _CompiledField(NamedTuple):
+    name: str
+    data_type: str
+    required: bool
+    convert: Converter | None
+    field: SchemaField
+
+
+class RowValidator:
+    """Validator/encoder compiled once from a table's :class:`SchemaDetail`.
+
+    Every row is checked against ``DataType``, ``Required``, ``MaxLength`` and
+    ``Decimals``; values are coerced to what the backend stores (numeric
+    strings to numbers, datetimes to ``DATETIME(EPOCH)`` milliseconds …).
+    System-generated fields and fields not in the schema pass through.
+    """
+
+    def __init__(self, detail: SchemaDetail) -> None:
+        self.ETId = detail.ETId
+        self.SV = detail.SV
+        self._fields = [
+            _CompiledField(
+                field.FieldName,
+                field.DataType.upper(),
+                bool(field.Required),
+                converter_for(field),
+                field,
+            )
+            for field in detail.Fields
+            if not field.SystemGenerated
+        ]
+
+    def validate_row(
+        self, row: Mapping[str, Any], index: int, errors: list[RowError]
+    ) -> dict[str, Any]:
+        """Coerced copy of *row*; problems are appended to *errors*."""
+        out = dict(row)
+        for name, _, required, convert, _ in self._fields:
+            value = out.get(name)
+            if value is None:
+                if required:
+                    errors.append(RowError(Row=index, Field=name, Error="required"))
+                continue
+            if convert is None:
+                continue
+            try:
+                out[name] = convert(value)
+            except (TypeError, ValueError) as e:
+                errors.append(RowError(Row=index, Field=name, Error=str(e)))
+        return out
+
+    def validate(self, rows: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """Validate a whole batch; raises :class:`RecordValidationError`.
+
+        All rows are checked before raising so the error lists every problem.
+        """
+        errors: list[RowError] = []
+        out = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, Mapping):
+                errors.append(RowError(Row=index, Error="expected a JSON object"))
+                continue
+            out.append(self.validate_row(row, index, errors))
+        if errors:
+            raise RecordValidationError(errors)
+        return out
+
+    def validate_frame(self, frame: Any) -> list[dict[str, Any]]:
+        """Validate a ``pandas.DataFrame`` column by column.
+
+        Scalar types are coerced with vectorized pandas operations; array and
+        unknown fields fall back to the per-value converters.
+        """
+        try:
+            import pandas as pd
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "DataFrame validation requires pandas. Run:  pip install pandas"
+            ) from err
+
+        frame = frame.reset_index(drop=True)
+        errors: list[RowError] = []
+        columns: dict[str, Any] = {name: frame[name] for name in frame.columns}
+
+        for name, data_type, required, convert, field in self._fields:
+            if name not in columns:
+                if required:
+                    errors.extend(
+                        RowError(Row=index, Field=name, Error="required")
+                        for index in range(len(frame))
+                    )
+                continue
+            column = columns[name]
+            missing = column.isna()
+            if required:
+                errors.extend(
+                    RowError(Row=int(index), Field=name, Error="required")
+                    for index in missing[missing].index
+                )
+            if convert is None:
+                continue
+            converted, bad = _convert_series(pd, data_type, field, column, missing)
+            if bad is None:
+                converted, bad = _map_series(pd, convert, column, missing)
+            for index in bad[bad].index:
+                errors.append(
+                    RowError(
+                        Row=int(index),
+                        Field=name,
+                        Error=f"cannot convert {column[index]!r} to {data_type}",
+                    )
+                )
+            columns[name] = converted
+
+        if errors:
+            errors.sort(key=lambda error: error.Row)
+            raise RecordValidationError(errors)
+
+        out = pd.DataFrame(columns).astype(object)
+        records: list[dict[str, Any]] = out.where(out.notna(), None).to_dict("records")
+        return records
+
+
+def _convert_series(
+    pd: Any, data_type: str, field: SchemaField, column: Any, missing: Any
+) -> tuple[Any, Any]:
+    """Vectorized coercion of one column; ``(None, None)`` if not supported."""
+    if data_type == FieldType.INTEGER.value:
+        if pd.api.types.is_bool_dtype(column):
+            return column, ~missing
+        numbers = pd.to_numeric(column, errors="coerce")
+        bad = (numbers.isna() | (numbers % 1 != 0)) & ~missing
+        return numbers.where(~bad).astype("Int64"), bad
+    if data_type == FieldType.DECIMAL.value:
+        if pd.api.types.is_bool_dtype(column):
+            return column, ~missing
+        numbers = pd.to_numeric(column, errors="coerce").astype("float64")
+        bad = (numbers.isna() | numbers.abs().eq(float("inf"))) & ~missing
+        if field.Decimals is not None:
+            numbers = numbers.round(field.Decimals)
+        return numbers, bad
+    if data_type in (FieldType.TEXT.value, FieldType.CRON.value):
+        if (
+            not (pd.api.types.is_string_dtype(column) or column.dtype == object)
+            or not column[~missing].map(lambda v: isinstance(v, str)).all()
+        ):
+            return None, None
+        bad = column.str.len().gt(field.MaxLength or math.inf) & ~missing
+        return column, bad
+    if data_type == FieldType.BOOLEAN.value:
+        if pd.api.types.is_bool_dtype(column):
+            return column, pd.Series(False, index=column.index)
+        return None, None
+    if data_type == FieldType.DATETIME_EPOCH.value:
+        if pd.api.types.is_integer_dtype(column):
+            return column, pd.Series(False, index=column.index)
+        if pd.api.types.is_datetime64_any_dtype(column):
+            stamps = column
+        elif column[~missing].map(lambda v: isinstance(v, str)).all():
+            stamps = pd.to_datetime(column, errors="coerce", format="ISO8601")
+        else:
+            return None, None
+        if getattr(stamps.dt, "tz", None) is None:
+            stamps = stamps.dt.tz_localize("UTC")
+        bad = stamps.isna() & ~missing
+        epoch = pd.Timestamp(0, tz="UTC")
+        millis = (stamps - epoch) // pd.Timedelta(milliseconds=1)
+        return millis.astype("Int64"), bad
+    return None, None
+
+
+def _map_series(
+    pd: Any, convert: Converter, column: Any, missing: Any
+) -> tuple[Any, Any]:
+    """Per-value fallback for columns without a vectorized conversion."""
+    values: list[Any] = []
+    bad: list[bool] = []
+    for value, is_missing in zip(column, missing):
+        if is_missing:
+            values.append(None)
+            bad.append(False)
+            continue
+        try:
+            values.append(convert(value))
+            bad.append(False)
+        except (TypeError, ValueError):
+            values.append(None)
+            bad.append(True)
+    return (
+        pd.Series(values, index=column.index, dtype=object),
+        pd.Series(bad, index=column.index),
+    )
+
+
+def is_frame(records: Any) -> bool:
+    """Whether *records* looks like a ``pandas.DataFrame``."""
+    return hasattr(records, "columns") and hasattr(records, "to_dict")
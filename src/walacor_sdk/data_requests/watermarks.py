@@ -0,0 +1,179 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from walacor_sdk.data_requests.keyset import Cursor, Keyset
+from walacor_sdk.utils.logger import get_logger
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+logger = get_logger(__name__)
+
+# Directory of the default watermark file; without it (and without an explicit
+# path) watermarks are only kept in memory.
+STATE_DIR_ENV = "WALACOR_SDK_STATE_DIR"
+
+
+def watermark_key(server: str, ETId: int, field: str) -> str:
+    """Store key of the watermark of *field* in *ETId* on *server*."""
+    return f"{server.rstrip('/')}#{ETId}#{field}"
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock on *path*'s ``.lock`` sidecar, held across processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a+b") as fh:
+        if sys.platform == "win32":  # pragma: no cover
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class WatermarkStore:
+    """Small JSON file remembering how far each change sync has got.
+
+    A watermark is the keyset cursor of the last row handed out – the sync
+    field's value plus its tiebreak – so rows sharing a timestamp are
+    neither skipped nor repeated. Updates hold a lock file, so processes
+    sharing the file do not lose each other's watermarks, and replace the
+    file atomically.
+
+    Without *path* the file is ``watermarks.json`` in ``$WALACOR_SDK_STATE_DIR``;
+    when that is unset too, watermarks live in memory and are lost on exit.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        state_dir = os.getenv(STATE_DIR_ENV)
+        if path:
+            self.path: Path | None = Path(path)
+        elif state_dir:
+            self.path = Path(state_dir) / "watermarks.json"
+        else:
+            self.path = None
+        self._memory: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Cursor | None:
+        with self._lock:
+            value = self._load().get(key)
+        return tuple(value) if isinstance(value, list) else None
+
+    def set(self, key: str, cursor: Cursor) -> None:
+        with self._lock, self._locked():
+            state = self._load()
+            state[key] = list(cursor)
+            self._save(state)
+
+    def reset(self, key: str) -> None:
+        with self._lock, self._locked():
+            state = self._load()
+            if state.pop(key, None) is not None:
+                self._save(state)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if self.path is None:
+            yield
+        else:
+            with _file_lock(self.path):
+                yield
+
+    def _load(self) -> dict[str, Any]:
+        if self.path is None:
+            return dict(self._memory)
+        try:
+            with self.path.open("rb") as fh:
+                state = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable watermark file %s: %s", self.path, e)
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save(self, state: dict[str, Any]) -> None:
+        if self.path is None:
+            if not self._memory:
+                logger.warning(
+                    "Watermarks are kept in memory only; pass a path or set %s "
+                    "to resume syncs across runs",
+                    STATE_DIR_ENV,
+                )
+            self._memory = state
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(state, fh, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def committing(
+    rows: Iterator[Any], keyset: Keyset, commit: Callable[[Cursor], None], every: int
+) -> Iterator[Any]:
+    """Yield *rows*, committing the cursor of the rows the consumer got past.
+
+    A row counts as done once the consumer asks for the next one, so a
+    crash while handling a row resumes with that row. The cursor is
+    committed every *every* rows and when the iteration ends or is closed.
+    """
+    done: Cursor | None = None
+    pending = 0
+    try:
+        for row in rows:
+            cursor = keyset.cursor(row)
+            yield row
+            done, pending = cursor, pending + 1
+            if pending >= every:
+                commit(done)
+                pending = 0
+    finally:
+        if pending and done is not None:
+            commit(done)
+
+
+async def acommitting(
+    rows: AsyncIterator[Any],
+    keyset: Keyset,
+    commit: Callable[[Cursor], None],
+    every: int,
+) -> AsyncIterator[Any]:
+    """``asyncio`` counterpart of :func:`committing`."""
+    done: Cursor | None = None
+    pending = 0
+    try:
+        async for row in rows:
+            cursor = keyset.cursor(row)
+            yield row
+            done, pending = cursor, pending + 1
+            if pending >= every:
+                commit(done)
+                pending = 0
+    finally:
+        if pending and done is not None:
+            commit(done)
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import urljoin
+
+import httpx
+
+from pydantic import ValidationError
+
+from walacor_sdk.base.async_base_service import AsyncBaseService
+from walacor_sdk.data_requests.keyset import Keyset, aiter_keyset
+from walacor_sdk.file_request.file_helpers import FileHelpersMixin
+from walacor_sdk.file_request.models.file_request_request import (
+    StoreFileRequest,
+    VerifySingleFileRequest,
+)
+from walacor_sdk.file_request.models.file_request_response import (
+    ListFilesResponse,
+    StoreFileResponse,
+    VerifySuccessResponse,
+)
+from walacor_sdk.file_request.models.models import (
+    DuplicateData,
+    FileInfo,
+    FileItem,
+    FileMetadata,
+    MemoryFileItem,
+    StoreFileData,
+)
+from walacor_sdk.utils.exceptions import FileRequestError
+from walacor_sdk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class AsyncFileRequestService(AsyncBaseService, FileHelpersMixin):
+    """``asyncio`` counterpart of :class:`~walacor_sdk.file_request.file_request_service.FileRequestService`."""
+
+    # ------------------------------------------------------------------ verify
+    async def verify(
+        self, *, file: VerifySingleFileRequest, use_progress: bool = False
+    ) -> FileInfo | DuplicateData:
+        """
+        Upload *file* for verification and return validated ``FileInfo``.
+
+        Args:
+            file: File wrapper containing path and metadata.
+            use_progress: Enable tqdm progress bar.
+
+        Returns:
+            :class:`FileInfo` metadata of the verified file.
+
+        Raises:
+            FileRequestError: On network or schema failure.
+        """
+        logger.info("Verifying")
+        is_mem = isinstance(file.file, MemoryFileItem)
+
+        try:
+            if use_progress and not is_mem:
+                file_item = cast(FileItem, file.file)
+                response_json = await self._upload_file_with_progress(
+                    path=str(file_item.path),
+                    url=urljoin(self.client.base_url, "api/v2/files/verify"),
+                    field_name="file",
+                    mime_type=file_item.mimetype,
+                )
+            else:
+                response_json = await self._post(
+                    "v2/files/verify", files=file.to_files_param()
+                )
+
+            if response_json.get("success") is True:
+                parsed_success = self._parse(VerifySuccessResponse, response_json)
+                return parsed_success.data.fileInfo
+
+            if "duplicateData" in response_json:
+                dup = DuplicateData(**response_json["duplicateData"])
+                return dup
+
+            raise FileRequestError("Unexpected verification response structure.")
+
+        except (httpx.HTTPError, ValidationError) as exc:
+            logger.exception("File verification failed")
+            raise FileRequestError("verification failed") from exc
+
+    async def verify_in_memory(
+        self, obj: Any, /, **kw: Any
+    ) -> FileInfo | DuplicateData:
+        """
+        Verify an in-memory pandas.DataFrame or numpy.ndarray.
+        """
+        if self.is_dataframe(obj):
+            buf, name, mime = self.serialize_dataframe(obj, **kw)
+        elif self.is_ndarray(obj):
+            buf, name, mime = self.serialize_ndarray(obj, **kw)
+        else:
+            raise TypeError(
+                "verify_in_memory() accepts pandas.DataFrame or numpy.ndarray"
+            )
+
+        item = MemoryFileItem(buf, name=name, mimetype=mime)
+        request = VerifySingleFileRequest.from_memory(item)
+
+        return await self.verify(file=request, use_progress=False)
+
+    # ------------------------------------------------------------------ store
+    async def store(self, *, file_info: FileInfo) -> StoreFileData:
+        """
+        Store a **previously verified** file into Walacor and get back UID/path refs.
+
+        Args:
+            file_info: Metadata returned from ``verify()``.
+
+        Returns:
+            :class:`StoreFileData` with UID and location metadata.
+
+        Raises:
+            FileRequestError: On API or response schema failure.
+        """
+        payload = StoreFileRequest(fileInfo=file_info)
+        try:
+            response_json = await self._post(
+                "v2/files/store", json=payload.model_dump(by_alias=True)
+            )
+
+            if not response_json or not response_json.get("success"):
+                logger.error("File store request failed")
+                raise FileRequestError("store failed")
+
+            parsed = self._parse(StoreFileResponse, response_json)
+            return parsed.data
+        except (httpx.HTTPError, ValidationError) as exc:
+            logger.exception("Storing file failed")
+            raise FileRequestError("store failed") from exc
+
+    # ------------------------------------------------------------------ download
+    async def download(self, *, uid: str, save_to: str | Path | None = None) -> Path:
+        """
+        Download the file identified by *uid* and save it locally.
+
+        Args:
+            uid: Unique identifier of the file in Walacor.
+            save_to: Path or directory where file should be saved.
+
+        Returns:
+            :class:`Path` to downloaded file.
+
+        Raises:
+            FileRequestError: If metadata is missing or write fails.
+        """
+        logger.info("Downloading file UID=%s", uid)
+
+        metadata = await self._get_metadata(uid)
+        if metadata is None:
+            raise FileRequestError(f"no metadata found for UID {uid!r}")
+
+        response = await self._request_stream("download", json={"UID": uid})
+
+        if isinstance(save_to, str | Path) and Path(save_to).suffix:
+            file_path = Path(save_to).expanduser().resolve()
+            save_dir = file_path.parent
+            filename = file_path.name
+        else:
+            filename = metadata.name or self._extract_filename_from_headers(
+                dict(response.headers),
+                uid,
+                metadata.mimetype or "application/octet-stream",
+            )
+
+            save_dir = Path(save_to) if save_to else self._default_download_dir()
+            file_path = save_dir / filename
+
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            # Disk writes run in a worker thread so the event loop never blocks.
+            fp = await asyncio.to_thread(open, file_path, "wb")
+            try:
+                async for chunk in response.aiter_bytes():
+                    await asyncio.to_thread(fp.write, chunk)
+            finally:
+                await asyncio.to_thread(fp.close)
+            logger.info("File saved to %s", file_path)
+            return file_path
+        except OSError as exc:
+            logger.exception("Failed to write file to disk")
+            raise FileRequestError("failed to write file") from exc
+        finally:
+            # Hand the streamed socket back to the client's pool.
+            await response.aclose()
+
+    # ------------------------------------------------------------------ list
+    async def list_files(
+        self,
+        *,
+        uid: str | None = None,
+        page_size: int = 0,
+        page_no: int = 0,
+        from_summary: bool = False,
+        total_req: bool = True,
+    ) -> list[FileMetadata]:
+        """
+        List files available in Walacor, optionally filtered by UID.
+
+        Args:
+            uid: Filter to files matching this UID.
+            page_size: Records per page.
+            page_no: Page index.
+            from_summary: Use summarized file metadata view.
+            total_req: Request total row count.
+
+        Returns:
+            List of :class:`FileMetadata` entries.
+
+        Raises:
+            FileRequestError: If request or response validation fails.
+        """
+        logger.info("Listing files from server")
+
+        query = (
+            f"query/get?fromSummary={str(from_summary).lower()}"
+            f"&totalReq={str(total_req).lower()}"
+            f"&pageSize={page_size}&pageNo={page_no}"
+        )
+
+        payload: dict[str, Any] = {"UID": uid} if uid else {}
+        headers = {"ETId": "17"}
+
+        try:
+            response_json = await self._post(query, json=payload, headers=headers)
+
+            if not response_json or not response_json.get("success"):
+                logger.error("List files request failed")
+                raise FileRequestError("list files failed")
+
+            parsed = self._parse(ListFilesResponse, response_json)
+            logger.info("Received %s file(s)", parsed.total)
+            return parsed.data
+        except (httpx.HTTPError, ValidationError) as exc:
+            logger.exception("Failed to list files")
+            raise FileRequestError("list files failed") from exc
+
+    async def iter_files(self, *, page_size: int = 1000) -> AsyncIterator[FileMetadata]:
+        """
+        Iterate every file's metadata with keyset pagination on ``UpdatedAt``.
+
+        See :meth:`FileRequestService.iter_files`; use with ``async for``.
+        """
+
+        async def fetch(pipeline: list[dict[str, Any]]) -> list[Any]:
+            try:
+                response_json = await self._post(
+                    "query/getcomplex", json=pipeline, headers={"ETId": "17"}
+                )
+            except httpx.HTTPError as exc:
+                logger.exception("Failed to list files")
+                raise FileRequestError("list files failed") from exc
+            if not response_json or not response_json.get("success"):
+                logger.error("List files request failed")
+                raise FileRequestError("list files failed")
+            return list(response_json.get("data") or [])
+
+        async for row in aiter_keyset(fetch, Keyset(page_size=page_size)):
+            try:
+                yield FileMetadata.model_validate(row)
+            except ValidationError as exc:
+                raise FileRequestError("list files failed") from exc
+
+    # ------------------------------------------------------------------ helpers
+    async def _get_metadata(self, uid: str) -> FileMetadata | None:
+        for f in await self.list_files(uid=uid):
+            if getattr(f, "Status", None) == "received":
+                return f
+        return None
+
+    async def _request_stream(self, path: str, **req_kwargs: Any) -> httpx.Response:
+        url_path = urljoin("v2/files/download", path)
+
+        try:
+            return cast(
+                httpx.Response,
+                await self._post(url_path, parse_json=False, stream=True, **req_kwargs),
+            )
+        except httpx.HTTPError:
+            logger.exception("Streaming HTTP request to %s failed", url_path)
+            raise
+
+    async def _upload_file_with_progress(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        url: str,
+        field_name: str = "file",
+        mime_type: str = "application/octet-stream",
+    ) -> dict[str, Any]:
+        from requests_toolbelt import MultipartEncoder
+        from tqdm import tqdm
+
+        file_path = Path(path)
+        fh = await asyncio.to_thread(file_path.open, "rb")
+
+        try:
+            encoder = MultipartEncoder({field_name: (file_path.name, fh, mime_type)})
+
+            with tqdm(
+                total=encoder.len,
+                unit="B",
+                unit_scale=True,
+                desc=f"Uploading {file_path.name}",
+            ) as bar:
+
+                async def body() -> AsyncIterator[bytes]:
+                    while chunk := await asyncio.to_thread(
+                        encoder.read, _UPLOAD_CHUNK_SIZE
+                    ):
+                        bar.update(len(chunk))
+                        yield chunk
+
+                await self.client.ensure_token()
+                headers = self.client.get_default_headers(content_type=None)
+                headers["Content-Type"] = encoder.content_type
+                headers["Content-Length"] = str(encoder.len)
+
+                try:
+                    resp = await self.client.http.post(
+                        url, content=body(), headers=headers, timeout=120
+                    )
+
+                    if resp.status_code == 422:
+                        return cast(dict[str, Any], resp.json())
+
+                    resp.raise_for_status()
+
+                    if resp.headers.get("content-type", "").startswith(
+                        "application/json"
+                    ):
+                        return cast(dict[str, Any], resp.json())
+
+                    raise FileRequestError(
+                        f"Expected JSON but server sent {resp.headers.get('content-type')}"
+                    )
+
+                except httpx.HTTPError as exc:
+                    logger.exception("Upload failed")
+                    raise FileRequestError("upload failed") from exc
+        finally:
+            await asyncio.to_thread(fh.close)
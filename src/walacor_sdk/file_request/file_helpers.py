@@ -0,0 +1,64 @@
+import mimetypes
+import os
+import re
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+
+class FileHelpersMixin:
+    """I/O-free helpers shared by the sync and async file services."""
+
+    @staticmethod
+    def _extract_filename_from_headers(
+        headers: dict[str, str], uid: str, content_type: str
+    ) -> str:
+        cd = headers.get("Content-Disposition", "")
+        if "filename=" in cd:
+            if match := re.search(r'filename="?([^"]+)"?', cd):
+                return match.group(1)
+        return f"{uid}{mimetypes.guess_extension(content_type) or '.bin'}"
+
+    @staticmethod
+    def _default_download_dir() -> Path:
+        return (
+            Path(os.getenv("XDG_DOWNLOAD_DIR", Path.home() / "Downloads")) / "walacor"
+        )
+
+    def serialize_dataframe(
+        self, df: Any, *, fmt: str = "parquet", name: str | None = None, **kw: Any
+    ) -> tuple[BytesIO, str, str]:
+
+        buf = BytesIO()
+        if fmt == "csv":
+            df.to_csv(buf, index=False, **kw)
+            mime = "text/csv"
+            filename = name or "data.csv"
+        else:
+            df.to_parquet(buf, **kw)
+            mime = "application/x-parquet"
+            filename = name or "data.parquet"
+        buf.seek(0)
+        return buf, filename, mime
+
+    def serialize_ndarray(
+        self, arr: Any, *, name: str = "array.npy", **kw: Any
+    ) -> tuple[BytesIO, str, str]:
+        try:
+            import numpy as np
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "ndarray support requires NumPy. Run:  pip install numpy"
+            ) from err
+
+        buf = BytesIO()
+        np.save(buf, arr, **kw)
+        buf.seek(0)
+        return buf, name, "application/octet-stream"
+
+    def is_dataframe(self, x: Any) -> bool:
+        return hasattr(x, "to_parquet") and hasattr(x, "to_csv")
+
+    def is_ndarray(self, x: Any) -> bool:
+        return hasattr(x, "shape") and hasattr(x, "dtype")
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import mimetypes
 import os
-import re
 
-from io import BytesIO
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urljoin
@@ -14,6 +12,8 @@ import requests
 from pydantic import ValidationError
 
 from walacor_sdk.base.base_service import BaseService
+from walacor_sdk.data_requests.keyset import Keyset, iter_keyset
+from walacor_sdk.file_request.file_helpers import FileHelpersMixin
 from walacor_sdk.file_request.models.file_request_request import (
     StoreFileRequest,
     VerifySingleFileRequest,
@@ -37,7 +37,7 @@ from walacor_sdk.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-class FileRequestService(BaseService):
+class FileRequestService(BaseService, FileHelpersMixin):
     # ------------------------------------------------------------------ verify
     def verify(
         self, *, file: VerifySingleFileRequest, use_progress: bool = False
@@ -74,7 +74,7 @@ class FileRequestService(BaseService):
                 )
 
             if response_json.get("success") is True:
-                parsed_success = VerifySuccessResponse(**response_json)
+                parsed_success = self._parse(VerifySuccessResponse, response_json)
                 return parsed_success.data.fileInfo
 
             if "duplicateData" in response_json:
@@ -129,7 +129,7 @@ class FileRequestService(BaseService):
                 logger.error("File store request failed")
                 raise FileRequestError("store failed")
 
-            parsed = StoreFileResponse(**response_json)
+            parsed = self._parse(StoreFileResponse, response_json)
             return parsed.data
         except (requests.RequestException, ValidationError) as exc:
             logger.exception("Storing file failed")
@@ -183,6 +183,9 @@ class FileRequestService(BaseService):
         except OSError as exc:
             logger.exception("Failed to write file to disk")
             raise FileRequestError("failed to write file") from exc
+        finally:
+            # Hand the streamed socket back to the client's pool.
+            response.close()
 
     # ------------------------------------------------------------------ list
     def list_files(
@@ -228,13 +231,51 @@ class FileRequestService(BaseService):
                 logger.error("List files request failed")
                 raise FileRequestError("list files failed")
 
-            parsed = ListFilesResponse(**response_json)
+            parsed = self._parse(ListFilesResponse, response_json)
             logger.info("Received %s file(s)", parsed.total)
             return parsed.data
         except (requests.RequestException, ValidationError) as exc:
             logger.exception("Failed to list files")
             raise FileRequestError("list files failed") from exc
 
+    def iter_files(self, *, page_size: int = 1000) -> Iterator[FileMetadata]:
+        """
+        Iterate every file's metadata with keyset pagination on ``UpdatedAt``.
+
+        Unlike paging :meth:`list_files` by ``page_no``, each page costs the
+        same however deep the scan is, and files stored meanwhile do not
+        shift the pages.
+
+        Args:
+            page_size: Records per page.
+
+        Returns:
+            Iterator over :class:`FileMetadata` entries.
+
+        Raises:
+            FileRequestError: While iterating, if a page fails or does not
+                validate.
+        """
+
+        def fetch(pipeline: list[dict[str, Any]]) -> list[Any]:
+            try:
+                response_json = self._post(
+                    "query/getcomplex", json=pipeline, headers={"ETId": "17"}
+                )
+            except requests.RequestException as exc:
+                logger.exception("Failed to list files")
+                raise FileRequestError("list files failed") from exc
+            if not response_json or not response_json.get("success"):
+                logger.error("List files request failed")
+                raise FileRequestError("list files failed")
+            return list(response_json.get("data") or [])
+
+        for row in iter_keyset(fetch, Keyset(page_size=page_size)):
+            try:
+                yield FileMetadata.model_validate(row)
+            except ValidationError as exc:
+                raise FileRequestError("list files failed") from exc
+
     # ------------------------------------------------------------------ helpers
     def _get_metadata(self, uid: str) -> FileMetadata | None:
         for f in self.list_files(uid=uid):
@@ -256,22 +297,6 @@ class FileRequestService(BaseService):
             logger.exception("Streaming HTTP request to %s failed", url_path)
             raise
 
-    @staticmethod
-    def _extract_filename_from_headers(
-        headers: dict[str, str], uid: str, content_type: str
-    ) -> str:
-        cd = headers.get("Content-Disposition", "")
-        if "filename=" in cd:
-            if match := re.search(r'filename="?([^"]+)"?', cd):
-                return match.group(1)
-        return f"{uid}{mimetypes.guess_extension(content_type) or '.bin'}"
-
-    @staticmethod
-    def _default_download_dir() -> Path:
-        return (
-            Path(os.getenv("XDG_DOWNLOAD_DIR", Path.home() / "Downloads")) / "walacor"
-        )
-
     # ------------- restored upload helper -------------
     def _upload_file_with_progress(
         self,
@@ -303,12 +328,14 @@ class FileRequestService(BaseService):
 
             monitor = MultipartEncoderMonitor(encoder, on_upload)
 
-            self.client.authenticate()
+            self.client.ensure_token()
             headers = self.client.get_default_headers(content_type=None)
             headers["Content-Type"] = monitor.content_type
 
             try:
-                resp = requests.post(url, data=monitor, headers=headers, timeout=120)
+                resp = self.client.session.post(
+                    url, data=monitor, headers=headers, timeout=120
+                )
 
                 if resp.status_code == 422:
                     return cast(dict[str, Any], resp.json())
@@ -325,40 +352,3 @@ class FileRequestService(BaseService):
             except requests.RequestException as exc:
                 logger.exception("Upload failed")
                 raise FileRequestError("upload failed") from exc
-
-    def serialize_dataframe(
-        self, df: Any, *, fmt: str = "parquet", name: str | None = None, **kw: Any
-    ) -> tuple[BytesIO, str, str]:
-
-        buf = BytesIO()
-        if fmt == "csv":
-            df.to_csv(buf, index=False, **kw)
-            mime = "text/csv"
-            filename = name or "data.csv"
-        else:
-            df.to_parquet(buf, **kw)
-            mime = "application/x-parquet"
-            filename = name or "data.parquet"
-        buf.seek(0)
-        return buf, filename, mime
-
-    def serialize_ndarray(
-        self, arr: Any, *, name: str = "array.npy", **kw: Any
-    ) -> tuple[BytesIO, str, str]:
-        try:
-            import numpy as np
-        except ModuleNotFoundError as err:
-            raise ImportError(
-                "ndarray support requires NumPy. Run:  pip install numpy"
-            ) from err
-
-        buf = BytesIO()
-        np.save(buf, arr, **kw)
-        buf.seek(0)
-        return buf, name, "application/octet-stream"
-
-    def is_dataframe(self, x: Any) -> bool:
-        return hasattr(x, "to_parquet") and hasattr(x, "to_csv")
-
-    def is_ndarray(self, x: Any) -> bool:
-        return hasattr(x, "shape") and hasattr(x, "dtype")
@@ -57,7 +57,7 @@ class SchemaService(BaseService):
             return []
 
         try:
-            parsed_response = SchemaResponse(**response)
+            parsed_response = self._parse(SchemaResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("Schema Validation Error: %s", e)
@@ -76,7 +76,7 @@ class SchemaService(BaseService):
             return {}
 
         try:
-            parsed_response = AutoGenFieldsResponse(**response)
+            parsed_response = self._parse(AutoGenFieldsResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("AutoGenFields Validation Error: %s", e)
@@ -97,7 +97,7 @@ class SchemaService(BaseService):
             return []
 
         try:
-            parsed_response = SchemaListResponse(**response)
+            parsed_response = self._parse(SchemaListResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -115,7 +115,7 @@ class SchemaService(BaseService):
             return []
 
         try:
-            parsed_response = SchemaVersionsResponse(**response)
+            parsed_response = self._parse(SchemaVersionsResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -136,7 +136,7 @@ class SchemaService(BaseService):
             # logging.error()
             return []
         try:
-            parsed_response = SchemaListVersionsResponse(**response)
+            parsed_response = self._parse(SchemaListVersionsResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -167,7 +167,7 @@ class SchemaService(BaseService):
             logging.error("Failed to fetch schema indexes")
             return []
         try:
-            parsed_response = SchemaIndexResponse(**response)
+            parsed_response = self._parse(SchemaIndexResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -190,7 +190,7 @@ class SchemaService(BaseService):
             return []
 
         try:
-            parsed_response = IndexesByTableNameResponse(**response)
+            parsed_response = self._parse(IndexesByTableNameResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -214,7 +214,7 @@ class SchemaService(BaseService):
             logging.error("Failed to create schema")
             return None
         try:
-            parsed_response = CreateSchemaResponse(**response)
+            parsed_response = self._parse(CreateSchemaResponse, response)
             return parsed_response.data
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -240,7 +240,7 @@ class SchemaService(BaseService):
             return None
 
         try:
-            response = GetSchemaDetailResponse(**response)
+            response = self._parse(GetSchemaDetailResponse, response)
             return cast(SchemaDetail, response.data)
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -259,7 +259,7 @@ class SchemaService(BaseService):
             return None
 
         try:
-            response = GetEnvelopeTypesResponse(**response)
+            response = self._parse(GetEnvelopeTypesResponse, response)
             return cast(list[int], response.data)
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -281,7 +281,7 @@ class SchemaService(BaseService):
             return None
 
         try:
-            response = GetSchemaDetailResponse(**response)
+            response = self._parse(GetSchemaDetailResponse, response)
             return cast(SchemaDetail, response.data)
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -300,7 +300,7 @@ class SchemaService(BaseService):
             return None
 
         try:
-            response = GetSchemaListResponse(**response)
+            response = self._parse(GetSchemaListResponse, response)
             return cast(list[SchemaItem], response.data)
         except ValidationError as e:
             logging.error("SchemaListResponse Validation Error: %s", e)
@@ -327,7 +327,7 @@ class SchemaService(BaseService):
             return None
 
         try:
-            parsed_response = SchemaQueryListResponse(**response)
+            parsed_response = self._parse(SchemaQueryListResponse, response)
             data = parsed_response.data
             total = parsed_response.total
             return SchemaQueryList(data=data, total=total)
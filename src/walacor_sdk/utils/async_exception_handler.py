@@ -0,0 +1,63 @@
+import logging
+
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, TypeVar, cast
+
+import httpx
+
+from walacor_sdk.utils.exceptions import (
+    APIConnectionError,
+    BadRequestError,
+    RequestTimeoutError,
+)
+from walacor_sdk.utils.global_exception_handler import translate_http_error
+
+AF = TypeVar("AF", bound=Callable[..., Awaitable[Any]])
+
+
+def async_global_exception_handler(func: AF) -> AF:
+    """Coroutine counterpart of ``global_exception_handler`` for ``httpx``."""
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+
+        except (httpx.ConnectTimeout, httpx.ConnectError) as conn_err:
+            logging.error("Connection error: %s", conn_err)
+            raise APIConnectionError(
+                "Walacor API is unreachable (connection timeout)."
+            ) from None
+
+        except httpx.TimeoutException as timeout_err:
+            logging.error("Request timed out: %s", timeout_err)
+            raise RequestTimeoutError("Walacor API did not respond in time.") from None
+
+        except httpx.HTTPStatusError as http_err:
+            response = http_err.response
+            if not response.is_closed:
+                await response.aread()
+            raise translate_http_error(
+                func.__name__,
+                response.status_code,
+                response.reason_phrase,
+                response.content,
+            ) from None
+
+        except httpx.HTTPError as req_err:
+            logging.error("HTTP request failed: %s", req_err)
+            raise APIConnectionError(
+                "An HTTP error occurred while contacting Walacor API."
+            ) from None
+
+        except (BadRequestError, APIConnectionError):
+            raise
+
+        except Exception as exc:
+            logging.error("Unexpected error: %s", exc)
+            raise APIConnectionError(
+                "An unexpected error occurred in the Walacor SDK."
+            ) from None
+
+    return cast(AF, wrapper)
@@ -0,0 +1,73 @@
+import json
+
+from typing import Any
+
+
+class JsonCodec:
+    """Encode request bodies to bytes and decode response bodies.
+
+    The default implementation uses the standard library with compact
+    separators. Subclass and override :meth:`dumps` / :meth:`loads` to plug
+    in another encoder, then pass the instance to ``W_Client(codec=...)``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | bytearray | memoryview | str) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """:class:`JsonCodec` backed by ``orjson`` (``pip install orjson``).
+
+    Non-string dict keys are accepted like in the standard library; NaN and
+    infinity are written as ``null`` instead of being rejected.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ModuleNotFoundError as err:
+            raise ImportError(
+                "OrjsonCodec requires orjson. Run:  pip install orjson"
+            ) from err
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return bytes(self._orjson.dumps(obj, option=self._options))
+
+    def loads(self, data: bytes | bytearray | memoryview | str) -> Any:
+        return self._orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """The fastest codec available: ``orjson`` if installed, else the stdlib."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
+
+
+_codec: JsonCodec = default_codec()
+
+
+def get_codec() -> JsonCodec:
+    """Process-wide codec used when a client does not set its own."""
+    return _codec
+
+
+def set_codec(codec: JsonCodec) -> None:
+    """Replace the process-wide codec (e.g. ``set_codec(JsonCodec())``)."""
+    global _codec
+    _codec = codec
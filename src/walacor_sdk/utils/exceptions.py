@@ -1,7 +1,21 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from walacor_sdk.data_requests.models.models import RowError
+
+
 class APIConnectionError(Exception):
     """Raised when unable to connect to the Walacor API."""
 
 
+class RequestTimeoutError(APIConnectionError):
+    """Raised when the Walacor API does not answer within the timeout."""
+
+
+class PayloadTooLargeError(APIConnectionError):
+    """Raised on HTTP 413: the request body exceeds the server's limit."""
+
+
 class BadRequestError(Exception):
     def __init__(self, reason: str, message: str, code: int = 400):
         self.reason = reason
@@ -24,3 +38,37 @@ class InternalServerError(Exception):
 
 class DuplicateFileError(FileRequestError):
     """Raised when the platform reports the file is a duplicate."""
+
+
+class BatchSubmitError(RuntimeError):
+    """Raised on a record's future when its coalesced batch submit fails."""
+
+
+class PageFetchError(RuntimeError):
+    """Raised when a page of a scan or export, or a streamed result, fails."""
+
+
+class RecordLookupError(RuntimeError):
+    """Raised on a UID's future when its coalesced lookup query fails."""
+
+
+class UnsupportedQueryError(ValueError):
+    """Raised when a pipeline uses stages or operators the local evaluator lacks."""
+
+
+class RecordValidationError(ValueError):
+    """Raised when rows fail client-side schema validation; nothing was sent.
+
+    ``errors`` lists every rejected field as a
+    :class:`~walacor_sdk.data_requests.models.models.RowError`.
+    """
+
+    def __init__(self, errors: "list[RowError]"):
+        self.errors = errors
+        first = errors[0] if errors else None
+        detail = (
+            f"; first: row {first.Row} field {first.Field!r}: {first.Error}"
+            if first is not None
+            else ""
+        )
+        super().__init__(f"{len(errors)} invalid field value(s){detail}")
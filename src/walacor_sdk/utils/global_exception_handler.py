@@ -10,17 +10,83 @@ from requests.exceptions import (
     ConnectTimeout,
     HTTPError,
     RequestException,
+    Timeout,
 )
 
 from walacor_sdk.utils.exceptions import (
     APIConnectionError,
     BadRequestError,
     InternalServerError,
+    PayloadTooLargeError,
+    RequestTimeoutError,
 )
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def translate_http_error(
+    func_name: str, status: int, reason: str | None, raw_content: Any
+) -> Exception:
+    """Map an HTTP error status and body onto the SDK exception to raise."""
+    content = (
+        raw_content.decode("utf-8")
+        if isinstance(raw_content, bytes | bytearray)
+        else str(raw_content)
+    )
+
+    error_reason = "UnknownReason"
+    error_message = "Unknown error message."
+
+    try:
+        maybe_json = json.loads(content)
+        if isinstance(maybe_json, dict):
+            errors = maybe_json.get("errors", [{}])
+            first = errors[0] if errors else {}
+            if isinstance(first, dict):
+                error_reason = first.get("reason", error_reason)
+                error_message = first.get("message", error_message)
+    except json.JSONDecodeError:
+        # Not JSON – keep defaults
+        pass
+
+    if status == 400:
+        logging.error(
+            "HTTP 400 from %s: [%s] %s",
+            func_name,
+            error_reason,
+            error_message,
+        )
+        return BadRequestError(error_reason, error_message, status)
+
+    if status == 500:
+        logging.error(
+            "HTTP 500 from %s: [%s] %s",
+            func_name,
+            error_reason,
+            error_message,
+        )
+        return InternalServerError(
+            error_reason,
+            error_message,
+            status,
+        )
+
+    if status == 413:
+        logging.error("HTTP 413 from %s: request body too large", func_name)
+        return PayloadTooLargeError(f"HTTP Error {status}: {reason}")
+
+    if status in (408, 504):
+        logging.error("HTTP %s from %s: request timed out", status, func_name)
+        return RequestTimeoutError(f"HTTP Error {status}: {reason}")
+
+    logging.error(
+        "Unhandled HTTP error: %s %s",
+        status,
+        reason,
+    )
+    return APIConnectionError(f"HTTP Error {status}: {reason}")
+
+
 def global_exception_handler(func: F) -> F:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -33,61 +99,18 @@ def global_exception_handler(func: F) -> F:
                 "Walacor API is unreachable (connection timeout)."
             ) from None
 
+        except Timeout as timeout_err:
+            logging.error("Request timed out: %s", timeout_err)
+            raise RequestTimeoutError("Walacor API did not respond in time.") from None
+
         except HTTPError as http_err:
             response = getattr(http_err, "response", None)
             if response is not None:
-                status = response.status_code
-
-                content = (
-                    response.content.decode("utf-8")
-                    if isinstance(response.content, bytes | bytearray)
-                    else str(response.content)
-                )
-
-                error_reason = "UnknownReason"
-                error_message = "Unknown error message."
-
-                try:
-                    maybe_json = json.loads(content)
-                    if isinstance(maybe_json, dict):
-                        errors = maybe_json.get("errors", [{}])
-                        first = errors[0] if errors else {}
-                        if isinstance(first, dict):
-                            error_reason = first.get("reason", error_reason)
-                            error_message = first.get("message", error_message)
-                except json.JSONDecodeError:
-                    # Not JSON – keep defaults
-                    pass
-
-                if status == 400:
-                    logging.error(
-                        "HTTP 400 from %s: [%s] %s",
-                        func.__name__,
-                        error_reason,
-                        error_message,
-                    )
-                    raise BadRequestError(error_reason, error_message, status) from None
-
-                if status == 500:
-                    logging.error(
-                        "HTTP 500 from %s: [%s] %s",
-                        func.__name__,
-                        error_reason,
-                        error_message,
-                    )
-                    raise InternalServerError(
-                        error_reason,
-                        error_message,
-                        status,
-                    ) from None
-
-                logging.error(
-                    "Unhandled HTTP error: %s %s",
-                    status,
+                raise translate_http_error(
+                    func.__name__,
+                    response.status_code,
                     response.reason,
-                )
-                raise APIConnectionError(
-                    f"HTTP Error {status}: {response.reason}"
+                    response.content,
                 ) from None
 
             logging.error("HTTPError raised without response attached.")
@@ -0,0 +1,171 @@
+import codecs
+import json
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonArrayStream:
+    """Incrementally decode one array member of a top-level JSON object.
+
+    Feed the raw body chunk by chunk; every element of ``object[key]`` is
+    returned as soon as it is complete, so the full array is never held in
+    memory. The object's other members (``success``, ``total`` …) are
+    collected in :attr:`meta` as they are passed.
+
+    Example::
+
+        parser = JsonArrayStream("data")
+        for chunk in response.iter_content(65536):
+            for row in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        self.key = key
+        self.meta: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._current_key: str | None = None
+        self._final = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the top-level object was read."""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add *chunk* to the buffer and return the elements it completed."""
+        return self._parse(self._text.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """Flush the decoder and fail if the document was cut short."""
+        self._final = True
+        items = self._parse(self._text.decode(b"", final=True))
+        if self._state != "done":
+            raise ValueError("Truncated JSON document")
+        pos = self._pos
+        if self._buf[pos:].strip(_WHITESPACE):
+            raise ValueError("Extra data after JSON document")
+        return items
+
+    # ------------------------------------------------------------------ internals
+
+    def _parse(self, text: str) -> list[Any]:
+        pos = self._pos
+        self._buf = self._buf[pos:] + text
+        self._pos = 0
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        return items
+
+    def _peek(self) -> str | None:
+        """Next non-whitespace character, or ``None`` if more input is needed."""
+        buf = self._buf
+        pos = self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buf[pos] if pos < len(buf) else None
+
+    def _expect(self, allowed: str) -> str | None:
+        char = self._peek()
+        if char is None:
+            return None
+        if char not in allowed:
+            raise ValueError(
+                f"Unexpected {char!r} at offset {self._pos}, expected one of {allowed!r}"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> tuple[bool, Any]:
+        """Decode one complete value; ``(False, None)`` when more input is needed."""
+        if self._peek() is None:
+            return False, None
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return False, None
+        # a number or literal touching the end of the buffer may continue
+        if end == len(self._buf) and not self._final:
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _step(self, items: list[Any]) -> bool:
+        state = self._state
+
+        if state == "start":
+            if self._expect("{") is None:
+                return False
+            self._state = "first_key"
+        elif state in ("key", "first_key"):
+            if self._peek() == "}" and state == "first_key":
+                self._pos += 1
+                self._state = "done"
+                return True
+            ok, key = self._value()
+            if not ok:
+                return False
+            if not isinstance(key, str):
+                raise ValueError("Object keys must be strings")
+            self._current_key = key
+            self._state = "colon"
+        elif state == "colon":
+            if self._expect(":") is None:
+                return False
+            self._state = "member"
+        elif state == "member":
+            char = self._peek()
+            if char is None:
+                return False
+            if self._current_key == self.key and char == "[":
+                self._pos += 1
+                self._state = "first_item"
+            else:
+                ok, value = self._value()
+                if not ok:
+                    return False
+                self.meta[self._current_key or ""] = value
+                self._state = "after_member"
+        elif state in ("first_item", "item"):
+            if state == "first_item" and self._peek() == "]":
+                self._pos += 1
+                self._state = "after_member"
+                return True
+            ok, value = self._value()
+            if not ok:
+                return False
+            items.append(value)
+            self._state = "after_item"
+        elif state == "after_item":
+            char = self._expect(",]")
+            if char is None:
+                return False
+            self._state = "item" if char == "," else "after_member"
+        elif state == "after_member":
+            char = self._expect(",}")
+            if char is None:
+                return False
+            self._state = "key" if char == "," else "done"
+        else:
+            return False
+        return True
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """Yield the elements of ``object[key]`` from an iterable of body chunks."""
+    parser = JsonArrayStream(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
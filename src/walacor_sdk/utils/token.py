@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+
+# Shortest time a fresh token is used before a proactive refresh.
+MIN_TOKEN_USE = 1.0
+
+
+def token_expiry(token: str | None) -> float | None:
+    """Return the ``exp`` claim (epoch seconds) of a JWT ``api_token``.
+
+    The signature is **not** verified – the value is only used to schedule a
+    refresh. ``None`` is returned for anything that is not a readable JWT.
+    """
+    if not token:
+        return None
+
+    raw = token.removeprefix("Bearer ").strip()
+    parts = raw.split(".")
+    if len(parts) != 3:
+        return None
+
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, int | float) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+def refresh_deadline(expiry: float | None, margin: float, now: float) -> float | None:
+    """Epoch time at which a token expiring at *expiry*, issued at *now*, is renewed.
+
+    *margin* is capped at half the remaining lifetime and the token is used
+    for at least :data:`MIN_TOKEN_USE` seconds, so short-lived tokens do not
+    trigger back-to-back logins. ``None`` (no proactive refresh) when the
+    expiry is unknown or already past by the local clock, e.g. a clock
+    running ahead of the server; a 401 then triggers the login.
+    """
+    if expiry is None or expiry <= now:
+        return None
+    lifetime = expiry - now
+    return now + max(lifetime - min(margin, lifetime / 2), MIN_TOKEN_USE)
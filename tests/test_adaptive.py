@@ -0,0 +1,201 @@
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from walacor_sdk.base.w_client import W_Client
+from walacor_sdk.data_requests.adaptive import AdaptiveBatchSizer, batch_sizer
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.models.models import SubmissionResult
+from walacor_sdk.utils.exceptions import PayloadTooLargeError, RequestTimeoutError
+from walacor_sdk.utils.global_exception_handler import (
+    global_exception_handler,
+    translate_http_error,
+)
+
+ETID = 90000000
+
+
+def test_grows_while_per_row_latency_improves():
+    """Test that the size doubles while batches get cheaper per row"""
+    sizer = AdaptiveBatchSizer(initial=100, max_rows=1000)
+
+    sizer.record(100, 1.0)  # 10 ms/row
+    assert sizer.size == 200
+    sizer.record(200, 1.0)  # 5 ms/row
+    assert sizer.size == 400
+    sizer.record(400, 1.9)  # flat: hold
+    assert sizer.size == 400
+
+
+def test_steps_back_when_bigger_is_slower():
+    """Test that a slower bigger batch reverts the size and caps it"""
+    sizer = AdaptiveBatchSizer(initial=100)
+
+    sizer.record(100, 1.0)
+    sizer.record(200, 2.6)  # 13 ms/row, worse than 10
+
+    assert sizer.size == 100
+    assert sizer.ceiling == 100
+
+
+def test_shrinks_on_spikes_timeouts_and_413():
+    """Test every failure signal reduces the size"""
+    sizer = AdaptiveBatchSizer(initial=400, max_rows=400)
+    sizer.record(400, 4.0)
+
+    sizer.record(400, 40.0)  # 10x the average
+    assert sizer.size == 200
+    sizer.timed_out()
+    assert sizer.size == 100
+    sizer.too_large(100)
+    assert sizer.size == 50
+    assert sizer.ceiling == 50
+
+
+def test_short_batches_do_not_grow():
+    """Test that partial batches are not taken as a size measurement"""
+    sizer = AdaptiveBatchSizer(initial=100)
+
+    sizer.record(10, 0.01)
+
+    assert sizer.size == 100
+
+
+def test_invalid_options():
+    """Test option validation"""
+    with pytest.raises(ValueError):
+        AdaptiveBatchSizer(initial=0)
+    with pytest.raises(ValueError):
+        AdaptiveBatchSizer(growth=1.0)
+
+
+def test_sizer_is_remembered_per_client_and_etid():
+    """Test sizers live with the client and are shared across services"""
+    client = MagicMock()
+
+    assert batch_sizer(client, ETID) is batch_sizer(client, ETID)
+    assert batch_sizer(client, ETID) is not batch_sizer(client, ETID + 1)
+    assert batch_sizer(MagicMock(), ETID) is not batch_sizer(client, ETID)
+    assert DataRequestsService(client).batch_sizer(ETID) is DataRequestsService(
+        client
+    ).batch_sizer(ETID)
+
+
+def test_413_and_timeouts_are_typed():
+    """Test that 413 and read timeouts map to their own exceptions"""
+    error = translate_http_error("submit", 413, "Payload Too Large", b"")
+    assert isinstance(error, PayloadTooLargeError)
+    for status in (408, 504):
+        error = translate_http_error("submit", status, "Gateway Timeout", b"")
+        assert isinstance(error, RequestTimeoutError)
+
+    @global_exception_handler
+    def slow():
+        raise requests.ReadTimeout("read timed out")
+
+    with pytest.raises(RequestTimeoutError):
+        slow()
+
+
+def test_insert_records_adaptive_retries_smaller_after_413():
+    """Test a 413 batch is resent in smaller pieces and timeouts are reported"""
+    service = DataRequestsService(MagicMock())
+    service.batch_sizer(ETID).too_large(8)  # start from 4 rows
+    calls = []
+
+    def submit(body, ETId, timeout=None):
+        batch = json.loads(body)["Data"]
+        calls.append(len(batch))
+        if len(batch) > 2:
+            raise PayloadTooLargeError("HTTP Error 413: Payload Too Large")
+        if batch[0]["n"] == 4:
+            raise RequestTimeoutError("Walacor API did not respond in time.")
+        result = SubmissionResult(
+            EId="e", ETId=ETID, ES=30, UID=[f"uid-{row['n']}" for row in batch]
+        )
+        return {"success": True, "data": result.model_dump()}
+
+    service._submit = MagicMock(side_effect=submit)
+    # a frozen clock keeps latency spikes out of the picture
+    with patch("walacor_sdk.data_requests.data_requests_service.time") as clock:
+        clock.monotonic.return_value = 0.0
+        service_result = service.insert_records_adaptive(
+            [{"n": n} for n in range(6)], ETID
+        )
+
+    assert calls == [4, 2, 2, 2]
+    assert service_result.UID == ["uid-0", "uid-1", "uid-2", "uid-3", None, None]
+    assert [(f.Offset, f.Count) for f in service_result.FailedBatches] == [(4, 2)]
+    assert service.batch_sizer(ETID).size == 1
+
+
+class SlowSubmitHandler(BaseHTTPRequestHandler):
+    """Local Walacor stand-in whose submits stall once a batch exceeds 2 rows."""
+
+    batches: list[int] = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path == "/auth/login":
+            payload = {"api_token": "Bearer token"}
+        else:
+            rows = body["Data"]
+            self.batches.append(len(rows))
+            if len(rows) > 2:
+                time.sleep(0.5)
+            payload = {
+                "success": True,
+                "data": {
+                    "EId": "e",
+                    "ETId": ETID,
+                    "ES": 30,
+                    "UID": [f"uid-{row['n']}" for row in rows],
+                },
+            }
+        data = json.dumps(payload).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except OSError:
+            pass  # the client gave up waiting
+
+
+@pytest.fixture
+def slow_server():
+    SlowSubmitHandler.batches = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowSubmitHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_insert_records_adaptive_shrinks_after_real_timeout(slow_server):
+    """Test that a submit outlasting ``timeout`` shrinks the batch and is reported"""
+    client = W_Client(slow_server, "user", "pass")
+    service = DataRequestsService(client)
+    service.batch_sizer(ETID).too_large(8)  # start from 4 rows
+
+    result = service.insert_records_adaptive(
+        [{"n": n} for n in range(6)], ETID, timeout=0.1
+    )
+    client.close()
+
+    assert result.UID == [None] * 4 + ["uid-4", "uid-5"]
+    assert [(f.Offset, f.Count) for f in result.FailedBatches] == [(0, 4)]
+    assert "did not respond in time" in result.FailedBatches[0].Error
+    assert SlowSubmitHandler.batches == [4, 2]
@@ -0,0 +1,546 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from walacor_sdk.base.async_w_client import AsyncW_Client  # noqa: E402
+from walacor_sdk.base.async_walacor_service import AsyncWalacorService  # noqa: E402
+from walacor_sdk.base.retry import RetryBudget, RetryPolicy  # noqa: E402
+from walacor_sdk.data_requests.models.models import SubmissionResult  # noqa: E402
+from walacor_sdk.data_requests.watermarks import WatermarkStore  # noqa: E402
+from walacor_sdk.utils.exceptions import (  # noqa: E402
+    APIConnectionError,
+    BadRequestError,
+    PageFetchError,
+)
+
+BASE_URL = "http://fakeapi.com"
+USERNAME = "testuser"
+PASSWORD = "testpass"
+
+
+def make_client(handler):
+    client = AsyncW_Client(BASE_URL, USERNAME, PASSWORD)
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def make_service(handler, retry=None):
+    wal = AsyncWalacorService(BASE_URL, USERNAME, PASSWORD, retry=retry)
+    wal._client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return wal
+
+
+def login_or(handler):
+    def route(request):
+        if request.url.path == "/auth/login":
+            return httpx.Response(200, json={"api_token": "Bearer fake_token"})
+        return handler(request)
+
+    return route
+
+
+# ------------------------------> CLIENT
+
+
+def test_async_client_authenticates_and_sends_token():
+    """Test that AsyncW_Client logs in once and injects the token"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"success": True})
+
+    async def run():
+        client = make_client(login_or(handler))
+        await client.request("GET", "endpoint")
+        await client.request("GET", "endpoint")
+        await client.aclose()
+        return client
+
+    client = asyncio.run(run())
+
+    assert client.token == "Bearer fake_token"
+    assert seen == ["Bearer fake_token", "Bearer fake_token"]
+
+
+def test_async_client_reauth_on_401():
+    """Test that AsyncW_Client re-authenticates and retries once on 401"""
+    calls = {"n": 0}
+
+    def handler(request):
+        calls["n"] += 1
+        status = 401 if calls["n"] == 1 else 200
+        return httpx.Response(status, json={"success": status == 200})
+
+    async def run():
+        client = make_client(login_or(handler))
+        client._token = "Bearer expired_token"
+        response = await client.request("GET", "endpoint")
+        await client.aclose()
+        return client, response
+
+    client, response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert client.token == "Bearer fake_token"
+    assert calls["n"] == 2
+
+
+@pytest.mark.parametrize("lifetime", [30, -30])
+def test_async_short_lived_token_does_not_loop_logins(lifetime):
+    """Test that a token shorter than the margin (or already expired) logs in once"""
+    logins = []
+
+    def jwt():
+        claims = json.dumps({"exp": time.time() + lifetime}).encode()
+        payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+        return f"Bearer h.{payload}.s"
+
+    def handler(request):
+        if request.url.path == "/auth/login":
+            logins.append(request)
+            return httpx.Response(200, json={"api_token": jwt()})
+        return httpx.Response(200, json={"success": True})
+
+    async def run():
+        client = make_client(handler)
+        for _ in range(20):
+            await client.request("GET", "endpoint")
+        await asyncio.sleep(0.2)
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert len(logins) == 1
+
+
+def test_async_client_sends_encoded_body():
+    """Test that AsyncW_Client encodes json= with its codec into the body"""
+    from walacor_sdk.utils.codec import JsonCodec
+
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(200, json={"success": True})
+
+    async def run():
+        client = make_client(login_or(handler))
+        client.codec = JsonCodec()
+        await client.request("POST", "query/get", json={"a": "é"})
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert bodies == ['{"a":"é"}'.encode()]
+
+
+def test_async_client_pool_limits():
+    """Test that PoolConfig settings are mapped onto httpx limits"""
+    from walacor_sdk.base.model.pool_config import PoolConfig
+
+    client = AsyncW_Client(
+        BASE_URL,
+        USERNAME,
+        PASSWORD,
+        pool=PoolConfig(pool_maxsize=5, pool_connections=2, pool_block=True),
+    )
+    pool = client.http._transport._pool
+
+    assert pool._max_connections == 10
+    assert pool._max_keepalive_connections == 5
+    asyncio.run(client.aclose())
+
+
+# ------------------------------> SERVICES
+
+
+def test_async_insert_multiple_records():
+    """Test that AsyncDataRequestsService submits records and parses the result"""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        assert request.headers["ETId"] == "90000000"
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "data": {"EId": "e", "ETId": 90000000, "ES": 30, "UID": ["1", "2"]},
+            },
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.data_requests.insert_multiple_records(
+                [{"a": 1}, {"a": 2}], 90000000
+            )
+
+    result = asyncio.run(run())
+
+    assert isinstance(result, SubmissionResult)
+    assert result.UID == ["1", "2"]
+    assert bodies == [{"Data": [{"a": 1}, {"a": 2}]}]
+
+
+def test_async_insert_encoded_records():
+    """Test that pre-encoded records are sent as the joined body"""
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "data": {"EId": "e", "ETId": 90000000, "ES": 30, "UID": ["1"]},
+            },
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.data_requests.insert_encoded_records(
+                [b'{"a": 1}'], 90000000
+            )
+
+    result = asyncio.run(run())
+
+    assert result.UID == ["1"]
+    assert bodies == [b'{"Data":[{"a": 1}]}']
+
+
+def test_async_concurrent_get_all():
+    """Test that many coroutines can share one client concurrently"""
+
+    def handler(request):
+        return httpx.Response(200, json={"success": True, "data": [{"x": 1}]})
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await asyncio.gather(
+                *(wal.data_requests.get_all(ETId=10) for _ in range(50))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 50
+    assert all(rows == [{"x": 1}] for rows in results)
+
+
+def test_async_get_many_by_uid_queries_chunks_concurrently():
+    """Test that async get_many_by_uid sends one $in query per chunk"""
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        uids = body["UID"]["$in"]
+        return httpx.Response(
+            200, json={"success": True, "data": [{"UID": u} for u in uids]}
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.data_requests.get_many_by_uid(
+                10, ["a", "b", "c", "a"], chunk_size=2
+            )
+
+    result = asyncio.run(run())
+
+    assert result == {"a": {"UID": "a"}, "b": {"UID": "b"}, "c": {"UID": "c"}}
+    assert sorted(len(b["UID"]["$in"]) for b in bodies) == [1, 2]
+
+
+def test_async_schema_list_with_latest_version():
+    """Test that AsyncSchemaService returns the same pydantic models"""
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "data": [{"ETId": 100, "TableName": "books", "SV": 1}],
+            },
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.schema.get_list_with_latest_version()
+
+    result = asyncio.run(run())
+
+    assert result[0].TableName == "books"
+
+
+def test_async_errors_are_translated():
+    """Test that HTTP and connection failures map onto SDK exceptions"""
+
+    def bad_request(request):
+        return httpx.Response(
+            400, json={"errors": [{"reason": "Invalid", "message": "bad payload"}]}
+        )
+
+    def unreachable(request):
+        raise httpx.ConnectError("refused")
+
+    async def run(handler):
+        no_retry = RetryPolicy(max_attempts=1)
+        async with make_service(login_or(handler), retry=no_retry) as wal:
+            return await wal.data_requests.get_all(ETId=10)
+
+    with pytest.raises(BadRequestError, match="bad payload"):
+        asyncio.run(run(bad_request))
+
+    with pytest.raises(APIConnectionError, match="unreachable"):
+        asyncio.run(run(unreachable))
+
+
+def test_async_download_streams_to_disk(tmp_path):
+    """Test that AsyncFileRequestService.download streams the body to disk"""
+
+    def handler(request):
+        if request.url.path == "/query/get":
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "total": 1,
+                    "data": [
+                        {
+                            "_id": "id1",
+                            "name": "report.pdf",
+                            "ORGId": "org1",
+                            "SL": "sl1",
+                            "mimetype": "application/pdf",
+                            "EId": "eid1",
+                            "UID": "file123",
+                            "LastModifiedBy": "user",
+                            "SV": 1,
+                            "UpdatedAt": 1,
+                            "CreatedAt": 1,
+                            "IsDeleted": False,
+                            "Status": "received",
+                        }
+                    ],
+                },
+            )
+        return httpx.Response(200, content=b"chunk1chunk2")
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.file_request.download(uid="file123", save_to=tmp_path)
+
+    path = asyncio.run(run())
+
+    assert path.name == "report.pdf"
+    assert path.read_bytes() == b"chunk1chunk2"
+
+
+def test_async_single_flight_refresh():
+    """Test that concurrent coroutines hitting 401 share one login"""
+    logins = []
+
+    def handler(request):
+        if request.url.path == "/auth/login":
+            logins.append(1)
+            return httpx.Response(200, json={"api_token": "Bearer fresh_token"})
+        ok = request.headers["Authorization"] == "Bearer fresh_token"
+        return httpx.Response(200 if ok else 401, json={"success": ok})
+
+    async def run():
+        client = make_client(handler)
+        client._token = "Bearer expired_token"
+        responses = await asyncio.gather(
+            *(client.request("GET", "endpoint") for _ in range(20))
+        )
+        await client.aclose()
+        return responses
+
+    responses = asyncio.run(run())
+
+    assert len(logins) == 1
+    assert all(r.status_code == 200 for r in responses)
+
+
+def test_async_retries_transient_failures():
+    """Test that the async client retries a 503 then returns the success"""
+    calls = {"n": 0}
+
+    def handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"success": True, "data": [{"x": 1}]})
+
+    async def run():
+        policy = RetryPolicy(backoff_factor=0, budget=RetryBudget())
+        async with make_service(login_or(handler), retry=policy) as wal:
+            return await wal.data_requests.get_all(ETId=10)
+
+    assert asyncio.run(run()) == [{"x": 1}]
+    assert calls["n"] == 2
+
+
+def test_async_insert_records_chunked():
+    """Test that the async chunked insert merges batch UIDs in input order"""
+
+    def handler(request):
+        rows = json.loads(request.content)["Data"]
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "data": {
+                    "EId": "e",
+                    "ETId": 90000000,
+                    "ES": 30,
+                    "UID": [f"uid-{row['n']}" for row in rows],
+                },
+            },
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return await wal.data_requests.insert_records_chunked(
+                [{"n": n} for n in range(10)], 90000000, max_rows=3, max_workers=2
+            )
+
+    result = asyncio.run(run())
+
+    assert result.success
+    assert result.UID == [f"uid-{n}" for n in range(10)]
+    assert len(result.Submissions) == 4
+
+
+def test_async_iter_all_pages():
+    """Test that AsyncDataRequestsService.iter_all yields rows across pages"""
+    pages = []
+
+    def handler(request):
+        page = int(request.url.params["pageNo"])
+        pages.append(page)
+        data = [{"n": page}] * (2 if page < 3 else 1)
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return [row async for row in wal.data_requests.iter_all(10, page_size=2)]
+
+    rows = asyncio.run(run())
+
+    assert [row["n"] for row in rows] == [1, 1, 2, 2, 3]
+    assert pages == [1, 2, 3]
+
+
+def test_async_iter_all_raises_on_failed_page():
+    """Test that a failed page ends AsyncDataRequestsService.iter_all with an error"""
+    from walacor_sdk.utils.exceptions import PageFetchError
+
+    def handler(request):
+        page = int(request.url.params["pageNo"])
+        if page == 2:
+            return httpx.Response(200, json={"success": False})
+        return httpx.Response(200, json={"success": True, "data": [{"n": page}] * 2})
+
+    async def run():
+        rows = []
+        async with make_service(login_or(handler)) as wal:
+            with pytest.raises(PageFetchError, match="Page 2"):
+                async for row in wal.data_requests.iter_all(10, page_size=2):
+                    rows.append(row)
+        return rows
+
+    assert asyncio.run(run()) == [{"n": 1}, {"n": 1}]
+
+
+def test_async_export_all_fans_out():
+    """Test that the async export asks for the total then fetches pages in order"""
+
+    def handler(request):
+        if request.url.params.get("totalReq") == "true":
+            return httpx.Response(200, json={"success": True, "data": [], "total": 5})
+        page = int(request.url.params["pageNo"])
+        data = [{"n": n} for n in range((page - 1) * 2, min(page * 2, 5))]
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            rows = wal.data_requests.export_all(10, page_size=2, max_workers=2)
+            return [row["n"] async for row in rows]
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+
+
+def test_async_iter_keyset():
+    """Test that the async keyset scan follows the cursor across pages"""
+    pipelines = []
+
+    def handler(request):
+        pipeline = json.loads(request.content)
+        pipelines.append(pipeline)
+        data = [{"UID": "a", "UpdatedAt": 1}] if len(pipelines) == 1 else []
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            scan = wal.data_requests.iter_keyset(10, page_size=1)
+            return [row async for row in scan]
+
+    assert asyncio.run(run()) == [{"UID": "a", "UpdatedAt": 1}]
+    assert pipelines[1][0]["$match"]["$or"][0] == {"UpdatedAt": {"$gt": 1}}
+
+
+def test_async_sync_changes_stores_watermark(tmp_path):
+    """Test that the async change sync persists the last row's cursor"""
+
+    def handler(request):
+        return httpx.Response(
+            200, json={"success": True, "data": [{"UID": "a", "UpdatedAt": 3}]}
+        )
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            wal.data_requests.watermarks = WatermarkStore(tmp_path / "w.json")
+            rows = [row async for row in wal.data_requests.sync_changes(10)]
+            return rows, wal.data_requests.watermarks
+
+    rows, store = asyncio.run(run())
+
+    assert rows == [{"UID": "a", "UpdatedAt": 3}]
+    assert store.get(f"{BASE_URL}#10#UpdatedAt") == (3, "a")
+
+
+def test_async_stream_all():
+    """Test that the async service decodes a streamed query/get body row by row"""
+    body = json.dumps({"success": True, "data": [{"n": n} for n in range(3)]})
+
+    def handler(request):
+        return httpx.Response(200, content=body.encode())
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            return [row async for row in wal.data_requests.stream_all(10)]
+
+    assert asyncio.run(run()) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_async_stream_failure_raises():
+    """Test that a success=false streamed body raises instead of ending quietly"""
+
+    def handler(request):
+        return httpx.Response(200, content=b'{"data": [{"n": 1}], "success": false}')
+
+    async def run():
+        async with make_service(login_or(handler)) as wal:
+            rows = []
+            with pytest.raises(PageFetchError):
+                async for row in wal.data_requests.stream_all(10):
+                    rows.append(row)
+            return rows
+
+    assert asyncio.run(run()) == [{"n": 1}]
@@ -0,0 +1,149 @@
+import gc
+import json
+import threading
+import weakref
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.data_requests.batch_writer import BatchWriter
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.models.models import SubmissionResult
+from walacor_sdk.utils.codec import JsonCodec
+from walacor_sdk.utils.exceptions import BatchSubmitError
+
+ETID = 90000000
+
+
+def submission(records):
+    rows = [json.loads(r) for r in records]
+    return SubmissionResult(
+        EId="e", ETId=ETID, ES=30, UID=[f"uid-{r['n']}" for r in rows]
+    )
+
+
+@pytest.fixture
+def service():
+    service = MagicMock()
+    service._codec.return_value = JsonCodec()
+    service.insert_encoded_records.side_effect = lambda records, ETId: submission(
+        records
+    )
+    return service
+
+
+def test_encoded_submits_are_json_objects(service):
+    """Test that str and bytes records are taken as encoded JSON objects"""
+    writer = BatchWriter(service, ETID, max_delay_ms=10_000)
+
+    futures = [
+        writer.submit('{"n": 1}'),
+        writer.submit(b'{"n": 2}'),
+        writer.submit({"n": 3}),
+    ]
+    writer.close()
+
+    assert [f.result(timeout=1) for f in futures] == ["uid-1", "uid-2", "uid-3"]
+    records = service.insert_encoded_records.call_args.args[0]
+    assert records == [b'{"n": 1}', b'{"n": 2}', b'{"n":3}']
+
+
+def test_submits_are_coalesced(service):
+    """Test that concurrent submits share one bulk call and get their own UID"""
+    writer = BatchWriter(service, ETID, max_delay_ms=10_000)
+
+    futures = [writer.submit({"n": n}) for n in range(5)]
+    writer.flush()
+
+    assert [f.result(timeout=1) for f in futures] == [f"uid-{n}" for n in range(5)]
+    service.insert_encoded_records.assert_called_once()
+    writer.close()
+
+
+def test_max_items_triggers_flush(service):
+    """Test that a full batch is sent without waiting for the delay"""
+    writer = BatchWriter(service, ETID, max_items=3, max_delay_ms=10_000)
+
+    futures = [writer.submit({"n": n}) for n in range(7)]
+    for future in futures[:6]:
+        future.result(timeout=1)
+
+    assert service.insert_encoded_records.call_count == 2
+    assert writer.pending == 1
+    writer.close()
+
+    assert futures[6].result(timeout=1) == "uid-6"
+    assert service.insert_encoded_records.call_count == 3
+
+
+def test_max_delay_triggers_flush(service):
+    """Test that a lone record is sent once max_delay_ms has elapsed"""
+    with BatchWriter(service, ETID, max_delay_ms=5) as writer:
+        assert writer.submit({"n": 1}).result(timeout=1) == "uid-1"
+
+
+def test_failures_reach_every_caller(service):
+    """Test that a failed or rejected batch fails each caller's future"""
+    writer = BatchWriter(service, ETID, max_delay_ms=10_000)
+
+    service.insert_encoded_records.side_effect = RuntimeError("boom")
+    future = writer.submit({"n": 1})
+    writer.flush()
+    with pytest.raises(RuntimeError, match="boom"):
+        future.result(timeout=1)
+
+    service.insert_encoded_records.side_effect = None
+    service.insert_encoded_records.return_value = None
+    future = writer.submit({"n": 2})
+    writer.flush()
+    with pytest.raises(BatchSubmitError):
+        future.result(timeout=1)
+
+    writer.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.submit({"n": 3})
+
+
+def test_close_drops_the_exit_hook(service):
+    """Test that closed writers leave the atexit table and can be collected"""
+    with patch("walacor_sdk.data_requests.batch_writer.atexit") as fake_atexit:
+        writer = BatchWriter(service, ETID)
+        hook = fake_atexit.register.call_args.args[0]
+        writer.close()
+
+    fake_atexit.unregister.assert_called_once_with(hook)
+    ref = weakref.ref(writer)
+    del writer, hook
+    gc.collect()
+    assert ref() is None
+
+
+def test_service_shares_one_writer_per_etid():
+    """Test that DataRequestsService caches writers and closes them together"""
+    service = DataRequestsService(MagicMock())
+    service.insert_encoded_records = MagicMock(
+        side_effect=lambda records, ETId: submission(records)
+    )
+
+    writer = service.batch_writer(ETID, max_delay_ms=10_000)
+    assert service.batch_writer(ETID) is writer
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda n=n: results.append(writer.submit({"n": n})))
+        for n in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    service.close_batch_writers()
+
+    assert sorted(f.result(timeout=1) for f in results) == sorted(
+        f"uid-{n}" for n in range(20)
+    )
+    assert service.insert_encoded_records.call_count == 1
+    assert service.batch_writer(ETID) is not writer
+    service.close_batch_writers()
@@ -1,11 +1,18 @@
+import base64
+import json
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from walacor_sdk.base.model.pool_config import PoolConfig
 from walacor_sdk.base.w_client import W_Client
 from walacor_sdk.utils.enums import RequestType
 from walacor_sdk.utils.exceptions import APIConnectionError
+from walacor_sdk.utils.token import refresh_deadline, token_expiry
 
 BASE_URL = "http://fakeapi.com"
 USERNAME = "testuser"
@@ -15,7 +22,7 @@ TEST_ENDPOINT = "test-endpoint"
 
 def test_client_authenticate_success():
     """Test that W_Client successfully authenticates and stores token"""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"api_token": "Bearer fake_token"}
@@ -38,7 +45,7 @@ def test_client_authenticate_success():
 
 def test_client_authenticate_failure():
     """Test that W_Client raises APIConnectionError on failed authentication"""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 401
         mock_response.raise_for_status.side_effect = requests.HTTPError(
@@ -58,7 +65,10 @@ def test_client_authenticate_failure():
 
 def test_client_request_with_authentication():
     """Test that W_Client adds the authentication token in headers and makes a request"""
-    with patch("requests.post") as mock_post, patch("requests.request") as mock_request:
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch("requests.Session.request") as mock_request,
+    ):
         # Mock authentication response
         mock_auth_response = MagicMock()
         mock_auth_response.status_code = 200
@@ -91,7 +101,10 @@ def test_client_request_with_authentication():
 
 def test_client_request_reauth_on_401():
     """Test that W_Client re-authenticates and retries on 401 Unauthorized"""
-    with patch("requests.post") as mock_post, patch("requests.request") as mock_request:
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch("requests.Session.request") as mock_request,
+    ):
         # Mock authentication response
         mock_auth_response = MagicMock()
         mock_auth_response.status_code = 200
@@ -118,3 +131,188 @@ def test_client_request_reauth_on_401():
 
         assert mock_post.call_count == 1
         assert mock_request.call_count == 2
+
+
+def test_client_reuses_pooled_session():
+    """Test that every request goes through the same pooled session"""
+    client = W_Client(BASE_URL, USERNAME, PASSWORD, pool=PoolConfig(pool_maxsize=4))
+    client._token = "Bearer fake_token"
+
+    adapter = client.session.get_adapter(BASE_URL)
+    assert adapter._pool_maxsize == 4
+
+    with patch("requests.Session.request") as mock_request:
+        mock_request.return_value = MagicMock(status_code=200)
+
+        client.request(RequestType.GET, TEST_ENDPOINT)
+        client.request(RequestType.GET, TEST_ENDPOINT)
+
+        assert mock_request.call_count == 2
+    assert client.session is client._session
+
+
+def test_client_drops_idle_sockets():
+    """Test that the pool is cleared once it sat idle longer than max_idle"""
+    client = W_Client(BASE_URL, USERNAME, PASSWORD, pool=PoolConfig(max_idle=1))
+
+    with patch.object(client._session, "close") as mock_close:
+        _ = client.session
+        mock_close.assert_not_called()
+
+        client._last_used -= 5
+        _ = client.session
+        mock_close.assert_called_once()
+
+
+def test_client_keep_alive_disabled():
+    """Test that keep_alive=False asks the server to close each connection"""
+    client = W_Client(BASE_URL, USERNAME, PASSWORD, pool=PoolConfig(keep_alive=False))
+
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_client_change_server_and_credentials():
+    """Test that server/credential changes keep the pool but reset what they must"""
+    client = W_Client(BASE_URL, USERNAME, PASSWORD)
+    client._token = "Bearer fake_token"
+    session = client._session
+
+    with patch.object(session, "close") as mock_close:
+        client.base_url = BASE_URL
+        mock_close.assert_not_called()
+
+        client.base_url = "http://other.com"
+        mock_close.assert_called_once()
+
+    client.update_credentials("other", "secret")
+
+    assert client._session is session
+    assert client.token is None
+    assert client._username == "other"
+
+
+def make_jwt(exp: float) -> str:
+    def encode(part: dict) -> str:
+        raw = json.dumps(part).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    return f"Bearer {encode({'alg': 'HS256'})}.{encode({'exp': exp})}.sig"
+
+
+def test_token_expiry_parses_jwt():
+    """Test that the exp claim is read from a Bearer JWT and junk is ignored"""
+    assert token_expiry(make_jwt(1_900_000_000)) == 1_900_000_000
+    assert token_expiry("Bearer not-a-jwt") is None
+    assert token_expiry("Bearer a.!!!.c") is None
+    assert token_expiry(None) is None
+
+
+def test_client_single_flight_refresh_on_401():
+    """Test that concurrent 401s trigger a single login shared by all threads"""
+    logins = []
+
+    def login(*args, **kwargs):
+        time.sleep(0.05)
+        logins.append(1)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"api_token": "Bearer fresh_token"}
+        return response
+
+    def send(method, url, headers, **kwargs):
+        ok = headers["Authorization"] == "Bearer fresh_token"
+        return MagicMock(status_code=200 if ok else 401)
+
+    with (
+        patch("requests.Session.post", side_effect=login),
+        patch("requests.Session.request", side_effect=send) as mock_request,
+    ):
+        client = W_Client(BASE_URL, USERNAME, PASSWORD)
+        client._token = "Bearer expired_token"
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(
+                pool.map(
+                    lambda _: client.request(RequestType.GET, TEST_ENDPOINT), range(16)
+                )
+            )
+
+    assert len(logins) == 1
+    assert all(r.status_code == 200 for r in responses)
+    assert mock_request.call_count <= 32
+
+
+def test_client_refreshes_expiring_token_before_request():
+    """Test that a token inside the refresh margin is renewed without a 401"""
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch("requests.Session.request") as mock_request,
+    ):
+        mock_post.return_value.json.return_value = {
+            "api_token": make_jwt(time.time() + 3600)
+        }
+        mock_request.return_value = MagicMock(status_code=200)
+
+        client = W_Client(BASE_URL, USERNAME, PASSWORD, auto_refresh=False)
+        client._token = make_jwt(time.time() + 10)
+        client._refresh_at = time.time() - 1
+
+        client.request(RequestType.GET, TEST_ENDPOINT)
+
+        assert mock_post.call_count == 1
+        assert mock_request.call_count == 1
+        sent = mock_request.call_args.kwargs["headers"]["Authorization"]
+        assert sent == client.token
+
+
+def test_client_background_refresh():
+    """Test that the token is renewed in the background ahead of expiry"""
+    tokens = iter([make_jwt(time.time() + 2), make_jwt(time.time() + 3600)])
+
+    def login(*args, **kwargs):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"api_token": next(tokens)}
+        return response
+
+    with patch("requests.Session.post", side_effect=login) as mock_post:
+        client = W_Client(BASE_URL, USERNAME, PASSWORD, refresh_margin=60)
+        client.authenticate()
+        first = client.token
+
+        deadline = time.time() + 3
+        while client.token == first and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert mock_post.call_count == 2
+        assert client.token != first
+        client.close()
+        assert client._refresh_timer is None
+
+
+def test_refresh_deadline_bounds_short_lived_tokens():
+    """Test that the margin is capped by the lifetime and past tokens are skipped"""
+    assert refresh_deadline(1030.0, 60, now=1000.0) == 1015.0
+    assert refresh_deadline(1600.0, 60, now=1000.0) == 1540.0
+    assert refresh_deadline(1000.5, 60, now=1000.0) == 1001.0
+    assert refresh_deadline(990.0, 60, now=1000.0) is None
+    assert refresh_deadline(None, 60, now=1000.0) is None
+
+
+@pytest.mark.parametrize("lifetime", [30, -30])
+def test_short_lived_token_does_not_loop_logins(lifetime):
+    """Test that a token shorter than the margin (or expired by the local clock) logs in once"""
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch("requests.Session.request") as mock_request,
+    ):
+        mock_post.return_value.json.side_effect = lambda: {
+            "api_token": make_jwt(time.time() + lifetime)
+        }
+        mock_request.return_value = MagicMock(status_code=200)
+
+        client = W_Client(BASE_URL, USERNAME, PASSWORD, refresh_margin=60)
+        for _ in range(20):
+            client.request(RequestType.GET, TEST_ENDPOINT)
+        time.sleep(0.2)
+
+        assert mock_post.call_count == 1
+        client.close()
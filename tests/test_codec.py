@@ -0,0 +1,95 @@
+import json
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.base.model.json_response import JsonResponse
+from walacor_sdk.base.w_client import W_Client
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.utils import codec as codec_module
+from walacor_sdk.utils.codec import JsonCodec, default_codec, get_codec, set_codec
+from walacor_sdk.utils.enums import RequestType
+
+BASE_URL = "http://fakeapi.com"
+
+
+def test_stdlib_codec_round_trip():
+    """Test that the stdlib codec writes compact UTF-8 bytes"""
+    codec = JsonCodec()
+
+    body = codec.dumps({"name": "café", "n": [1, 2]})
+
+    assert body == '{"name":"café","n":[1,2]}'.encode()
+    assert codec.loads(body) == {"name": "café", "n": [1, 2]}
+    assert codec.loads(memoryview(body)) == codec.loads(body.decode())
+    with pytest.raises(ValueError):
+        codec.dumps(float("nan"))
+
+
+def test_orjson_codec_matches_stdlib():
+    """Test that OrjsonCodec produces the same documents as the stdlib"""
+    pytest.importorskip("orjson")
+    from walacor_sdk.utils.codec import OrjsonCodec
+
+    codec = OrjsonCodec()
+    record = {"a": 1, "b": "ü", "c": [True, None, 1.5], 5: "int key"}
+
+    assert json.loads(codec.dumps(record)) == json.loads(JsonCodec().dumps(record))
+    assert codec.loads(codec.dumps(record))["5"] == "int key"
+    assert isinstance(codec.dumps(record), bytes)
+
+
+def test_default_codec_falls_back_without_orjson():
+    """Test that the stdlib codec is chosen when orjson is missing"""
+    with patch.dict("sys.modules", {"orjson": None}):
+        codec = default_codec()
+
+    assert type(codec) is JsonCodec
+
+
+def test_set_codec_replaces_process_default():
+    """Test that set_codec changes the codec used by JsonResponse"""
+    previous = get_codec()
+    custom = MagicMock(spec=JsonCodec)
+    custom.loads.return_value = {"success": True}
+    try:
+        set_codec(custom)
+        assert JsonResponse(b"{}").json() == {"success": True}
+    finally:
+        set_codec(previous)
+
+    assert codec_module.get_codec() is previous
+
+
+def test_client_encodes_json_once_with_its_codec():
+    """Test that W_Client sends pre-encoded bytes instead of json="""
+    codec = MagicMock(spec=JsonCodec)
+    codec.dumps.return_value = b'{"x":1}'
+    client = W_Client(BASE_URL, "user", "pass", codec=codec)
+    client._token = "Bearer t"
+
+    with patch("requests.Session.request") as mock_request:
+        mock_request.return_value.status_code = 200
+        client.request(RequestType.POST, "query/get", json={"x": 1})
+
+    codec.dumps.assert_called_once_with({"x": 1})
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == b'{"x":1}'
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_service_decodes_with_client_codec():
+    """Test that responses are decoded by the client's codec"""
+    codec = MagicMock(spec=JsonCodec)
+    codec.loads.return_value = {"success": True, "data": []}
+    client = MagicMock()
+    client.codec = codec
+    client.request.return_value.content = b"ignored"
+    service = DataRequestsService(client)
+
+    response = service._post("query/get")
+
+    assert response["success"] is True
+    codec.loads.assert_called_once_with(b"ignored")
@@ -0,0 +1,140 @@
+import json
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.data_requests.columnar import ColumnarResult, build_columns
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.schema.models.models import SchemaField
+
+ROWS = [
+    {"id": 1, "name": "a", "price": 1.5, "active": True},
+    {"id": 2, "name": None, "price": 2.0},
+    {"id": None, "name": "c", "price": 3.25, "active": False, "extra": "x"},
+]
+TYPES = {"id": "INTEGER", "name": "TEXT", "price": "DECIMAL", "active": "BOOLEAN"}
+
+
+@pytest.fixture
+def service():
+    return DataRequestsService(MagicMock())
+
+
+def http_response(payload):
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+def schema_detail(types):
+    detail = MagicMock()
+    detail.Fields = [SchemaField(FieldName=k, DataType=v) for k, v in types.items()]
+    return detail
+
+
+def test_build_columns_pads_missing_values():
+    """Test rows are pivoted in one pass with None for missing columns."""
+    columns = build_columns(ROWS + ['{"id": 4}'])
+
+    assert list(columns) == ["id", "name", "price", "active", "extra"]
+    assert columns["active"] == [True, None, False, None]
+    assert columns["extra"] == [None, None, "x", None]
+    assert columns["id"] == [1, 2, None, 4]
+
+
+def test_as_arrow_uses_schema_types():
+    """Test Arrow columns take their type from the schema."""
+    pa = pytest.importorskip("pyarrow")
+    table = ColumnarResult(build_columns(ROWS), TYPES).as_arrow()
+
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("name").type == pa.string()
+    assert table.schema.field("active").type == pa.bool_()
+    assert table.column("id").null_count == 1
+    assert table.num_rows == 3
+
+
+def test_as_pandas_uses_nullable_dtypes():
+    """Test pandas columns use nullable dtypes chosen from the schema."""
+    pytest.importorskip("pandas")
+    frame = ColumnarResult(build_columns(ROWS), TYPES).as_pandas()
+
+    assert str(frame["id"].dtype) == "Int64"
+    assert str(frame["active"].dtype) == "boolean"
+    assert frame["price"].tolist() == [1.5, 2.0, 3.25]
+
+
+def test_as_numpy_record_array():
+    """Test NumPy record arrays fall back to float/object where nulls occur."""
+    np = pytest.importorskip("numpy")
+    records = ColumnarResult(build_columns(ROWS), TYPES).as_numpy()
+
+    assert records.dtype["price"] == np.float64
+    assert records.dtype["id"] == np.float64
+    assert np.isnan(records["id"][2])
+    assert records["name"][0] == "a"
+
+
+@patch("walacor_sdk.data_requests.columnar.SchemaService")
+def test_reader_decodes_body_and_caches_schema(mock_schema, service):
+    """Test columnar reads decode the body and fetch the schema once per ETId."""
+    mock_schema.return_value.get_schema_details_with_ETId.return_value = schema_detail(
+        TYPES
+    )
+    service._post = MagicMock(
+        return_value=http_response({"success": True, "data": ROWS, "total": 3})
+    )
+
+    first = service.columnar.get_all(10)
+    second = service.columnar.post_complex_query(10, [{"$match": {}}])
+
+    assert len(first) == 3
+    assert first.total == 3
+    assert first.types == TYPES
+    assert second.columns["price"] == [1.5, 2.0, 3.25]
+    assert service._post.call_args.kwargs["json"] == [{"$match": {}}]
+    mock_schema.return_value.get_schema_details_with_ETId.assert_called_once_with(10)
+
+
+@patch("walacor_sdk.data_requests.columnar.logger")
+def test_reader_failure_flag(mock_logging, service):
+    """Test a success=false response returns None."""
+    service._post = MagicMock(return_value=http_response({"success": False}))
+
+    assert service.columnar.post_query_api(10, {}) is None
+    mock_logging.error.assert_called_once_with("Failed to fetch columnar results")
+
+
+@patch("walacor_sdk.data_requests.columnar.SchemaService")
+def test_reader_retries_failed_schema_fetch(mock_schema, service):
+    """Test a failed schema fetch leaves the result untyped but is not cached."""
+    fetch = mock_schema.return_value.get_schema_details_with_ETId
+    fetch.side_effect = [None, schema_detail(TYPES)]
+    service._post = MagicMock(
+        return_value=http_response({"success": True, "data": ROWS})
+    )
+
+    assert service.columnar.get_all(10).types == {}
+    assert service.columnar.get_all(10).types == TYPES
+    assert service.columnar.get_all(10).types == TYPES
+    assert fetch.call_count == 2
+
+
+def test_reader_decodes_with_client_codec(service):
+    """Test the body is decoded once by the client's codec, not a local parser."""
+    from walacor_sdk.utils.codec import JsonCodec
+
+    codec = JsonCodec()
+    codec.loads = MagicMock(wraps=codec.loads)
+    service.client.codec = codec
+    service.columnar._schemas[10] = TYPES
+    service._post = MagicMock(
+        return_value=http_response({"success": True, "data": ROWS, "total": 3})
+    )
+
+    result = service.columnar.get_all(10)
+
+    codec.loads.assert_called_once()
+    assert result.columns["id"] == [1, 2, None]
+    assert result.columns["extra"] == [None, None, "x"]
@@ -1,6 +1,10 @@
+import json
+import threading
+
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from pydantic import ValidationError
 
@@ -9,6 +13,8 @@ from walacor_sdk.data_requests.models.data_request_response import (
     SingleDataRequestResponse,
 )
 from walacor_sdk.data_requests.models.models import SubmissionResult
+from walacor_sdk.utils.codec import JsonCodec
+from walacor_sdk.utils.exceptions import APIConnectionError, PageFetchError
 
 # ------------------------------> FIXTURES
 
@@ -326,6 +332,109 @@ def test_update_multiple_record_missing_uid(mock_logging, service):
     mock_logging.error.assert_called_with("UID is required in all records for update")
 
 
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_update_multiple_record_not_an_object(mock_logging, service):
+    """
+    Should reject records that are not JSON objects without submitting.
+    """
+    service._post = MagicMock()
+    result = service.update_multiple_record(['["UID"]'], 42)
+
+    assert result is None
+    service._post.assert_not_called()
+    mock_logging.error.assert_called_with(
+        "Invalid JSON in records: expected a JSON object"
+    )
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_update_multiple_record_invalid_json(mock_logging, service):
+    """
+    Should reject malformed JSON locally; oversized records are only scanned.
+    """
+    from walacor_sdk.data_requests.payload import VALIDATE_MAX_BYTES, update_error
+
+    service._post = MagicMock()
+    result = service.update_multiple_record([b'{"UID": "u1", "a": }'], 42)
+
+    assert result is None
+    service._post.assert_not_called()
+    assert "Invalid JSON in records" in mock_logging.error.call_args[0][0]
+
+    padding = "x" * VALIDATE_MAX_BYTES
+    assert update_error(b'{"UID": "u1", "a": ' + padding.encode() + b"}") is None
+    assert update_error(b'{"a": "' + padding.encode() + b'"}') == (
+        "UID is required in all records for update"
+    )
+
+
+# ------------------------------> PRE-ENCODED RECORDS
+
+
+def test_payload_helpers_scan_without_parsing():
+    """Test UID scanning and body assembly on encoded records."""
+    from walacor_sdk.data_requests.payload import has_uid, is_object, submit_body
+
+    assert has_uid(b'{"a": 1, "UID" : "x"}')
+    assert not has_uid(b'{"note": "has \\"UID\\": inside"}')
+    assert not has_uid(b'{"uid": "x"}')
+    assert is_object(b' {"a": 1}\n') and not is_object(b"[1]")
+    body = submit_body([b'{"a":1}', memoryview(b'{"b":2}')])
+    assert json.loads(body) == {"Data": [{"a": 1}, {"b": 2}]}
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_insert_encoded_records_joins_buffers(mock_logging, service):
+    """Test encoded records are posted as one joined body, not re-encoded."""
+    service._post = MagicMock(
+        return_value={
+            "success": True,
+            "data": {"EId": "e", "ETId": 90000000, "ES": 30, "UID": ["u1", "u2"]},
+        }
+    )
+
+    result = service.insert_encoded_records([b'{"n":1}', '{"n":2}'], 90000000)
+
+    assert result.UID == ["u1", "u2"]
+    service._post.assert_called_once_with(
+        "envelopes/submit",
+        data=b'{"Data":[{"n":1},{"n":2}]}',
+        headers={"ETId": "90000000"},
+    )
+    mock_logging.error.assert_not_called()
+
+
+def test_encoded_records_use_the_client_codec(service):
+    """Test dict records mixed into encoded submits use the client's codec."""
+
+    class TaggingCodec(JsonCodec):
+        def dumps(self, obj):
+            return super().dumps({**obj, "codec": "client"})
+
+    service._codec = MagicMock(return_value=TaggingCodec())
+    service._post = MagicMock(return_value={"success": False})
+
+    service.insert_encoded_records([b'{"n":1}', {"n": 2}], 90000000)
+
+    assert json.loads(service._post.call_args.kwargs["data"]) == {
+        "Data": [{"n": 1}, {"n": 2, "codec": "client"}]
+    }
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_update_encoded_records_requires_uid(mock_logging, service):
+    """Test update_encoded_records checks UID by scan before submitting."""
+    service._post = MagicMock(return_value={"success": False})
+
+    assert service.update_encoded_records([b'{"UID":"a"}', b'{"n":1}'], 7) is None
+    service._post.assert_not_called()
+    mock_logging.error.assert_called_with("UID is required in all records for update")
+
+    assert service.update_encoded_records([b'{"UID":"a"}'], 7) is None
+    assert service._post.call_args.kwargs["data"] == b'{"Data":[{"UID":"a"}]}'
+    mock_logging.error.assert_called_with("Failed to update records")
+
+
 # ------------------------------> GET ALL RECORDS
 
 
@@ -461,6 +570,45 @@ def test_get_single_record_by_record_id_validation_error(mock_logging, service):
         )
 
 
+# ------------------------------> GET MANY BY UID
+
+
+def test_get_many_by_uid_chunks_and_dedupes(service):
+    """Test get_many_by_uid sends one $in query per chunk and maps rows by UID."""
+    service._post = MagicMock(
+        side_effect=lambda endpoint, headers, json: {
+            "success": True,
+            "data": [{"UID": uid} for uid in json["UID"]["$in"] if uid != "u3"],
+        }
+    )
+
+    result = service.get_many_by_uid(7, ["u1", "u2", "u1", "u3"], chunk_size=2)
+
+    assert result == {"u1": {"UID": "u1"}, "u2": {"UID": "u2"}}
+    assert service._post.call_count == 2
+    service._post.assert_any_call(
+        "query/get?fromSummary=false",
+        headers={"ETId": "7"},
+        json={"UID": {"$in": ["u1", "u2"]}},
+    )
+    service._post.assert_any_call(
+        "query/get?fromSummary=false",
+        headers={"ETId": "7"},
+        json={"UID": {"$in": ["u3"]}},
+    )
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_get_many_by_uid_failure(mock_logging, service):
+    """Test get_many_by_uid returns None when any chunk fails."""
+    service._post = MagicMock(
+        side_effect=[{"success": True, "data": [{"UID": "u1"}]}, {"success": False}]
+    )
+
+    assert service.get_many_by_uid(7, ["u1", "u2"], chunk_size=1) is None
+    mock_logging.error.assert_called_once_with("Failed to fetch records by UID")
+
+
 # ------------------------------> COMPLEX QUERY
 
 
@@ -680,3 +828,436 @@ def test_post_complex_MQL_queries_validation_error(mock_logging, service):
             "GetComplexQMLQueryResponse Validation Error"
             in mock_logging.error.call_args[0][0]
         )
+
+
+# ------------------------------> INSERT CHUNKED
+
+
+def sent_rows(kwargs):
+    """Rows of a submit body, whether sent as ``json=`` or as joined bytes."""
+    body = kwargs["json"] if "json" in kwargs else json.loads(kwargs["data"])
+    return body["Data"]
+
+
+def submit_response(**kwargs):
+    rows = sent_rows(kwargs)
+    return {
+        "success": True,
+        "data": {
+            "EId": f"e-{rows[0]['n']}",
+            "ETId": 90000000,
+            "ES": 30,
+            "UID": [f"uid-{row['n']}" for row in rows],
+        },
+    }
+
+
+def test_iter_batches_limits_rows_and_bytes():
+    """Test iter_batches splits by row count and serialized size."""
+    from walacor_sdk.data_requests.batching import iter_batches
+
+    rows = [{"n": n} for n in range(5)]
+
+    assert [len(b) for _, b in iter_batches(rows, max_rows=2)] == [2, 2, 1]
+    assert [o for o, _ in iter_batches(rows, max_rows=2)] == [0, 2, 4]
+    assert [len(b) for _, b in iter_batches(rows, max_bytes=16)] == [2, 2, 1]
+    assert [len(b) for _, b in iter_batches(rows, max_bytes=1)] == [1] * 5
+
+
+def test_insert_records_chunked_keeps_input_order(service):
+    """Test insert_records_chunked submits batches in parallel and merges UIDs in order."""
+    service._post = MagicMock(side_effect=lambda *a, **kw: submit_response(**kw))
+    rows = [{"n": n} for n in range(25)]
+
+    result = service.insert_records_chunked(rows, 90000000, max_rows=4, max_workers=3)
+
+    assert result.success
+    assert result.UID == [f"uid-{n}" for n in range(25)]
+    assert [s.EId for s in result.Submissions] == [f"e-{n}" for n in range(0, 25, 4)]
+    assert service._post.call_count == 7
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_insert_records_chunked_reports_failed_batches(mock_logging, service):
+    """Test a failed batch leaves None UIDs and is listed without stopping others."""
+
+    def post(*args, **kwargs):
+        if sent_rows(kwargs)[0]["n"] == 2:
+            return {"success": False}
+        return submit_response(**kwargs)
+
+    service._post = MagicMock(side_effect=post)
+    rows = [{"n": n} for n in range(5)]
+
+    result = service.insert_records_chunked(rows, 90000000, max_rows=2)
+
+    assert not result.success
+    assert result.UID == ["uid-0", "uid-1", None, None, "uid-4"]
+    assert [(f.Offset, f.Count) for f in result.FailedBatches] == [(2, 2)]
+
+
+def test_insert_records_chunked_accepts_encoded_records(service):
+    """Test chunked inserts of bytes records use the joined-buffer path."""
+
+    def post(*args, **kwargs):
+        return submit_response(**kwargs)
+
+    service._post = MagicMock(side_effect=post)
+    rows = [json.dumps({"n": n}).encode() for n in range(5)]
+
+    result = service.insert_records_chunked(rows, 90000000, max_rows=2)
+
+    assert result.UID == [f"uid-{n}" for n in range(5)]
+    assert all("json" not in c.kwargs for c in service._post.call_args_list)
+
+
+def test_insert_records_chunked_encodes_each_row_once(service):
+    """Test rows are encoded once with the client codec and sent as joined bytes."""
+    codec = JsonCodec()
+    codec.dumps = MagicMock(wraps=codec.dumps)
+    service.client.codec = codec
+    service._post = MagicMock(side_effect=lambda *a, **kw: submit_response(**kw))
+    rows = [{"n": n} for n in range(5)]
+
+    result = service.insert_records_chunked(rows, 90000000, max_rows=2, max_bytes=16)
+
+    assert result.UID == [f"uid-{n}" for n in range(5)]
+    assert codec.dumps.call_count == 5
+    assert all("data" in c.kwargs for c in service._post.call_args_list)
+
+
+# ------------------------------> RESILIENT INSERT
+
+
+def bisect_post(bad):
+    """Fake submit: 422 when the batch holds a row whose n is in *bad*."""
+
+    def post(*args, **kwargs):
+        rows = sent_rows(kwargs)
+        response = MagicMock()
+        if any(row["n"] in bad for row in rows):
+            response.status_code = 422
+            response.content = b'{"errors": [{"message": "bad row"}]}'
+        else:
+            response.status_code = 200
+            response.content = json.dumps(submit_response(**kwargs)).encode()
+        return response
+
+    return post
+
+
+def test_insert_records_resilient_isolates_bad_rows(service):
+    """Test bisection commits every valid row and reports each bad one."""
+    service._post = MagicMock(side_effect=bisect_post({5, 6, 13}))
+    rows = [{"n": n} for n in range(16)]
+
+    result = service.insert_records_resilient(rows, 90000000)
+
+    assert not result.success
+    assert [(f.Row, f.Error) for f in result.FailedRows] == [
+        (5, "bad row"),
+        (6, "bad row"),
+        (13, "bad row"),
+    ]
+    assert result.UID == [None if n in {5, 6, 13} else f"uid-{n}" for n in range(16)]
+    assert result.Requests == service._post.call_count
+    assert result.Requests < 16
+
+
+def test_insert_records_resilient_skips_known_bad_half(service):
+    """Test a half is split without a submit when its sibling went through."""
+    service._post = MagicMock(side_effect=bisect_post({1}))
+
+    result = service.insert_records_resilient([{"n": 0}, {"n": 1}], 90000000)
+
+    assert result.UID == ["uid-0", None]
+    # whole batch, then the left row; the right row is known to be bad
+    assert result.Requests == 2
+
+
+def test_insert_records_resilient_does_not_split_other_failures(service):
+    """Test non-422 failures fail the batch without bisecting."""
+    service._post = MagicMock(side_effect=RuntimeError("down"))
+
+    result = service.insert_records_resilient([{"n": n} for n in range(4)], 1)
+
+    assert result.Requests == 1
+    assert [f.Row for f in result.FailedRows] == [0, 1, 2, 3]
+    assert result.FailedRows[0].Error == "down"
+
+
+# ------------------------------> INSERT STREAM
+
+
+def test_insert_stream_pulls_lazily_with_bounded_in_flight(service):
+    """Test insert_stream batches a generator and never runs ahead of max_in_flight."""
+    pulled = []
+
+    def rows():
+        for n in range(10):
+            pulled.append(n)
+            yield {"n": n}
+
+    def post(*args, **kwargs):
+        # at most one batch beyond the one in flight has been pulled
+        assert len(pulled) <= (service._post.call_count + 1) * 3 + 1
+        return submit_response(**kwargs)
+
+    service._post = MagicMock(side_effect=post)
+    collected = {}
+
+    result = service.insert_stream(
+        rows(),
+        90000000,
+        max_rows=3,
+        max_in_flight=1,
+        on_batch=lambda offset, batch, res: collected.update(
+            zip(range(offset, offset + len(batch)), res.UID)
+        ),
+    )
+
+    assert result.success
+    assert (result.Records, result.Inserted, result.Batches) == (10, 10, 4)
+    assert [collected[n] for n in range(10)] == [f"uid-{n}" for n in range(10)]
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_insert_jsonl_and_csv(mock_logging, service, tmp_path):
+    """Test insert_jsonl and insert_csv stream file rows and report failed batches."""
+    jsonl = tmp_path / "rows.jsonl"
+    jsonl.write_text('{"n": 0}\n\n{"n": 1}\n{"n": 2}\n')
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text("n;name\n0;a\n1;b\n")
+
+    service._post = MagicMock(side_effect=lambda *a, **kw: submit_response(**kw))
+
+    result = service.insert_jsonl(jsonl, 90000000, max_rows=2)
+    assert (result.Records, result.Inserted, result.Batches) == (3, 3, 2)
+
+    result = service.insert_csv(csv_file, 90000000, delimiter=";")
+    assert result.Inserted == 2
+    assert sent_rows(service._post.call_args.kwargs) == [
+        {"n": "0", "name": "a"},
+        {"n": "1", "name": "b"},
+    ]
+
+    service._post = MagicMock(return_value={"success": False})
+    result = service.insert_jsonl(jsonl, 90000000)
+    assert not result.success
+    assert result.Inserted == 0
+    assert [(f.Offset, f.Count) for f in result.FailedBatches] == [(0, 3)]
+
+
+# ------------------------------> ITERATORS
+
+
+def test_iter_all_pages_until_short_page(service):
+    """Test iter_all walks 1-based pages and stops after a short page."""
+    pages = {1: [{"n": 0}, {"n": 1}], 2: [{"n": 2}, {"n": 3}], 3: [{"n": 4}]}
+    service.get_all = MagicMock(
+        side_effect=lambda ETId, page, size, summary, cache: pages[page]
+    )
+
+    rows = list(service.iter_all(10, page_size=2))
+
+    assert rows == [{"n": n} for n in range(5)]
+    assert [c.args[1] for c in service.get_all.call_args_list] == [1, 2, 3]
+
+
+def test_iter_all_prefetches_next_page(service):
+    """Test the next page is requested before the current one is consumed."""
+    prefetched = threading.Event()
+
+    def get_all(ETId, page, size, summary, cache):
+        if page == 2:
+            prefetched.set()
+        return [{"n": page}] if page < 3 else []
+
+    service.get_all = MagicMock(side_effect=get_all)
+
+    rows = service.iter_all(10, page_size=1)
+    assert next(rows) == {"n": 1}
+    assert prefetched.wait(timeout=1)
+    assert list(rows) == [{"n": 2}]
+    assert service.get_all.call_count == 3
+
+
+def test_iter_query_raises_on_failed_page(service):
+    """Test iter_query raises PageFetchError when a page request fails."""
+    from walacor_sdk.utils.exceptions import PageFetchError
+
+    service.post_query_api = MagicMock(side_effect=[["a", "b"], None])
+
+    rows = service.iter_query(10, {"x": 1}, page_size=2)
+    assert [next(rows), next(rows)] == ["a", "b"]
+    with pytest.raises(PageFetchError, match="Page 2"):
+        next(rows)
+    service.post_query_api.assert_called_with(10, {"x": 1}, 1, 2, 2, cache=False)
+
+
+def test_iter_keyset_posts_uncached_getcomplex_pages(service):
+    """Test iter_keyset pages with getcomplex keyed on the last row."""
+    pages = [
+        {"success": True, "data": [{"UID": "a", "UpdatedAt": 1}]},
+        {"success": True, "data": []},
+    ]
+    service._post = MagicMock(side_effect=pages)
+
+    rows = list(service.iter_keyset(5, page_size=1))
+
+    assert rows == [{"UID": "a", "UpdatedAt": 1}]
+    second = service._post.call_args_list[1]
+    assert second.args == ("query/getcomplex",)
+    assert second.kwargs["headers"] == {"ETId": "5"}
+    assert second.kwargs["json"][0] == {
+        "$match": {
+            "$or": [{"UpdatedAt": {"$gt": 1}}, {"UpdatedAt": 1, "UID": {"$gt": "a"}}]
+        }
+    }
+
+
+# ------------------------------> EXPORT
+
+
+def test_count_records_reads_total(service):
+    """Test count_records requests totalReq and returns the total."""
+    service._post = MagicMock(return_value={"success": True, "data": [], "total": 42})
+
+    assert service.count_records(10) == 42
+    assert "totalReq=true" in service._post.call_args.args[0]
+
+
+def test_export_all_fans_out_and_keeps_order(service):
+    """Test export_all fetches every page concurrently and yields rows in order."""
+    service.count_records = MagicMock(return_value=7)
+    service.get_all = MagicMock(
+        side_effect=lambda ETId, page, size, summary, cache: [
+            {"n": n} for n in range((page - 1) * size, min(page * size, 7))
+        ]
+    )
+
+    rows = list(service.export_all(10, page_size=2, max_workers=3))
+
+    assert rows == [{"n": n} for n in range(7)]
+    assert sorted(c.args[1] for c in service.get_all.call_args_list) == [1, 2, 3, 4]
+
+    unordered = list(service.export_all(10, page_size=2, ordered=False))
+    assert sorted(r["n"] for r in unordered) == list(range(7))
+
+
+def test_export_all_failed_page_and_fallback(service):
+    """Test a failed page raises PageFetchError and a missing total falls back."""
+    from walacor_sdk.utils.exceptions import PageFetchError
+
+    service.count_records = MagicMock(return_value=4)
+    service.get_all = MagicMock(
+        side_effect=lambda ETId, page, size, summary, cache: (
+            None if page == 2 else [{}] * 2
+        )
+    )
+    with pytest.raises(PageFetchError, match="Page 2"):
+        list(service.export_all(10, page_size=2))
+
+    service.count_records = MagicMock(return_value=None)
+    service.get_all = MagicMock(side_effect=[[{"n": 1}], []])
+    assert list(service.export_all(10, page_size=1)) == [{"n": 1}]
+
+    service.get_all = MagicMock(side_effect=[[{"n": 1}], None])
+    with pytest.raises(PageFetchError, match="Page 2"):
+        list(service.export_all(10, page_size=1))
+
+
+# ------------------------------> STREAMING
+
+
+def streamed(body, chunk=7):
+    response = MagicMock()
+    response.iter_content.return_value = [
+        body[i:][:chunk] for i in range(0, len(body), chunk)
+    ]
+    return response
+
+
+def test_stream_all_yields_rows_incrementally(service):
+    """Test stream_all requests a streamed body and decodes rows chunk by chunk."""
+    body = json.dumps({"success": True, "data": [{"n": n} for n in range(4)]})
+    response = streamed(body.encode())
+    service._post = MagicMock(return_value=response)
+
+    assert list(service.stream_all(10)) == [{"n": n} for n in range(4)]
+    assert service._post.call_args.kwargs["stream"] is True
+    assert service._post.call_args.kwargs["parse_json"] is False
+    response.close.assert_called_once()
+
+
+@patch("walacor_sdk.data_requests.data_requests_service.logger")
+def test_stream_complex_query_failure_flag(mock_logging, service):
+    """Test a success=false body raises instead of ending like an empty result."""
+    response = streamed(b'{"success": false, "errors": []}')
+    service._post = MagicMock(return_value=response)
+
+    with pytest.raises(PageFetchError):
+        list(service.stream_complex_query(10, [{"$match": {}}]))
+    assert service._post.call_args.kwargs["json"] == [{"$match": {}}]
+    mock_logging.error.assert_called_once_with("Failed to stream query results")
+
+    service._post = MagicMock(
+        return_value=streamed(b'{"data": [{"n": 1}], "success": false}')
+    )
+    rows = service.stream_all(10)
+    assert next(rows) == {"n": 1}
+    with pytest.raises(PageFetchError):
+        next(rows)
+
+
+def test_stream_wraps_transport_errors(service):
+    """Test a download that breaks off raises the SDK's connection error."""
+
+    def chunks(size):
+        yield b'{"success": true, "data": [{"n": 1},'
+        raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    response = MagicMock()
+    response.iter_content.side_effect = chunks
+    service._post = MagicMock(return_value=response)
+
+    rows = service.stream_all(10)
+    assert next(rows) == {"n": 1}
+    with pytest.raises(APIConnectionError):
+        next(rows)
+    response.close.assert_called_once()
+
+
+# ------------------------------> RAW MODE
+
+
+def test_raw_mode_skips_row_validation(service):
+    """Test raw=True returns the data list as-is without building response models."""
+    rows = [{"x": 1}, {"x": 2}]
+    service._post = MagicMock(return_value={"success": True, "data": rows})
+
+    with patch(
+        "walacor_sdk.data_requests.data_requests_service.GetAllRecordsResponse"
+    ) as model:
+        assert service.get_all(10, raw=True) is rows
+        model.assert_not_called()
+
+    service.raw_mode = True
+    assert service.get_single_record_by_record_id({"UID": "1"}, 10) is rows
+    assert service.get_all(10, raw=False) == rows
+
+
+def test_raw_mode_checks_envelope(service):
+    """Test raw complex queries keep Total and reject a malformed envelope."""
+    rows = [{"x": 1}]
+    service._post = MagicMock(return_value={"success": True, "data": rows, "total": 1})
+
+    result = service.post_complex_query(10, [], raw=True)
+    assert result.Records is rows
+    assert result.Total == 1
+
+    service._post = MagicMock(return_value={"success": True, "data": rows})
+    assert service.post_query_api_aggregate([], raw=True) is None
+
+    service._post = MagicMock(return_value={"success": True, "data": {"x": 1}})
+    assert service.get_all(10, raw=True) is None
@@ -374,6 +374,56 @@ def test_download_filename_from_headers(
     mock_logger.info.assert_called_with("File saved to %s", result_path)
 
 
+# ------------------------------> ITER FILES
+
+
+def file_row(uid, updated):
+    return {
+        "_id": f"id-{uid}",
+        "name": f"{uid}.txt",
+        "ORGId": "org1",
+        "SL": "sl1",
+        "mimetype": "text/plain",
+        "EId": "eid1",
+        "UID": uid,
+        "LastModifiedBy": "user",
+        "SV": 1,
+        "UpdatedAt": updated,
+        "CreatedAt": 1,
+        "IsDeleted": False,
+        "Status": "received",
+    }
+
+
+def test_iter_files_uses_keyset_pages(service):
+    """Test iter_files pages through ETId 17 with getcomplex keyset pipelines."""
+    service._post = MagicMock(
+        side_effect=[
+            {"success": True, "data": [file_row("a", 1), file_row("b", 2)]},
+            {"success": True, "data": [file_row("c", 2)]},
+        ]
+    )
+
+    files = list(service.iter_files(page_size=2))
+
+    assert [f.UID for f in files] == ["a", "b", "c"]
+    second = service._post.call_args_list[1]
+    assert second.kwargs["headers"] == {"ETId": "17"}
+    assert second.kwargs["json"][0]["$match"]["$or"][1] == {
+        "UpdatedAt": 2,
+        "UID": {"$gt": "b"},
+    }
+
+
+@patch("walacor_sdk.file_request.file_request_service.logger")
+def test_iter_files_failure(mock_logger, service):
+    """Test iter_files raises FileRequestError when a page fails."""
+    service._post = MagicMock(return_value={"success": False})
+
+    with pytest.raises(FileRequestError):
+        list(service.iter_files())
+
+
 # ------------------------------> HELPERS
 
 
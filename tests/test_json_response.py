@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock, patch
+
+from walacor_sdk.base.model.json_response import (
+    JsonResponse,
+    response_adapter,
+    validate_response,
+)
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.models.data_request_response import (
+    GetAllRecordsResponse,
+)
+from walacor_sdk.utils.codec import JsonCodec
+
+BODY = b'{"success": true, "data": [{"UID": "u1"}, {"UID": "u2"}], "total": 2}'
+
+
+def test_validates_from_bytes_without_decoding():
+    """Test that an undecoded body is validated straight from bytes"""
+    response = JsonResponse(BODY)
+
+    result = validate_response(GetAllRecordsResponse, response)
+
+    assert [row["UID"] for row in result.data] == ["u1", "u2"]
+    assert result.Total == 2
+    assert not response.decoded
+
+
+def test_adapter_is_built_once():
+    """Test that TypeAdapters are cached per model"""
+    assert response_adapter(GetAllRecordsResponse) is response_adapter(
+        GetAllRecordsResponse
+    )
+
+
+def test_success_checks_only_the_envelope():
+    """Test that get("success") answers without decoding the payload"""
+    response = JsonResponse(BODY)
+
+    assert response.get("success") is True
+    assert not response.decoded
+    assert JsonResponse(b'{"data": []}').get("success", False) is False
+
+
+def test_behaves_like_the_decoded_dict():
+    """Test item access, truthiness and decoded fallback"""
+    response = JsonResponse(BODY)
+
+    assert response["total"] == 2
+    assert response.decoded
+    assert dict(response)["success"] is True
+    assert validate_response(GetAllRecordsResponse, response).Total == 2
+    assert not JsonResponse(b"{}")
+    assert not JsonResponse(b"  ")
+
+
+def test_service_request_wraps_the_body():
+    """Test that _request returns a JsonResponse for byte bodies"""
+    client = MagicMock()
+    client.request.return_value.content = BODY
+    service = DataRequestsService(client)
+
+    response = service._post("query/get", headers={"ETId": "1"})
+
+    assert isinstance(response, JsonResponse)
+    assert service._parse(GetAllRecordsResponse, response).Total == 2
+
+
+def test_success_then_parse_reads_the_body_once():
+    """Test that the usual get("success") + _parse sequence parses the body once"""
+    codec = JsonCodec()
+    codec.loads = MagicMock(wraps=codec.loads)
+    leading = JsonResponse(BODY, codec)
+    adapter = response_adapter(GetAllRecordsResponse)
+
+    with patch.object(
+        adapter, "validate_json", wraps=adapter.validate_json
+    ) as validate_json:
+        assert leading.get("success") is True
+        assert validate_response(GetAllRecordsResponse, leading).Total == 2
+    validate_json.assert_called_once()
+    codec.loads.assert_not_called()
+
+    trailing = JsonResponse(b'{"data": [], "total": 0, "success": false}', codec)
+    assert trailing.get("success") is False
+    assert validate_response(GetAllRecordsResponse, trailing).Total == 0
+    codec.loads.assert_called_once()
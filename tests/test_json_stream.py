@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from walacor_sdk.utils.json_stream import JsonArrayStream, iter_json_array
+
+DOC = {
+    "success": True,
+    "total": 3,
+    "data": [
+        {"UID": "1", "name": 'é "quoted"', "tags": [1, {"x": None}]},
+        {"UID": "2", "price": 1.5e3, "ok": False},
+        {"UID": "3"},
+    ],
+    "next": None,
+}
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 1 << 20])
+def test_rows_decoded_across_chunk_boundaries(size):
+    """Test elements and metadata survive any chunking, including split UTF-8."""
+    raw = json.dumps(DOC, ensure_ascii=False).encode("utf-8")
+    parser = JsonArrayStream("data")
+
+    rows = []
+    for start in range(0, len(raw), size):
+        rows.extend(parser.feed(raw[start:][:size]))
+    rows.extend(parser.close())
+
+    assert rows == DOC["data"]
+    assert parser.meta == {"success": True, "total": 3, "next": None}
+    assert parser.done
+
+
+def test_rows_are_yielded_before_the_body_ends():
+    """Test a complete element is returned without waiting for the rest."""
+    parser = JsonArrayStream()
+
+    assert parser.feed(b'{"success": true, "data": [{"a": 1}, {"a"') == [{"a": 1}]
+    assert parser.feed(b": 2}]}") == [{"a": 2}]
+    assert parser.close() == []
+
+
+def test_numbers_at_chunk_end_wait_for_more():
+    """Test a number cut by a chunk boundary is not emitted early."""
+    assert list(iter_json_array([b'{"data": [12', b"34, 5]}"])) == [1234, 5]
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (b'{"data": [1, 2', "Truncated"),
+        (b"[1, 2]", "Unexpected"),
+        (b'{"data": []} x', "Extra data"),
+    ],
+)
+def test_malformed_documents_raise(body, message):
+    """Test truncated or malformed bodies raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array([body]))
+
+
+def test_missing_or_empty_array():
+    """Test an empty object or empty array yields nothing."""
+    assert list(iter_json_array([b"{}"])) == []
+    assert list(iter_json_array([b'{"success": false, "data": []}'])) == []
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from walacor_sdk.data_requests.keyset import Keyset, aiter_keyset, iter_keyset
+from walacor_sdk.utils.exceptions import PageFetchError
+
+ROWS = [{"UID": f"u{n}", "UpdatedAt": n // 2} for n in range(7)]
+
+
+def serve(pipeline):
+    """Evaluate a keyset pipeline over ROWS like the backend would."""
+    rows = sorted(ROWS, key=lambda r: (r["UpdatedAt"], r["UID"]))
+    match = next((s["$match"] for s in pipeline if "$match" in s), None)
+    if match is not None:
+        (left, right) = match["$or"]
+        key = left["UpdatedAt"]["$gt"]
+        uid = right["UID"]["$gt"]
+        rows = [
+            r
+            for r in rows
+            if r["UpdatedAt"] > key or (r["UpdatedAt"] == key and r["UID"] > uid)
+        ]
+    return rows[: pipeline[-1]["$limit"]]
+
+
+def test_pipeline_filters_after_cursor():
+    """Test that pages after the first filter on (key, tiebreak) > cursor"""
+    keyset = Keyset(page_size=2, match={"Status": "active"})
+
+    assert keyset.pipeline() == [
+        {"$match": {"Status": "active"}},
+        {"$sort": {"UpdatedAt": 1, "UID": 1}},
+        {"$limit": 2},
+    ]
+    assert keyset.pipeline((5, "u9"))[0] == {
+        "$match": {
+            "$and": [
+                {"Status": "active"},
+                {
+                    "$or": [
+                        {"UpdatedAt": {"$gt": 5}},
+                        {"UpdatedAt": 5, "UID": {"$gt": "u9"}},
+                    ]
+                },
+            ]
+        }
+    }
+
+
+def test_id_key_needs_no_tiebreak():
+    """Test that _id alone orders the scan"""
+    keyset = Keyset(key="_id", page_size=10)
+
+    assert keyset.pipeline(("abc",)) == [
+        {"$match": {"_id": {"$gt": "abc"}}},
+        {"$sort": {"_id": 1}},
+        {"$limit": 10},
+    ]
+    assert keyset.cursor({"_id": "abd", "UID": "x"}) == ("abd",)
+    with pytest.raises(ValueError):
+        keyset.cursor({"UID": "x"})
+
+
+def test_iter_keyset_walks_every_row_once():
+    """Test that ties on the key are split by the tiebreak across pages"""
+    pipelines = []
+
+    def fetch(pipeline):
+        pipelines.append(pipeline)
+        return serve(pipeline)
+
+    rows = list(iter_keyset(fetch, Keyset(page_size=3)))
+
+    assert [r["UID"] for r in rows] == [r["UID"] for r in ROWS]
+    assert len(pipelines) == 3
+
+
+def test_iter_keyset_resumes_and_fails_loudly():
+    """Test resuming from a cursor and that a failed page raises"""
+    rows = list(iter_keyset(serve, Keyset(page_size=3), after=(2, "u4")))
+    assert [r["UID"] for r in rows] == ["u5", "u6"]
+
+    with pytest.raises(PageFetchError):
+        list(iter_keyset(lambda pipeline: None, Keyset()))
+
+
+def test_aiter_keyset():
+    """Test the asyncio scan yields the same rows"""
+
+    async def fetch(pipeline):
+        return serve(pipeline)
+
+    async def run():
+        return [row async for row in aiter_keyset(fetch, Keyset(page_size=2))]
+
+    assert asyncio.run(run()) == sorted(ROWS, key=lambda r: (r["UpdatedAt"], r["UID"]))
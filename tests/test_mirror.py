@@ -0,0 +1,323 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.mirror import (
+    LocalMirror,
+    column_types,
+    read_columns,
+    sql_filter,
+)
+from walacor_sdk.data_requests.models.models import ComplexQueryRecords
+from walacor_sdk.schema.models.models import SchemaDetail
+
+ETID = 90000000
+
+
+def schema_detail(sv=1):
+    return SchemaDetail(
+        _id="s",
+        ETId=ETID,
+        TableName="books-v2",
+        Family="lib",
+        DoSummary=False,
+        Indexes=[],
+        DbTableName="t",
+        DbHistoryTableName="h",
+        SV=sv,
+        LastModifiedBy="u",
+        UID="uid",
+        ORGId="o",
+        SL="sl",
+        HashSign="hs",
+        HS="hs",
+        EId="e",
+        UpdatedAt=0,
+        IsDeleted=False,
+        CreatedAt=0,
+        Fields=[
+            {"FieldName": "pages", "DataType": "INTEGER"},
+            {"FieldName": "price", "DataType": "DECIMAL"},
+            {"FieldName": "title", "DataType": "TEXT"},
+            {"FieldName": "tags", "DataType": "ARRAY"},
+        ],
+    )
+
+
+def book(uid, updated, **values):
+    return {"UID": uid, "UpdatedAt": updated, "IsDeleted": False, "SV": 1, **values}
+
+
+class FakeServer:
+    """Answers keyset pipelines from an in-memory table."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.pipelines = []
+
+    def __call__(self, ETId, pipeline):
+        self.pipelines.append(pipeline)
+        rows = sorted(self.rows, key=lambda r: (r["UpdatedAt"], r["UID"]))
+        match = pipeline[0].get("$match")
+        if match is not None:
+            key = match["$or"][0]["UpdatedAt"]["$gt"]
+            uid = match["$or"][1]["UID"]["$gt"]
+            rows = [
+                r
+                for r in rows
+                if r["UpdatedAt"] > key or (r["UpdatedAt"] == key and r["UID"] > uid)
+            ]
+        return rows[: pipeline[-1]["$limit"]]
+
+
+@pytest.fixture
+def server():
+    return FakeServer(
+        [
+            book("a", 1, pages=10, price=9.5, title="A", tags=["x"]),
+            book("b", 2, pages=20, price=1.0, title="B", tags=[]),
+            book("c", 2, pages=30, price=2.0, title="C", tags=None),
+        ]
+    )
+
+
+@pytest.fixture
+def mirror(server):
+    service = DataRequestsService(MagicMock())
+    service._complex_rows = MagicMock(side_effect=server)
+    with patch("walacor_sdk.data_requests.mirror.SchemaService") as schema_service:
+        schema_service.return_value.get_schema_details_with_ETId.return_value = (
+            schema_detail()
+        )
+        mirror = service.mirror(page_size=2)
+        yield mirror
+    mirror.close()
+
+
+def test_column_types_include_envelope_fields():
+    """Test that UID and the timestamps are always mirrored"""
+    columns = column_types(schema_detail())
+
+    assert list(columns)[:5] == ["UID", "SV", "IsDeleted", "CreatedAt", "UpdatedAt"]
+    assert columns["tags"] == "ARRAY"
+
+
+def test_add_loads_table_with_schema_types(mirror):
+    """Test the initial load and the column types taken from the schema"""
+    status = mirror.add(ETID)
+
+    assert status.Table == "books_v2"
+    assert status.Rows == 3
+    assert status.Watermark == [2, "c"]
+    assert mirror.is_fresh(ETID, max_age=60)
+
+    rows = mirror.query(
+        f"SELECT UID, pages, price, tags FROM {mirror.table(ETID)} ORDER BY UID"
+    )
+    assert rows[0] == {"UID": "a", "pages": 10, "price": 9.5, "tags": '["x"]'}
+    types = {
+        row["name"]: row["type"]
+        for row in mirror.query(f"PRAGMA table_info({mirror.table(ETID)})")
+    }
+    assert types["pages"] == "INTEGER"
+    assert types["price"] == "REAL"
+    assert types["title"] == "TEXT"
+
+
+def test_refresh_only_pulls_changes(mirror, server):
+    """Test that a refresh starts at the watermark and applies upserts and deletes"""
+    mirror.add(ETID)
+    server.rows = server.rows + [
+        book("a", 3, pages=11, price=9.5, title="A2", tags=[]),
+        {**book("b", 4), "IsDeleted": True},
+        book("d", 5, pages=40, price=4.0, title="D", tags=[]),
+    ]
+    server.pipelines.clear()
+
+    assert mirror.refresh(ETID) == 3
+    assert server.pipelines[0][0]["$match"]["$or"][0] == {"UpdatedAt": {"$gt": 2}}
+    rows = mirror.query(f"SELECT UID, title FROM {mirror.table(ETID)} ORDER BY UID")
+    assert rows == [
+        {"UID": "a", "title": "A2"},
+        {"UID": "c", "title": "C"},
+        {"UID": "d", "title": "D"},
+    ]
+    assert mirror.status(ETID).Watermark == [5, "d"]
+    assert mirror.refresh_all() == {ETID: 0}
+
+
+def test_aggregate_runs_pipeline_locally(mirror):
+    """Test that mirrored rows answer a getcomplex pipeline without the server"""
+    mirror.add(ETID)
+    calls = mirror.service._complex_rows.call_count
+
+    result = mirror.aggregate(
+        ETID,
+        [
+            {"$unwind": "$tags"},
+            {"$group": {"_id": "$tags", "pages": {"$sum": "$pages"}}},
+            {"$sort": {"_id": 1}},
+        ],
+    )
+
+    assert result.Records == [{"_id": "x", "pages": 10}]
+    assert result.Total == 1
+    assert mirror.aggregate(ETID, [{"$match": {"UID": "c"}}]).Records == [
+        {
+            "UID": "c",
+            "SV": 1,
+            "IsDeleted": False,
+            "CreatedAt": None,
+            "UpdatedAt": 2,
+            "pages": 30,
+            "price": 2.0,
+            "title": "C",
+            "tags": None,
+        }
+    ]
+    assert mirror.service._complex_rows.call_count == calls
+
+
+def test_aggregate_keeps_null_fields(mirror):
+    """Test that stored nulls match {"f": null} and survive $project"""
+    mirror.add(ETID)
+
+    result = mirror.aggregate(
+        ETID,
+        [
+            {"$match": {"tags": None}},
+            {"$project": {"UID": 1, "tags": 1, "_id": 0}},
+        ],
+    )
+
+    assert result.Records == [{"UID": "c", "tags": None}]
+
+
+def test_sql_filter_translates_scalar_comparisons():
+    """Test that only type-safe scalar conditions become SQL"""
+    types = column_types(schema_detail())
+
+    assert sql_filter(
+        {
+            "pages": {"$gte": 10, "$lt": 30},
+            "title": {"$in": ["A", None]},
+            "tags": "x",
+            "$or": [{"price": 1.0}, {"IsDeleted": False}],
+        },
+        types,
+    ) == (
+        '(("pages" >= ? AND "pages" < ?) AND ("title" IN (?) OR "title" IS NULL)'
+        ' AND ("price" = ? OR "IsDeleted" = ?))',
+        [10, 30, "A", 1.0, False],
+    )
+    assert sql_filter({"pages": "10", "title": {"$regex": "^A"}}, types) is None
+    assert sql_filter({"$or": [{"pages": 1}, {"title": {"$ne": "A"}}]}, types) is None
+
+
+def test_read_columns_follow_leading_project():
+    """Test that a leading $project limits the columns read"""
+    types = column_types(schema_detail())
+    project = {"$project": {"title": 1, "_id": 0}}
+
+    assert read_columns([{"$match": {"pages": 10}}, project], types) == [
+        "UID",
+        "pages",
+        "title",
+    ]
+    assert read_columns([project, {"$sort": {"title": 1}}], types) == ["UID", "title"]
+    assert read_columns([{"$project": {"pages": 0}}], types) == list(types)
+    assert read_columns([{"$project": {"_id": 0}}], types) == list(types)
+    assert read_columns([{"$sort": {"title": 1}}, project], types) == list(types)
+
+
+def test_aggregate_pushes_match_and_project_into_sql(mirror):
+    """Test that a leading $match/$project is read through the SQL query"""
+    mirror.add(ETID)
+    statements = []
+    mirror._conn.set_trace_callback(statements.append)
+
+    result = mirror.aggregate(
+        ETID,
+        [
+            {"$match": {"price": {"$lt": 5}, "title": {"$regex": "^[BC]"}}},
+            {"$project": {"title": 1, "_id": 0}},
+            {"$sort": {"title": -1}},
+        ],
+    )
+
+    assert result.Records == [{"title": "C"}, {"title": "B"}]
+    table = f'FROM "{mirror.table(ETID)}"'
+    assert [sql for sql in statements if table in sql] == [
+        f'SELECT "UID", "price", "title" {table} WHERE "price" < 5'
+    ]
+
+
+def test_unknown_table_and_engine(mirror):
+    """Test errors for tables never added and unsupported engines"""
+    with pytest.raises(KeyError):
+        mirror.refresh(ETID)
+    with pytest.raises(ValueError):
+        LocalMirror(MagicMock(), engine="postgres")
+
+
+def test_schema_change_rebuilds_table(mirror):
+    """Test that re-adding with a new schema version reloads from scratch"""
+    mirror.add(ETID)
+    with patch("walacor_sdk.data_requests.mirror.SchemaService") as schema_service:
+        schema_service.return_value.get_schema_details_with_ETId.return_value = (
+            schema_detail(sv=2)
+        )
+        status = mirror.add(ETID, refresh=False)
+
+    assert status.SV == 2
+    assert status.Rows == 0
+    assert status.Watermark is None
+    mirror.remove(ETID)
+    assert mirror.tables == []
+
+
+def test_duckdb_engine(server):
+    """Test the same load on DuckDB with its own column types"""
+    pytest.importorskip("duckdb")
+    service = DataRequestsService(MagicMock())
+    service._complex_rows = MagicMock(side_effect=server)
+    with patch("walacor_sdk.data_requests.mirror.SchemaService") as schema_service:
+        schema_service.return_value.get_schema_details_with_ETId.return_value = (
+            schema_detail()
+        )
+        with service.mirror(engine="duckdb") as mirror:
+            assert mirror.add(ETID).Rows == 3
+            rows = mirror.query(f"SELECT SUM(pages) AS pages FROM {mirror.table(ETID)}")
+            result = mirror.aggregate(
+                ETID,
+                [
+                    {"$match": {"price": {"$lt": 5}, "tags": None}},
+                    {"$project": {"UID": 1, "title": 1, "IsDeleted": 1, "_id": 0}},
+                ],
+            )
+
+    assert rows == [{"pages": 60}]
+    assert result.Records == [{"UID": "c", "IsDeleted": False, "title": "C"}]
+
+
+def test_builder_query_runs_remotely_and_on_the_mirror(mirror, server):
+    """Test that one bound query gives the server's answer from the mirror"""
+    mirror.add(ETID)
+    service = mirror.service
+    service.columnar.schema_types = MagicMock(
+        return_value=column_types(schema_detail())
+    )
+    query = (
+        service.query(ETID).where("price", "<", 5).order_by("-pages").select("title")
+    )
+    expected = [{"title": "C"}, {"title": "B"}]
+    service.post_complex_query = MagicMock(
+        return_value=ComplexQueryRecords(Records=expected, Total=2)
+    )
+
+    assert query.fetch().Records == expected
+    service.post_complex_query.assert_called_once_with(ETID, query.pipeline(), None)
+    assert mirror.aggregate(ETID, query.pipeline()).Records == expected
+    with pytest.raises(ValueError):
+        query.select("title.length")
@@ -0,0 +1,169 @@
+import pytest
+
+from walacor_sdk.data_requests.columnar import ColumnarResult
+from walacor_sdk.data_requests.mql import evaluate
+from walacor_sdk.utils.exceptions import UnsupportedQueryError
+
+ROWS = [
+    {"_id": 1, "genre": "sf", "pages": 300, "price": 10.0, "tags": ["a", "b"]},
+    {"_id": 2, "genre": "sf", "pages": 120, "price": 6.5, "tags": ["b"]},
+    {"_id": 3, "genre": "crime", "pages": 250, "tags": []},
+    {"_id": 4, "genre": "crime", "pages": "n/a", "price": None},
+    {"_id": 5, "genre": "poetry", "pages": 80, "price": 3.0, "meta": {"lang": "fr"}},
+]
+
+
+def ids(rows):
+    return [row["_id"] for row in rows]
+
+
+def test_match_operators():
+    """Test comparisons respect types, arrays, nulls and missing fields"""
+    assert ids(evaluate([{"$match": {"pages": {"$gt": 200}}}], ROWS)) == [1, 3]
+    assert ids(evaluate([{"$match": {"tags": "b"}}], ROWS)) == [1, 2]
+    assert ids(evaluate([{"$match": {"price": None}}], ROWS)) == [3, 4]
+    assert ids(evaluate([{"$match": {"price": {"$exists": False}}}], ROWS)) == [3]
+    assert ids(evaluate([{"$match": {"tags": {"$size": 0}}}], ROWS)) == [3]
+    assert ids(evaluate([{"$match": {"meta.lang": "fr"}}], ROWS)) == [5]
+    assert ids(
+        evaluate(
+            [
+                {
+                    "$match": {
+                        "$or": [
+                            {"genre": {"$in": ["poetry"]}},
+                            {"pages": {"$lt": 150}},
+                        ],
+                        "_id": {"$ne": 2},
+                    }
+                }
+            ],
+            ROWS,
+        )
+    ) == [5]
+    assert ids(
+        evaluate([{"$match": {"genre": {"$regex": "^CR", "$options": "i"}}}], ROWS)
+    ) == [3, 4]
+
+
+def test_null_range_comparisons():
+    """Test that $gte/$lte null match null and missing, $gt/$lt null nothing"""
+    assert ids(evaluate([{"$match": {"price": {"$gte": None}}}], ROWS)) == [3, 4]
+    assert ids(evaluate([{"$match": {"price": {"$lte": None}}}], ROWS)) == [3, 4]
+    assert evaluate([{"$match": {"price": {"$gt": None}}}], ROWS) == []
+    assert evaluate([{"$match": {"price": {"$lt": None}}}], ROWS) == []
+
+
+def test_group_sort_and_paging():
+    """Test $group accumulators followed by $sort, $skip and $limit"""
+    rows = evaluate(
+        [
+            {
+                "$group": {
+                    "_id": "$genre",
+                    "books": {"$sum": 1},
+                    "pages": {"$sum": "$pages"},
+                    "avg_price": {"$avg": "$price"},
+                    "max_pages": {"$max": "$pages"},
+                    "ids": {"$push": "$_id"},
+                }
+            },
+            {"$sort": {"books": -1, "_id": 1}},
+        ],
+        ROWS,
+    )
+
+    assert rows == [
+        {
+            "_id": "crime",
+            "books": 2,
+            "pages": 250,
+            "avg_price": None,
+            "max_pages": "n/a",
+            "ids": [3, 4],
+        },
+        {
+            "_id": "sf",
+            "books": 2,
+            "pages": 420,
+            "avg_price": 8.25,
+            "max_pages": 300,
+            "ids": [1, 2],
+        },
+        {
+            "_id": "poetry",
+            "books": 1,
+            "pages": 80,
+            "avg_price": 3.0,
+            "max_pages": 80,
+            "ids": [5],
+        },
+    ]
+    paged = evaluate([{"$sort": {"_id": -1}}, {"$skip": 1}, {"$limit": 2}], ROWS)
+    assert ids(paged) == [4, 3]
+
+
+def test_project_unwind_and_count():
+    """Test projections with expressions, $unwind and $count"""
+    rows = evaluate(
+        [
+            {"$unwind": {"path": "$tags", "includeArrayIndex": "i"}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "tags": 1,
+                    "i": 1,
+                    "label": {"$concat": ["$genre", "/", "$tags"]},
+                    "cost": {"$multiply": ["$price", 2]},
+                }
+            },
+        ],
+        ROWS,
+    )
+    assert rows == [
+        {"tags": "a", "i": 0, "label": "sf/a", "cost": 20.0},
+        {"tags": "b", "i": 1, "label": "sf/b", "cost": 20.0},
+        {"tags": "b", "i": 0, "label": "sf/b", "cost": 13.0},
+    ]
+
+    assert evaluate([{"$project": {"tags": 0, "meta": 0, "price": 0}}], ROWS)[0] == {
+        "_id": 1,
+        "genre": "sf",
+        "pages": 300,
+    }
+    assert evaluate([{"$match": {"genre": "sf"}}, {"$count": "n"}], ROWS) == [{"n": 2}]
+    assert evaluate([{"$match": {"genre": "none"}}, {"$count": "n"}], ROWS) == []
+
+
+def test_project_only_id_excludes_it():
+    """Test that {"_id": 0} alone keeps every other field"""
+    rows = [{"_id": 1, "a": 1}, {"_id": 2, "b": None}]
+
+    assert evaluate([{"$project": {"_id": 0}}], rows) == [{"a": 1}, {"b": None}]
+    assert evaluate([{"$project": {"_id": 1}}], rows) == [{"_id": 1}, {"_id": 2}]
+
+
+def test_columnar_input():
+    """Test that a ColumnarResult is evaluated without converting to rows"""
+    result = ColumnarResult({"g": ["x", "y", "x"], "v": [1, 2, 3]})
+
+    assert evaluate(
+        [{"$group": {"_id": "$g", "total": {"$sum": "$v"}}}, {"$sort": {"_id": 1}}],
+        result,
+    ) == [{"_id": "x", "total": 4}, {"_id": "y", "total": 2}]
+
+
+@pytest.mark.parametrize(
+    "pipeline",
+    [
+        [{"$lookup": {"from": "x"}}],
+        [{"$match": {"a": {"$elemMatch": {}}}}],
+        [{"$group": {"_id": None, "s": {"$stdDevPop": "$a"}}}],
+        [{"$project": {"a": 1, "b": 0}}],
+        [{"$limit": 0}],
+    ],
+)
+def test_unsupported_pipelines(pipeline):
+    """Test that anything outside the local subset is rejected"""
+    with pytest.raises(UnsupportedQueryError):
+        evaluate(pipeline, ROWS)
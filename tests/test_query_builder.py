@@ -0,0 +1,113 @@
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.models.models import ComplexQueryRecords
+from walacor_sdk.data_requests.query_builder import AsyncBoundQuery, QueryBuilder
+
+ETID = 90000000
+FIELDS = ["title", "price", "pages", "author"]
+
+
+def test_pipeline_orders_pushdown_stages():
+    """Test filters first, then sort/skip/limit, and a closing projection"""
+    query = (
+        QueryBuilder(ETID, FIELDS)
+        .select("title", "price")
+        .limit(10)
+        .order_by("-price", "title")
+        .where("price", ">", 5)
+        .where("author", "in", ("a", "b"))
+        .skip(20)
+    )
+
+    assert query.pipeline() == [
+        {"$match": {"price": {"$gt": 5}, "author": {"$in": ["a", "b"]}}},
+        {"$sort": {"price": -1, "title": 1}},
+        {"$skip": 20},
+        {"$limit": 10},
+        {"$project": {"title": 1, "price": 1, "_id": 0}},
+    ]
+
+
+def test_builder_is_immutable_and_merges_conditions():
+    """Test that each call returns a new builder and repeated fields use $and"""
+    base = QueryBuilder(ETID, FIELDS).where("title", "==", "Dune")
+    ranged = base.where("price", ">=", 1).where("price", "<", 9)
+
+    assert base.pipeline() == [{"$match": {"title": "Dune"}}]
+    assert ranged.filter() == {
+        "$and": [{"title": "Dune", "price": {"$gte": 1}}, {"price": {"$lt": 9}}]
+    }
+    assert ranged.count_pipeline() == [
+        {"$match": ranged.filter()},
+        {"$count": "count"},
+    ]
+
+
+def test_field_names_are_checked():
+    """Test unknown fields fail with a suggestion; envelope fields are allowed"""
+    query = QueryBuilder(ETID, FIELDS)
+
+    with pytest.raises(ValueError, match="did you mean 'price'"):
+        query.where("prize", "==", 1)
+    with pytest.raises(ValueError, match="no field 'isbn'"):
+        query.match({"$or": [{"title": "x"}, {"isbn": "y"}]})
+    with pytest.raises(ValueError, match="Unknown operator"):
+        query.where("title", "~", "x")
+
+    with pytest.raises(ValueError, match="select the top-level field 'author'"):
+        query.select("author.name")
+
+    assert query.select("UID", "UpdatedAt", "author").pipeline()[-1] == {
+        "$project": {"UID": 1, "UpdatedAt": 1, "author": 1, "_id": 0}
+    }
+    assert QueryBuilder(ETID).where("anything", "exists", True).filter() == {
+        "anything": {"$exists": True}
+    }
+
+
+def test_evaluate_runs_locally():
+    """Test that the compiled pipeline runs on the local evaluator"""
+    rows = [{"title": "a", "price": 3}, {"title": "b", "price": 8}]
+
+    query = QueryBuilder(ETID, FIELDS).where("price", ">", 5).select("title")
+
+    assert query.evaluate(rows) == [{"title": "b"}]
+
+
+def test_service_query_uses_cached_schema_and_fetches():
+    """Test that DataRequestsService.query checks fields and posts the pipeline"""
+    service = DataRequestsService(MagicMock())
+    service.columnar.schema_types = MagicMock(
+        return_value={name: "TEXT" for name in FIELDS}
+    )
+    service.post_complex_query = MagicMock(
+        return_value=ComplexQueryRecords(Records=[{"title": "a"}], Total=1)
+    )
+    service._complex_rows = MagicMock(return_value=[{"count": 7}])
+
+    query = service.query(ETID).where("pages", ">", 100).select("title")
+    with pytest.raises(ValueError):
+        query.where("nope", "==", 1)
+
+    assert query.fetch().Records == [{"title": "a"}]
+    service.post_complex_query.assert_called_once_with(ETID, query.pipeline(), None)
+    assert query.count() == 7
+    service._complex_rows.assert_called_once_with(
+        ETID, [{"$match": {"pages": {"$gt": 100}}}, {"$count": "count"}]
+    )
+
+
+def test_async_query_fetch():
+    """Test that the async builder awaits the service"""
+    service = MagicMock()
+    service.post_complex_query = AsyncMock(return_value=None)
+    service._complex_rows = AsyncMock(return_value=[])
+    query = AsyncBoundQuery(service, ETID, FIELDS).where("title", "==", "x")
+
+    assert asyncio.run(query.fetch()) is None
+    assert asyncio.run(query.count()) == 0
@@ -0,0 +1,214 @@
+import json
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.base.model.json_response import JsonResponse
+from walacor_sdk.base.query_cache import QueryCache, cache_key
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+
+# ------------------------------> FIXTURES
+
+
+@pytest.fixture
+def cache():
+    return QueryCache(max_entries=2, ttl=60)
+
+
+@pytest.fixture
+def service(cache):
+    client = MagicMock()
+    client.query_cache = cache
+    return DataRequestsService(client)
+
+
+def http_response(payload):
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+# ------------------------------> CACHE
+
+
+def test_cache_key_is_canonical():
+    """Test payload key order does not change the key but paging does."""
+    a = cache_key("query/get?pageNo=1", 10, {"ETId": "10"}, {"a": 1, "b": 2})
+    b = cache_key("query/get?pageNo=1", 10, {"ETId": "10"}, {"b": 2, "a": 1})
+    c = cache_key("query/get?pageNo=2", 10, {"ETId": "10"}, {"a": 1, "b": 2})
+
+    assert a == b
+    assert a != c
+
+
+def test_lru_eviction_and_stats(cache):
+    """Test the least recently used entry is evicted and counters are kept."""
+    cache.set("a", 1, b"A")
+    cache.set("b", 1, b"B")
+    assert cache.get("a") == b"A"
+    cache.set("c", 2, b"C")
+
+    assert cache.get("b") is None
+    assert cache.get("c") == b"C"
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 1, 1, 2)
+    assert stats.hit_ratio == pytest.approx(2 / 3)
+
+
+@patch("walacor_sdk.base.query_cache.time.monotonic")
+def test_ttl_expiry(mock_time, cache):
+    """Test entries expire after the cache or per-entry TTL."""
+    mock_time.return_value = 100.0
+    cache.set("a", 1, b"A")
+    cache.set("b", 1, b"B", ttl=5)
+
+    mock_time.return_value = 106.0
+    assert cache.get("a") == b"A"
+    assert cache.get("b") is None
+
+    mock_time.return_value = 161.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_by_etid_and_size_limit():
+    """Test per-ETId invalidation and that oversized bodies are skipped."""
+    cache = QueryCache(max_bytes=4)
+    cache.set("a", 1, b"A")
+    cache.set("b", 2, b"B")
+    cache.set("big", 1, b"12345")
+
+    assert cache.invalidate(1) == 1
+    assert cache.get("b") == b"B"
+    assert cache.get("big") is None
+
+
+def test_set_skips_bodies_older_than_an_invalidation(cache):
+    """Test a body read before an invalidation of its ETId is not stored."""
+    generation = cache.generation(10)
+    cache.invalidate(10)
+    cache.set("a", 10, b"stale", generation=generation)
+    assert cache.get("a") is None
+
+    generation = cache.generation(20)
+    cache.invalidate()
+    cache.set("b", 20, b"stale", generation=generation)
+    assert cache.get("b") is None
+
+    cache.set("c", 10, b"fresh", generation=cache.generation(10))
+    assert cache.get("c") == b"fresh"
+
+
+# ------------------------------> SERVICE
+
+
+def test_repeated_reads_are_served_from_cache(service, cache):
+    """Test an identical complex query hits the server only once."""
+    payload = {"success": True, "data": [{"x": 1}], "total": 1}
+    service._post = MagicMock(return_value=http_response(payload))
+
+    first = service.post_complex_query(10, [{"$match": {"a": 1}}])
+    first.Records[0]["x"] = 99
+    second = service.post_complex_query(10, [{"$match": {"a": 1}}])
+
+    assert second.Records == [{"x": 1}]
+    service._post.assert_called_once()
+    assert service._post.call_args.kwargs["parse_json"] is False
+    assert cache.stats.hits == 1
+
+
+def test_failed_reads_are_not_cached(service, cache):
+    """Test success=false responses are never stored."""
+    service._post = MagicMock(return_value=http_response({"success": False}))
+
+    assert service.get_all(10) is None
+    assert service.get_all(10) is None
+    assert service._post.call_count == 2
+    assert len(cache) == 0
+
+
+def test_submit_invalidates_same_etid(service, cache):
+    """Test inserts and updates drop cached reads of that ETId only."""
+    rows = {"success": True, "data": [{"x": 1}]}
+    submitted = {
+        "success": True,
+        "data": {"EId": "e", "ETId": 10, "ES": 30, "UID": ["u"]},
+    }
+    service._post = MagicMock(return_value=http_response(rows))
+    service.get_all(10)
+    service.get_all(20)
+
+    service._post = MagicMock(return_value=submitted)
+    service.insert_multiple_records([{"x": 2}], 10)
+
+    assert cache.stats.invalidations == 1
+    assert len(cache) == 1
+    service._post.assert_called_once_with(
+        "envelopes/submit", json={"Data": [{"x": 2}]}, headers={"ETId": "10"}
+    )
+
+
+def test_read_racing_a_submit_is_not_cached(service, cache):
+    """Test a read that was in flight while a submit ran does not fill the cache."""
+
+    def read_during_submit(*args, **kwargs):
+        service._invalidate(10)  # a submit finishes while the read is pending
+        return http_response({"success": True, "data": [{"x": 1}]})
+
+    service._post = MagicMock(side_effect=read_during_submit)
+
+    assert service.get_all(10) == [{"x": 1}]
+    assert len(cache) == 0
+
+
+def test_page_scans_bypass_the_cache(service, cache):
+    """Test iter_all and export_all neither read nor fill the query cache."""
+    pages = {1: [{"n": 1}, {"n": 2}], 2: [{"n": 3}]}
+
+    def post(query, **kwargs):
+        page = int(query.split("pageNo=")[1].split("&")[0])
+        body = {"success": True, "data": pages.get(page, []), "total": 3}
+        return JsonResponse(json.dumps(body).encode())
+
+    service._post = MagicMock(side_effect=post)
+
+    assert [row["n"] for row in service.iter_all(10, page_size=2)] == [1, 2, 3]
+    assert [row["n"] for row in service.export_all(10, page_size=2)] == [1, 2, 3]
+    assert len(cache) == 0
+    assert cache.stats.hits == 0
+
+
+def test_export_all_ignores_a_stale_cached_count(service, cache):
+    """Test export_all counts rows past the cache so new rows are not dropped."""
+    pages = {1: [{"n": 1}, {"n": 2}]}
+
+    def post(query, **kwargs):
+        page = int(query.split("pageNo=")[1].split("&")[0])
+        total = sum(len(rows) for rows in pages.values())
+        body = {"success": True, "data": pages.get(page, []), "total": total}
+        return JsonResponse(json.dumps(body).encode())
+
+    service._post = MagicMock(side_effect=post)
+    assert service.count_records(10) == 2
+    pages[2] = [{"n": 3}]  # inserted by another process while the count is cached
+
+    assert service.count_records(10) == 2
+    assert [row["n"] for row in service.export_all(10, page_size=2)] == [1, 2, 3]
+
+
+def test_client_clears_cache_on_server_or_credential_change():
+    """Test W_Client empties its cache when the server or user changes."""
+    from walacor_sdk.base.w_client import W_Client
+
+    cache = QueryCache()
+    client = W_Client("http://fakeapi.com", "user", "pass", cache=cache)
+
+    cache.set("a", 1, b"A")
+    client.update_credentials("other", "pass")
+    assert len(cache) == 0
+
+    cache.set("a", 1, b"A")
+    client.base_url = "http://other.com"
+    assert len(cache) == 0
+    client.close()
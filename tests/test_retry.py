@@ -0,0 +1,160 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from walacor_sdk.base.retry import RetryBudget, RetryPolicy
+from walacor_sdk.base.w_client import W_Client
+from walacor_sdk.utils.enums import RequestType
+
+BASE_URL = "http://fakeapi.com"
+USERNAME = "testuser"
+PASSWORD = "testpass"
+
+
+@pytest.fixture
+def client():
+    client = W_Client(
+        BASE_URL,
+        USERNAME,
+        PASSWORD,
+        retry=RetryPolicy(max_attempts=3, jitter=False, budget=RetryBudget()),
+    )
+    client._token = "Bearer fake_token"
+    return client
+
+
+def response(status, headers=None):
+    mock = MagicMock(status_code=status, headers=headers or {})
+    if status >= 400:
+        mock.raise_for_status.side_effect = requests.HTTPError(response=mock)
+    return mock
+
+
+# ------------------------------> POLICY
+
+
+def test_policy_repeatable_calls():
+    """Test which calls the default policy considers safe to repeat."""
+    policy = RetryPolicy()
+
+    assert policy.is_repeatable(RequestType.GET, "schemas/dataTypes")
+    assert policy.is_repeatable(RequestType.POST, "query/getcomplex")
+    assert not policy.is_repeatable(RequestType.POST, "envelopes/submit")
+    assert not policy.is_repeatable(RequestType.POST, "schemas/")
+    assert not policy.is_repeatable(RequestType.POST, "v2/files/verify", files=[1])
+    assert policy.is_repeatable(RequestType.POST, "envelopes/submit", override=True)
+    assert RetryPolicy(retry_submit=True).is_repeatable("POST", "envelopes/submit")
+    assert not RetryPolicy(max_attempts=1).is_repeatable("GET", "schemas")
+
+
+def test_policy_backoff_and_jitter():
+    """Test exponential growth, the cap and full jitter bounds."""
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    jittered = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= jittered.backoff(3) <= 4 for _ in range(50))
+
+
+def test_policy_retry_after():
+    """Test Retry-After is honoured on 429/503 and capped."""
+    policy = RetryPolicy(jitter=False, retry_after_max=10, budget=None)
+
+    assert policy.delay_for(1, 429, {"Retry-After": "7"}) == 7
+    assert policy.delay_for(1, 503, {"Retry-After": "60"}) is None
+    assert policy.delay_for(1, 502, {"Retry-After": "7"}) == 0.5
+    assert policy.delay_for(3, 503, {}) is None
+
+
+def test_budget_caps_retries():
+    """Test the budget stops retries once spent and refills with traffic."""
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+# ------------------------------> CLIENT
+
+
+@patch("walacor_sdk.base.w_client.time.sleep")
+def test_client_retries_connection_error(mock_sleep, client):
+    """Test a dropped connection on a query is retried transparently."""
+    with patch("requests.Session.request") as mock_request:
+        mock_request.side_effect = [requests.ConnectionError("reset"), response(200)]
+
+        result = client.request(RequestType.POST, "query/get")
+
+    assert result.status_code == 200
+    assert mock_request.call_count == 2
+    mock_sleep.assert_called_once_with(0.5)
+
+
+@patch("walacor_sdk.base.w_client.time.sleep")
+def test_client_honours_retry_after(mock_sleep, client):
+    """Test a 429 waits for Retry-After before the next attempt."""
+    with patch("requests.Session.request") as mock_request:
+        mock_request.side_effect = [
+            response(429, {"Retry-After": "3"}),
+            response(200),
+        ]
+
+        result = client.request(RequestType.GET, "schemas/dataTypes")
+
+    assert result.status_code == 200
+    mock_sleep.assert_called_once_with(3.0)
+
+
+@patch("walacor_sdk.base.w_client.time.sleep")
+def test_client_gives_up_after_max_attempts(mock_sleep, client):
+    """Test the final 503 is surfaced once attempts are exhausted."""
+    with patch("requests.Session.request") as mock_request:
+        mock_request.return_value = response(503)
+
+        with pytest.raises(requests.HTTPError):
+            client.request(RequestType.GET, "schemas/dataTypes")
+
+    assert mock_request.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("walacor_sdk.base.w_client.time.sleep")
+def test_client_does_not_retry_submit_by_default(mock_sleep, client):
+    """Test envelopes/submit is only retried when the caller opts in."""
+    with patch("requests.Session.request") as mock_request:
+        mock_request.side_effect = requests.ConnectionError("reset")
+
+        with pytest.raises(requests.ConnectionError):
+            client.request(RequestType.POST, "envelopes/submit", json={})
+        assert mock_request.call_count == 1
+
+        mock_request.side_effect = [requests.ConnectionError("reset"), response(200)]
+        result = client.request(
+            RequestType.POST, "envelopes/submit", json={}, retry=True
+        )
+
+    assert result.status_code == 200
+    assert mock_request.call_count == 3
+
+
+@patch("walacor_sdk.base.w_client.time.sleep")
+def test_client_respects_budget(mock_sleep, client):
+    """Test an empty budget turns retries off."""
+    client.retry_policy = RetryPolicy(
+        budget=RetryBudget(ratio=0, min_per_second=0, max_tokens=0)
+    )
+    with patch("requests.Session.request") as mock_request:
+        mock_request.return_value = response(503)
+
+        with pytest.raises(requests.HTTPError):
+            client.request(RequestType.GET, "schemas/dataTypes")
+
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
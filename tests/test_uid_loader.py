@@ -0,0 +1,97 @@
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.uid_loader import UIDLoader
+from walacor_sdk.utils.exceptions import RecordLookupError
+
+ETID = 90000000
+
+
+def lookup(ETId, uids, fromSummary=False):
+    return {uid: {"UID": uid} for uid in uids if not uid.startswith("missing")}
+
+
+@pytest.fixture
+def service():
+    service = MagicMock()
+    service.get_many_by_uid.side_effect = lookup
+    return service
+
+
+def test_lookups_are_coalesced(service):
+    """Test that concurrent lookups share one query and get their own row"""
+    loader = UIDLoader(service, ETID, max_delay_ms=50)
+
+    futures = [loader.load(uid) for uid in ("a", "b", "a", "missing-1")]
+
+    assert [f.result(timeout=1) for f in futures] == [
+        {"UID": "a"},
+        {"UID": "b"},
+        {"UID": "a"},
+        None,
+    ]
+    service.get_many_by_uid.assert_called_once_with(
+        ETID, ["a", "b", "missing-1"], fromSummary=False
+    )
+    loader.close()
+
+
+def test_max_batch_triggers_query(service):
+    """Test that a full batch is queried without waiting for the delay"""
+    loader = UIDLoader(service, ETID, max_batch=2, max_delay_ms=10_000)
+
+    futures = [loader.load(uid) for uid in ("a", "b", "c")]
+    assert futures[1].result(timeout=1) == {"UID": "b"}
+    assert loader.pending == 1
+    loader.close()
+
+    assert futures[2].result(timeout=1) == {"UID": "c"}
+    assert service.get_many_by_uid.call_count == 2
+
+
+def test_failures_reach_every_caller(service):
+    """Test that a failed query fails each caller's future"""
+    with UIDLoader(service, ETID, max_delay_ms=1) as loader:
+        service.get_many_by_uid.side_effect = None
+        service.get_many_by_uid.return_value = None
+        with pytest.raises(RecordLookupError):
+            loader.get("a", timeout=1)
+
+        service.get_many_by_uid.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError, match="boom"):
+            loader.get("b", timeout=1)
+
+    with pytest.raises(RuntimeError, match="closed"):
+        loader.load("c")
+
+
+def test_service_shares_one_loader_per_etid():
+    """Test that DataRequestsService caches loaders and closes them together"""
+    service = DataRequestsService(MagicMock())
+    service.get_many_by_uid = MagicMock(side_effect=lookup)
+
+    loader = service.uid_loader(ETID, max_delay_ms=10_000)
+    assert service.uid_loader(ETID) is loader
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda n=n: results.append(loader.load(f"uid-{n}")))
+        for n in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    service.close_uid_loaders()
+
+    assert sorted(f.result(timeout=1)["UID"] for f in results) == sorted(
+        f"uid-{n}" for n in range(20)
+    )
+    assert service.get_many_by_uid.call_count == 1
+    assert service.uid_loader(ETID) is not loader
+    service.close_uid_loaders()
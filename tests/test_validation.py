@@ -0,0 +1,170 @@
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.validation import RowValidator, to_epoch
+from walacor_sdk.schema.models.models import SchemaDetail
+from walacor_sdk.utils.exceptions import RecordValidationError
+
+ETID = 90000000
+
+
+def schema_detail():
+    return SchemaDetail(
+        _id="s",
+        ETId=ETID,
+        TableName="books",
+        Family="lib",
+        DoSummary=False,
+        Indexes=[],
+        DbTableName="t",
+        DbHistoryTableName="h",
+        SV=1,
+        LastModifiedBy="u",
+        UID="uid",
+        ORGId="o",
+        SL="sl",
+        HashSign="hs",
+        HS="hs",
+        EId="e",
+        UpdatedAt=0,
+        IsDeleted=False,
+        CreatedAt=0,
+        Fields=[
+            {"FieldName": "pages", "DataType": "INTEGER", "Required": True},
+            {"FieldName": "price", "DataType": "DECIMAL", "Decimals": 2},
+            {"FieldName": "title", "DataType": "TEXT", "MaxLength": 8},
+            {"FieldName": "active", "DataType": "BOOLEAN"},
+            {"FieldName": "published", "DataType": "DATETIME(EPOCH)"},
+            {"FieldName": "tags", "DataType": "ARRAY"},
+            {
+                "FieldName": "UID",
+                "DataType": "TEXT",
+                "Required": True,
+                "SystemGenerated": True,
+            },
+        ],
+    )
+
+
+@pytest.fixture
+def validator():
+    return RowValidator(schema_detail())
+
+
+def test_rows_are_coerced(validator):
+    """Test that values are coerced to the stored types"""
+    rows = validator.validate(
+        [
+            {
+                "pages": "120",
+                "price": "9.999",
+                "title": "Dune",
+                "active": "true",
+                "published": datetime(2024, 1, 1),
+                "tags": ("scifi",),
+                "extra": 1,
+            }
+        ]
+    )
+
+    assert rows == [
+        {
+            "pages": 120,
+            "price": 10.0,
+            "title": "Dune",
+            "active": True,
+            "published": 1704067200000,
+            "tags": ["scifi"],
+            "extra": 1,
+        }
+    ]
+
+
+def test_every_bad_field_is_reported(validator):
+    """Test that a batch is rejected with one RowError per bad field"""
+    with pytest.raises(RecordValidationError) as err:
+        validator.validate(
+            [
+                {"pages": 1},
+                {"pages": 1.5, "title": "far too long"},
+                {"price": "n/a"},
+                "not a row",
+            ]
+        )
+
+    assert [(e.Row, e.Field) for e in err.value.errors] == [
+        (1, "pages"),
+        (1, "title"),
+        (2, "pages"),
+        (2, "price"),
+        (3, None),
+    ]
+    assert err.value.errors[2].Error == "required"
+
+
+def test_epoch_conversion():
+    """Test DATETIME(EPOCH) conversion of dates, offsets and ISO strings"""
+    assert to_epoch(date(1970, 1, 2)) == 86_400_000
+    assert to_epoch(datetime(1970, 1, 1, 1, tzinfo=UTC)) == 3_600_000
+    assert to_epoch("1970-01-01T00:00:01+00:00") == 1000
+    assert to_epoch(5) == 5
+    with pytest.raises(ValueError):
+        to_epoch("yesterday")
+
+
+def test_dataframe_is_validated_by_column(validator):
+    """Test vectorized validation of a DataFrame"""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(
+        {
+            "pages": [10, 20],
+            "price": [1.234, None],
+            "title": ["a", "b"],
+            "published": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        }
+    )
+
+    rows = validator.validate_frame(frame)
+
+    assert rows[0] == {
+        "pages": 10,
+        "price": 1.23,
+        "title": "a",
+        "published": 1704067200000,
+    }
+    assert rows[1]["price"] is None
+    assert type(rows[1]["pages"]) is int
+
+    frame.loc[1, "pages"] = None
+    frame["title"] = ["ok", "much too long"]
+    with pytest.raises(RecordValidationError) as err:
+        validator.validate_frame(frame)
+    assert [(e.Row, e.Field) for e in err.value.errors] == [
+        (1, "pages"),
+        (1, "title"),
+    ]
+
+
+def test_service_caches_validators_and_rejects_before_submit():
+    """Test that the validator is compiled once and bad rows never reach the API"""
+    service = DataRequestsService(MagicMock())
+    service._post = MagicMock()
+
+    with patch(
+        "walacor_sdk.data_requests.data_requests_service.SchemaService"
+    ) as schema_service:
+        schema_service.return_value.get_schema_details_with_ETId.return_value = (
+            schema_detail()
+        )
+        with pytest.raises(RecordValidationError):
+            service.insert_multiple_records([{"title": "x"}], ETID, validate=True)
+        with pytest.raises(RecordValidationError):
+            service.insert_records_chunked([{"pages": "x"}], ETID, validate=True)
+
+        assert service.validator(ETID) is service.validator(ETID)
+        assert schema_service.call_count == 1
+
+    service._post.assert_not_called()
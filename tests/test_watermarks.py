@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from walacor_sdk.data_requests.data_requests_service import DataRequestsService
+from walacor_sdk.data_requests.keyset import Keyset
+from walacor_sdk.data_requests.watermarks import (
+    WatermarkStore,
+    committing,
+    watermark_key,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return WatermarkStore(tmp_path / "state" / "watermarks.json")
+
+
+def test_store_round_trip(store):
+    """Test that cursors persist across store instances and can be reset"""
+    key = watermark_key("https://api.example/", 7, "UpdatedAt")
+    assert key == "https://api.example#7#UpdatedAt"
+    assert store.get(key) is None
+
+    store.set(key, (10, "u1"))
+    assert WatermarkStore(store.path).get(key) == (10, "u1")
+
+    store.reset(key)
+    assert store.get(key) is None
+
+
+def test_default_store_stays_in_memory(tmp_path, monkeypatch):
+    """Test that without a path or state dir nothing is written to disk"""
+    monkeypatch.delenv("WALACOR_SDK_STATE_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    store = WatermarkStore()
+
+    store.set("k", (1, "a"))
+
+    assert store.path is None
+    assert store.get("k") == (1, "a")
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setenv("WALACOR_SDK_STATE_DIR", str(tmp_path / "etl"))
+    assert WatermarkStore().path == tmp_path / "etl" / "watermarks.json"
+
+
+def test_concurrent_stores_keep_every_watermark(store):
+    """Test that stores sharing a file (as processes would) lose no updates"""
+
+    def sync(worker):
+        own = WatermarkStore(store.path)  # separate instance, separate thread lock
+        for n in range(20):
+            own.set(f"w{worker}#{n}", (n, "u"))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(sync, range(8)))
+
+    fresh = WatermarkStore(store.path)
+    assert all(fresh.get(f"w{w}#{n}") == (n, "u") for w in range(8) for n in range(20))
+
+
+def test_unreadable_file_is_ignored(store):
+    """Test that a corrupt state file reads as empty"""
+    store.path.parent.mkdir(parents=True)
+    store.path.write_text("{not json")
+
+    assert store.get("k") is None
+
+
+def test_committing_only_counts_finished_rows():
+    """Test that the row being handled when iteration stops is not committed"""
+    commits = []
+    rows = [{"UID": f"u{n}", "UpdatedAt": n} for n in range(5)]
+    it = committing(iter(rows), Keyset(), commits.append, every=2)
+
+    assert next(it)["UID"] == "u0"
+    assert next(it)["UID"] == "u1"
+    assert next(it)["UID"] == "u2"
+    assert commits == [(1, "u1")]
+    it.close()  # consumer gave up while handling u2
+
+    assert commits == [(1, "u1")]
+
+
+@pytest.fixture
+def service(store):
+    client = MagicMock()
+    client.base_url = "https://api.example"
+    service = DataRequestsService(client)
+    service.watermarks = store
+    return service
+
+
+def test_sync_changes_resumes_from_watermark(service, store):
+    """Test that a second run only asks for rows above the stored watermark"""
+    service._post = MagicMock(
+        return_value={
+            "success": True,
+            "data": [{"UID": "a", "UpdatedAt": 5}, {"UID": "b", "UpdatedAt": 5}],
+        }
+    )
+
+    assert [r["UID"] for r in service.sync_changes(7)] == ["a", "b"]
+    assert store.get("https://api.example#7#UpdatedAt") == (5, "b")
+
+    service._post = MagicMock(return_value={"success": True, "data": []})
+    assert list(service.sync_changes(7)) == []
+    pipeline = service._post.call_args.kwargs["json"]
+    assert pipeline[0] == {
+        "$match": {
+            "$or": [{"UpdatedAt": {"$gt": 5}}, {"UpdatedAt": 5, "UID": {"$gt": "b"}}]
+        }
+    }
+
+
+def test_sync_changes_since_overrides_watermark(service, store):
+    """Test that an explicit since starts above that value"""
+    store.set("https://api.example#7#CreatedAt", (99, "z"))
+    service._post = MagicMock(return_value={"success": True, "data": []})
+
+    list(service.sync_changes(7, since="1970-01-01T00:00:01", field="CreatedAt"))
+
+    pipeline = service._post.call_args.kwargs["json"]
+    assert pipeline[0] == {"$match": {"CreatedAt": {"$gt": 1000}}}
+    assert pipeline[1] == {"$sort": {"CreatedAt": 1, "UID": 1}}
+
+    match = {"CreatedAt": {"$lt": 5000}}
+    list(service.sync_changes(7, since=1000, field="CreatedAt", match=match))
+
+    pipeline = service._post.call_args.kwargs["json"]
+    assert pipeline[0] == {
+        "$match": {"$and": [{"CreatedAt": {"$lt": 5000}}, {"CreatedAt": {"$gt": 1000}}]}
+    }